@@ -4,15 +4,25 @@ Export functionality for BIDS dataset subsets.
 This module handles exporting filtered BIDS datasets to new locations.
 """
 
+import errno
 import json
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Iterator, Optional
 
 from .models import BIDSDataset, BIDSSubject, BIDSSession, BIDSFile
 
 
+# os.copy_file_range is only available on Linux
+HAS_COPY_FILE_RANGE = hasattr(os, 'copy_file_range')
+
+# Errors meaning copy_file_range cannot be used between these files
+_COPY_FILE_RANGE_UNSUPPORTED = {errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP}
+
+
 @dataclass
 class SelectedEntities:
     """
@@ -72,6 +82,62 @@ class ExportStats:
             return f"{self.total_size / (1024 ** 3):.2f} GB"
 
 
+@dataclass(frozen=True)
+class _EntityMatcher:
+    """
+    Selected entities converted to sets, built once per file list.
+    
+    Matching a file then costs one set lookup per entity it has.
+    """
+    
+    subjects: frozenset[str]
+    """Selected subject IDs (empty means all subjects)."""
+    
+    subject_order: tuple[str, ...]
+    """Selected subject IDs without duplicates, in selection order."""
+    
+    sessions: frozenset[str]
+    """Selected session IDs (empty means all sessions)."""
+    
+    values: dict[str, frozenset[str]]
+    """Selected values of every other entity the user has interacted with."""
+    
+    @classmethod
+    def from_selection(cls, selected_entities: SelectedEntities) -> '_EntityMatcher':
+        """Build a matcher from the selected entities."""
+        entities = selected_entities.entities
+        return cls(
+            subjects=frozenset(entities.get('sub', ())),
+            subject_order=tuple(dict.fromkeys(entities.get('sub', ()))),
+            sessions=frozenset(entities.get('ses', ())),
+            values={
+                key: frozenset(values)
+                for key, values in entities.items()
+                if key not in ('sub', 'ses')
+            }
+        )
+    
+    def matches(self, file: BIDSFile, subject_id: str, session_id: Optional[str]) -> bool:
+        """Check if a file matches; see _file_matches_entities."""
+        # Check subject (always required)
+        if self.subjects and subject_id not in self.subjects:
+            return False
+        
+        # Check session if file has one
+        if session_id and self.sessions and session_id not in self.sessions:
+            return False
+        
+        # Check all other entities in the file; an empty selected set
+        # excludes every file that has the entity
+        values = self.values
+        for entity_key, entity_value in file.entities.items():
+            selected_values = values.get(entity_key)
+            if selected_values is not None and entity_value not in selected_values:
+                return False
+        
+        return True
+
+
 def export_dataset(
     request: ExportRequest,
     progress_callback: Optional[Callable[[int, int, Path], None]] = None
@@ -160,26 +226,17 @@ def generate_file_list(
     """
     matching_files = []
     
-    # Extract selected subject IDs
     # If 'sub' key is present with empty list, no subjects are selected
-    if 'sub' in selected_entities.entities:
-        selected_subjects = selected_entities.entities['sub']
-        if not selected_subjects:
-            # Empty selection - no subjects to export
-            return []
-    else:
-        # No subject filter - export all subjects
-        selected_subjects = []
+    if 'sub' in selected_entities.entities and not selected_entities.entities['sub']:
+        return []
+    
+    matcher = _EntityMatcher.from_selection(selected_entities)
     
     # Traverse subjects
-    for subject in dataset.subjects:
-        # Skip subject if not selected
-        if selected_subjects and subject.subject_id not in selected_subjects:
-            continue
-        
+    for subject in _iter_selected_subjects(dataset, matcher):
         # Process subject-level files
         for file in subject.files:
-            if _file_matches_entities(file, subject.subject_id, None, selected_entities):
+            if matcher.matches(file, subject.subject_id, None):
                 matching_files.append(file.path)
                 # Include JSON sidecar if exists
                 sidecar_path = _get_sidecar_path(file.path)
@@ -189,12 +246,11 @@ def generate_file_list(
         # Process session-level files
         for session in subject.sessions:
             # Check if session is selected
-            selected_sessions = selected_entities.entities.get('ses', [])
-            if selected_sessions and session.session_id and session.session_id not in selected_sessions:
+            if matcher.sessions and session.session_id and session.session_id not in matcher.sessions:
                 continue
             
             for file in session.files:
-                if _file_matches_entities(file, subject.subject_id, session.session_id, selected_entities):
+                if matcher.matches(file, subject.subject_id, session.session_id):
                     matching_files.append(file.path)
                     # Include JSON sidecar if exists
                     sidecar_path = _get_sidecar_path(file.path)
@@ -206,8 +262,8 @@ def generate_file_list(
         derivative_files = _get_derivative_files(dataset, selected_entities)
         matching_files.extend(derivative_files)
     
-    # Remove duplicates and return
-    return list(set(matching_files))
+    # Remove duplicates, keeping the traversal order, and return
+    return list(dict.fromkeys(matching_files))
 
 
 def copy_file_tree(
@@ -219,6 +275,9 @@ def copy_file_tree(
     """
     Copy a list of files from source to destination, preserving structure.
     
+    Files are copied concurrently; progress_callback is still called from
+    the calling thread, in list order.
+    
     Args:
         file_list: List of files to copy (absolute paths).
         source_root: Root of the source dataset.
@@ -230,31 +289,105 @@ def copy_file_tree(
     """
     total_files = len(file_list)
     
+    # Pair files with their destination, skipping files not under source_root
+    copies: list[tuple[int, Path, Path]] = []
     for i, source_file in enumerate(file_list, start=1):
-        # Calculate relative path
         try:
             rel_path = source_file.relative_to(source_root)
         except ValueError:
-            # File is not under source_root, skip it
             continue
-        
-        # Create destination path
-        dest_file = dest_root / rel_path
-        
-        # Create parent directories if needed
-        dest_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Copy file
+        copies.append((i, source_file, dest_root / rel_path))
+    
+    # Create each destination directory once, before any copy starts
+    for parent in {dest_file.parent for _, _, dest_file in copies}:
+        parent.mkdir(parents=True, exist_ok=True)
+    
+    # Turned off for the rest of the tree once the destination rejects it
+    use_copy_file_range = HAS_COPY_FILE_RANGE
+    
+    def copy_one(source_file: Path, dest_file: Path) -> bool:
+        nonlocal use_copy_file_range
         try:
-            shutil.copy2(source_file, dest_file)
+            if not _copy_file(source_file, dest_file, use_copy_file_range):
+                use_copy_file_range = False
         except IOError as e:
             # Log error but continue with other files
             print(f"Error copying {source_file}: {e}")
-            continue
+            return False
+        return True
+    
+    # Copies are I/O bound, so several run at once to overlap their system
+    # calls; map() keeps results in list order and progress is reported
+    # from this thread as each file completes
+    with ThreadPoolExecutor(thread_name_prefix='bids-export') as executor:
+        results = executor.map(lambda copy: copy_one(copy[1], copy[2]), copies)
         
-        # Call progress callback
-        if progress_callback:
-            progress_callback(i, total_files, source_file)
+        for (i, source_file, _), copied in zip(copies, results):
+            if copied and progress_callback:
+                progress_callback(i, total_files, source_file)
+
+
+def _copy_file(source_file: Path, dest_file: Path, use_copy_file_range: bool) -> bool:
+    """
+    Copy a file and its metadata, like shutil.copy2.
+    
+    Contents are copied with os.copy_file_range when possible, which stays
+    in the kernel and, on copy-on-write filesystems (btrfs, XFS), shares
+    the data blocks instead of copying them. Otherwise shutil.copyfile is
+    used.
+    
+    Args:
+        source_file: File to copy.
+        dest_file: Destination file path (overwritten if it exists).
+        use_copy_file_range: Whether to try os.copy_file_range first.
+    
+    Returns:
+        Whether os.copy_file_range can still be used for the next files.
+    
+    Raises:
+        IOError: If the copy fails.
+    """
+    if use_copy_file_range:
+        use_copy_file_range = _copy_file_range(source_file, dest_file)
+    
+    if not use_copy_file_range:
+        shutil.copyfile(source_file, dest_file)
+    
+    shutil.copystat(source_file, dest_file)
+    return use_copy_file_range
+
+
+def _copy_file_range(source_file: Path, dest_file: Path) -> bool:
+    """
+    Copy file contents with os.copy_file_range.
+    
+    Args:
+        source_file: File to copy.
+        dest_file: Destination file path (overwritten if it exists).
+    
+    Returns:
+        False if the filesystems do not support copy_file_range (nothing
+        was copied), True once the contents are copied.
+    
+    Raises:
+        IOError: If the copy fails for another reason.
+    """
+    with open(source_file, 'rb') as src, open(dest_file, 'wb') as dst:
+        remaining = os.fstat(src.fileno()).st_size
+        copied_any = False
+        while remaining > 0:
+            try:
+                copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+            except OSError as e:
+                if not copied_any and e.errno in _COPY_FILE_RANGE_UNSUPPORTED:
+                    return False
+                raise
+            if copied == 0:
+                # Source shrank while copying
+                break
+            copied_any = True
+            remaining -= copied
+    return True
 
 
 def create_participants_tsv(
@@ -332,6 +465,32 @@ def calculate_export_stats(
     return stats
 
 
+def _iter_selected_subjects(dataset: BIDSDataset, matcher: _EntityMatcher) -> Iterator[BIDSSubject]:
+    """
+    Iterate over the dataset subjects selected by a matcher.
+    
+    Selected subjects are looked up in the dataset's subject ID index, so
+    exporting a few subjects does not visit every subject of the dataset.
+    They are yielded in selection order, so the export order does not
+    depend on set hashing.
+    
+    Args:
+        dataset: The source dataset.
+        matcher: The entity matcher of the export selection.
+    
+    Yields:
+        Selected subjects present in the dataset.
+    """
+    if not matcher.subjects:
+        yield from dataset.subjects
+        return
+    
+    for subject_id in matcher.subject_order:
+        subject = dataset.get_subject(subject_id)
+        if subject is not None:
+            yield subject
+
+
 def _file_matches_entities(
     file: BIDSFile,
     subject_id: str,
@@ -342,6 +501,7 @@ def _file_matches_entities(
     Check if a file matches the selected entities.
     
     A file matches if ALL entities it possesses are in the selected lists.
+    Code checking many files builds one _EntityMatcher and reuses it.
     
     Args:
         file: The file to check.
@@ -352,31 +512,7 @@ def _file_matches_entities(
     Returns:
         True if the file matches, False otherwise.
     """
-    # Check subject (always required)
-    selected_subjects = selected_entities.entities.get('sub', [])
-    if selected_subjects and subject_id not in selected_subjects:
-        return False
-    
-    # Check session if file has one
-    if session_id:
-        selected_sessions = selected_entities.entities.get('ses', [])
-        if selected_sessions and session_id not in selected_sessions:
-            return False
-    
-    # Check all other entities in the file
-    for entity_key, entity_value in file.entities.items():
-        # Skip 'sub' and 'ses' as we already checked them
-        if entity_key in ('sub', 'ses'):
-            continue
-        
-        # If this entity is in the selection criteria (user has interacted with it)
-        if entity_key in selected_entities.entities:
-            selected_values = selected_entities.entities[entity_key]
-            # If the list is empty or file's value is not in the list, exclude the file
-            if not selected_values or entity_value not in selected_values:
-                return False
-    
-    return True
+    return _EntityMatcher.from_selection(selected_entities).matches(file, subject_id, session_id)
 
 
 def _get_sidecar_path(file_path: Path) -> Optional[Path]:
@@ -423,24 +559,20 @@ def _get_derivative_files(
     """
     derivative_files = []
     
-    # Get selected subjects (if any)
-    selected_subjects = selected_entities.entities.get('sub', [])
+    matcher = _EntityMatcher.from_selection(selected_entities)
+    selected_pipelines = frozenset(selected_entities.derivative_pipelines)
     
     # Iterate through subjects
-    for subject in dataset.subjects:
-        # Skip subject if not selected
-        if selected_subjects and subject.subject_id not in selected_subjects:
-            continue
-        
+    for subject in _iter_selected_subjects(dataset, matcher):
         # Iterate through subject's derivatives
         for derivative in subject.derivatives:
             # Skip pipeline if not selected
-            if derivative.pipeline_name not in selected_entities.derivative_pipelines:
+            if derivative.pipeline_name not in selected_pipelines:
                 continue
             
             # Process derivative-level files (no session)
             for file in derivative.files:
-                if _file_matches_entities(file, subject.subject_id, None, selected_entities):
+                if matcher.matches(file, subject.subject_id, None):
                     derivative_files.append(file.path)
                     # Include JSON sidecar if exists
                     sidecar_path = _get_sidecar_path(file.path)
@@ -450,12 +582,11 @@ def _get_derivative_files(
             # Process derivative session files
             for session in derivative.sessions:
                 # Check if session is selected
-                selected_sessions = selected_entities.entities.get('ses', [])
-                if selected_sessions and session.session_id and session.session_id not in selected_sessions:
+                if matcher.sessions and session.session_id and session.session_id not in matcher.sessions:
                     continue
                 
                 for file in session.files:
-                    if _file_matches_entities(file, subject.subject_id, session.session_id, selected_entities):
+                    if matcher.matches(file, subject.subject_id, session.session_id):
                         derivative_files.append(file.path)
                         # Include JSON sidecar if exists
                         sidecar_path = _get_sidecar_path(file.path)
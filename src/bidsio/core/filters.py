@@ -5,12 +5,14 @@ This module contains filter condition classes and functions for filtering
 BIDSDataset objects based on various criteria.
 """
 
+import copy
 from dataclasses import dataclass, field
+from typing import Callable
 
 from .models import BIDSSubject, BIDSDataset
 
 
-@dataclass
+@dataclass(slots=True)
 class FilterCondition:
     """
     Base class for all filter conditions.
@@ -19,6 +21,9 @@ class FilterCondition:
     whether a subject matches the condition.
     """
     
+    _display_cache: tuple[str, str] | None = field(default=None, init=False, repr=False, compare=False)
+    """Memoized (text, icon path) shown by the filter builder; reset to None when edited."""
+    
     def evaluate(self, subject: 'BIDSSubject') -> bool:
         """
         Evaluate whether a subject matches this condition.
@@ -40,6 +45,15 @@ class FilterCondition:
         """
         raise NotImplementedError("Subclasses must implement to_dict()")
     
+    def __deepcopy__(self, memo: dict) -> 'FilterCondition':
+        """
+        Deep copy the condition.
+        
+        All fields hold immutable scalars (str/int/float), so a shallow copy
+        is already independent and the deepcopy memo bookkeeping is skipped.
+        """
+        return copy.copy(self)
+    
     @classmethod
     def from_dict(cls, data: dict) -> 'FilterCondition':
         """
@@ -54,7 +68,7 @@ class FilterCondition:
         raise NotImplementedError("Subclasses must implement from_dict()")
 
 
-@dataclass
+@dataclass(slots=True)
 class SubjectIdFilter(FilterCondition):
     """Filter by subject ID."""
     
@@ -83,7 +97,7 @@ class SubjectIdFilter(FilterCondition):
         return cls(subject_id=data.get('subject_id', ''))
 
 
-@dataclass
+@dataclass(slots=True)
 class ModalityFilter(FilterCondition):
     """Filter by imaging modality."""
     
@@ -95,18 +109,9 @@ class ModalityFilter(FilterCondition):
         if not self.modality:
             return True
         
-        # Check all files in subject
-        for file in subject.files:
-            if file.modality == self.modality:
-                return True
-        
-        # Check all files in sessions
-        for session in subject.sessions:
-            for file in session.files:
-                if file.modality == self.modality:
-                    return True
-        
-        return False
+        # The subject memoizes its modalities, so repeated evaluations
+        # (several filters, re-applied filters) do not rescan its files
+        return self.modality in subject.get_modalities()
     
     def to_dict(self) -> dict:
         return {
@@ -124,7 +129,7 @@ class ModalityFilter(FilterCondition):
         return cls(modality=data.get('modality', ''))
 
 
-@dataclass
+@dataclass(slots=True)
 class ParticipantAttributeFilter(FilterCondition):
     """Filter by participant metadata from participants.tsv."""
     
@@ -203,7 +208,7 @@ class ParticipantAttributeFilter(FilterCondition):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class EntityFilter(FilterCondition):
     """Filter by BIDS entity value."""
     
@@ -221,43 +226,51 @@ class EntityFilter(FilterCondition):
         if not self.entity_code or self.value == '':
             return True
         
+        matches = self._value_matcher()
+        if matches is None:
+            return False
+        
         # Special handling for 'ses' entity
         if self.entity_code == 'ses':
-            for session in subject.sessions:
-                if session.session_id and self._compare_values(session.session_id, self.value):
-                    return True
-            return False
+            return any(
+                session.session_id and matches(session.session_id)
+                for session in subject.sessions
+            )
         
         # Check all files in subject
         for file in subject.files:
-            if self.entity_code in file.entities:
-                entity_value = file.entities[self.entity_code]
-                if self._compare_values(entity_value, self.value):
-                    return True
+            entity_value = file.entities.get(self.entity_code)
+            if entity_value is not None and matches(entity_value):
+                return True
         
-        # Check all files in sessions
+        # Check all files in sessions (only those carrying the entity)
         for session in subject.sessions:
-            for file in session.files:
-                if self.entity_code in file.entities:
-                    entity_value = file.entities[self.entity_code]
-                    if self._compare_values(entity_value, self.value):
-                        return True
+            for file in session.get_files_with_entity(self.entity_code):
+                if matches(file.entities[self.entity_code]):
+                    return True
         
         return False
     
-    def _compare_values(self, entity_value: str, compare_value: str) -> bool:
-        """Compare entity value with filter value using the operator."""
-        entity_value = str(entity_value)
-        compare_value = str(compare_value)
+    def _value_matcher(self) -> Callable[[str], bool] | None:
+        """
+        Build the comparison of an entity value against the filter value.
+        
+        The operator is resolved once per evaluation instead of once per
+        file.
+        
+        Returns:
+            A predicate taking an entity value, or None for an unknown operator.
+        """
+        compare_value = str(self.value)
         
         if self.operator == 'equals':
-            return entity_value == compare_value
+            return lambda entity_value: entity_value == compare_value
         elif self.operator == 'not_equals':
-            return entity_value != compare_value
+            return lambda entity_value: entity_value != compare_value
         elif self.operator == 'contains':
-            return compare_value in entity_value
+            return lambda entity_value: compare_value in entity_value
         else:
-            return False
+            return None
     
     def to_dict(self) -> dict:
         return {
@@ -276,7 +289,7 @@ class EntityFilter(FilterCondition):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ChannelAttributeFilter(FilterCondition):
     """Filter by iEEG channel attributes (_channels.tsv)."""
     
@@ -367,7 +380,7 @@ class ChannelAttributeFilter(FilterCondition):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ElectrodeAttributeFilter(FilterCondition):
     """Filter by iEEG electrode attributes (_electrodes.tsv)."""
     
@@ -458,7 +471,7 @@ class ElectrodeAttributeFilter(FilterCondition):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class LogicalOperation:
     """
     Logical combination of filter conditions.
@@ -489,6 +502,13 @@ class LogicalOperation:
         else:
             return False
     
+    def __deepcopy__(self, memo: dict) -> 'LogicalOperation':
+        """Deep copy the operation and its child conditions."""
+        return LogicalOperation(
+            operator=self.operator,
+            conditions=[copy.deepcopy(cond, memo) for cond in self.conditions]
+        )
+    
     def to_dict(self) -> dict:
         return {
             'type': 'logical_operation',
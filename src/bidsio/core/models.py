@@ -5,14 +5,50 @@ This module contains pure data models representing BIDS entities.
 These models are GUI-agnostic and should not import any UI frameworks.
 """
 
+import json
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
 from typing import Optional
 from pathlib import Path
 
 from .entity_config import BIDS_ENTITIES
+from ..infrastructure.json_loader import load_json_file
 
 
-@dataclass
+# Lists (and their lengths) a memoized value was computed from
+_MemoSource = tuple[tuple[list, int], ...]
+
+
+def _memo_source(*lists: list) -> _MemoSource:
+    """Record the lists a memoized value is computed from."""
+    return tuple((items, len(items)) for items in lists)
+
+
+def _source_matches(source: Optional[_MemoSource], *lists: list) -> bool:
+    """
+    Check whether a memoized value is still valid for the lists it uses.
+    
+    Model memos are keyed on the identity and length of their source lists,
+    so they assume those lists are only appended to, shortened, or
+    reassigned. Replacing an element, or modifying one in place, is not
+    detected; the owner of the memo must then be invalidated explicitly
+    (e.g. with BIDSDataset.invalidate_caches).
+    
+    Args:
+        source: Value recorded with _memo_source, or None if nothing is memoized.
+        lists: The current source lists, in the same order.
+    
+    Returns:
+        True if the memoized value can be reused.
+    """
+    return (
+        source is not None
+        and len(source) == len(lists)
+        and all(cached is items and length == len(items) for (cached, length), items in zip(source, lists))
+    )
+
+
+@dataclass(slots=True)
 class BIDSFile:
     """Represents a single file in a BIDS dataset."""
     
@@ -66,20 +102,17 @@ class BIDSFile:
         # Remove extensions like .nii.gz, .tsv, etc. and add .json
         json_path = self.path.parent / (self.path.name.replace(self.extension or '', '') + '.json')
         
-        if not json_path.exists():
-            return None
-        
         try:
-            import json
-            with open(json_path, 'r', encoding='utf-8') as f:
-                self.metadata = json.load(f)
-                return self.metadata
+            # A missing sidecar raises FileNotFoundError (an IOError), so no
+            # separate existence check is needed; each parse returns a fresh dict
+            self.metadata = load_json_file(json_path)
+            return self.metadata
         except (json.JSONDecodeError, IOError) as e:
             # Log error but don't fail - metadata is optional
             return None
 
 
-@dataclass
+@dataclass(slots=True)
 class BIDSSession:
     """Represents a single session within a BIDS subject."""
     
@@ -88,9 +121,39 @@ class BIDSSession:
     
     files: list[BIDSFile] = field(default_factory=list)
     """All files in this session (run info is in file entities)."""
+    
+    _files_by_entity: Optional[dict[str, list[BIDSFile]]] = field(default=None, init=False, repr=False, compare=False)
+    """Memoized files per entity code."""
+    
+    _files_by_entity_source: Optional[_MemoSource] = field(default=None, init=False, repr=False, compare=False)
+    """Files list (and its length) the memoized index was built from."""
+    
+    def get_files_with_entity(self, entity: str) -> list[BIDSFile]:
+        """
+        Get the files of this session that have a given entity.
+        
+        Files are indexed by entity code on first use; the index is rebuilt
+        when the files list is replaced or changes length. Callers must not
+        modify the returned list.
+        
+        Args:
+            entity: The entity code (e.g., 'task', 'space', 'desc').
+            
+        Returns:
+            Files whose entities include that code, in session order.
+        """
+        if not _source_matches(self._files_by_entity_source, self.files):
+            index: dict[str, list[BIDSFile]] = {}
+            for file in self.files:
+                for key in file.entities:
+                    index.setdefault(key, []).append(file)
+            self._files_by_entity = index
+            self._files_by_entity_source = _memo_source(self.files)
+        
+        return self._files_by_entity.get(entity, [])
 
 
-@dataclass
+@dataclass(slots=True)
 class IEEGData:
     """
     Container for iEEG-specific TSV data (channels and electrodes).
@@ -132,7 +195,7 @@ class IEEGData:
         return attributes
 
 
-@dataclass
+@dataclass(slots=True)
 class BIDSDerivative:
     """Represents a derivative pipeline for a subject."""
     
@@ -149,7 +212,7 @@ class BIDSDerivative:
     """Contents of pipeline's dataset_description.json if present."""
 
 
-@dataclass
+@dataclass(slots=True)
 class BIDSSubject:
     """Represents a subject in a BIDS dataset."""
     
@@ -171,23 +234,84 @@ class BIDSSubject:
     ieeg_data: Optional[IEEGData] = None
     """iEEG-specific data (channels and electrodes TSV files) if subject has iEEG data."""
     
+    _derivatives_by_name: Optional[dict[str, BIDSDerivative]] = field(default=None, init=False, repr=False, compare=False)
+    """Memoized derivatives by pipeline name."""
+    
+    _derivatives_source: Optional[_MemoSource] = field(default=None, init=False, repr=False, compare=False)
+    """Derivatives list (and its length) the memoized index was built from."""
+    
+    _modalities_cache: Optional[frozenset[str]] = field(default=None, init=False, repr=False, compare=False)
+    """Memoized modalities of the subject's files."""
+    
+    _modalities_source: Optional[_MemoSource] = field(default=None, init=False, repr=False, compare=False)
+    """Files lists (and their lengths) the memoized modalities were computed from."""
+    
     def get_derivative(self, pipeline_name: str) -> Optional[BIDSDerivative]:
         """
         Retrieve a derivative pipeline by name.
         
+        Derivatives are indexed by pipeline name on first use; the index is
+        rebuilt when the derivatives list is replaced or changes length.
+        
         Args:
             pipeline_name: The pipeline name to search for.
             
         Returns:
             The BIDSDerivative if found, None otherwise.
         """
-        for derivative in self.derivatives:
-            if derivative.pipeline_name == pipeline_name:
-                return derivative
-        return None
+        if not _source_matches(self._derivatives_source, self.derivatives):
+            index: dict[str, BIDSDerivative] = {}
+            for derivative in self.derivatives:
+                # Keep the first pipeline of a given name, like a linear scan
+                index.setdefault(derivative.pipeline_name, derivative)
+            self._derivatives_by_name = index
+            self._derivatives_source = _memo_source(self.derivatives)
+        
+        return self._derivatives_by_name.get(pipeline_name)
+    
+    def get_modalities(self) -> frozenset[str]:
+        """
+        Get the modalities of the subject's files, including session files.
+        
+        Computed on first use; recomputed when the subject's or a session's
+        files list is replaced or changes length, or sessions are added or
+        removed.
+        
+        Returns:
+            Set of modality names (e.g., {'anat', 'ieeg'}).
+        """
+        file_lists = [self.files, *(session.files for session in self.sessions)]
+        
+        if not _source_matches(self._modalities_source, *file_lists):
+            self._modalities_cache = frozenset(
+                file.modality
+                for files in file_lists
+                for file in files
+                if file.modality
+            )
+            self._modalities_source = _memo_source(*file_lists)
+        
+        return self._modalities_cache
 
 
-@dataclass
+def _first_row_keys(tables: dict[Path, list[dict]]) -> Iterable[str]:
+    """
+    Get the column names of the first non-empty TSV table.
+    
+    Args:
+        tables: Mapping of TSV path to its rows (list of dicts).
+        
+    Returns:
+        Keys of the first row found, or an empty tuple.
+    """
+    # Only need the first row of one file to get attribute names
+    for rows in tables.values():
+        if rows:
+            return rows[0].keys()
+    return ()
+
+
+@dataclass(slots=True)
 class BIDSDataset:
     """Represents a complete BIDS dataset."""
     
@@ -202,21 +326,55 @@ class BIDSDataset:
     
     dataset_files: list[BIDSFile] = field(default_factory=list)
     """Dataset-level files (README, LICENSE, CHANGES, etc.)."""
+    
+    _attribute_names_cache: Optional[tuple[list[str], list[str], list[str]]] = field(default=None, init=False, repr=False, compare=False)
+    """Memoized (participant, channel, electrode) attribute names."""
+    
+    _entity_values_cache: Optional[dict[str, list[str]]] = field(default=None, init=False, repr=False, compare=False)
+    """Memoized sorted unique values per entity code."""
+    
+    _subject_index_cache: Optional[dict[str, int]] = field(default=None, init=False, repr=False, compare=False)
+    """Memoized position of each subject ID in the subjects list."""
+    
+    _cache_source: Optional[_MemoSource] = field(default=None, init=False, repr=False, compare=False)
+    """Subjects list (and its length) the memoized values were computed from."""
         
     def get_subject(self, subject_id: str) -> Optional[BIDSSubject]:
         """
         Retrieve a subject by ID.
         
+        Uses an ID index built on first use, rebuilt when the subjects list is
+        replaced or changes length.
+        
         Args:
             subject_id: The subject identifier to search for.
             
         Returns:
             The BIDSSubject if found, None otherwise.
         """
+        self._check_cache_source()
+        
+        if self._subject_index_cache is None:
+            index: dict[str, int] = {}
+            for i, subject in enumerate(self.subjects):
+                # Keep the first subject when IDs are duplicated
+                index.setdefault(subject.subject_id, i)
+            self._subject_index_cache = index
+        
+        i = self._subject_index_cache.get(subject_id)
+        return self.subjects[i] if i is not None else None
+    
+    def _iter_all_files(self) -> Iterator[BIDSFile]:
+        """
+        Iterate over all subject- and session-level files of all subjects.
+        
+        Yields:
+            Each BIDSFile, subject-level files first for every subject.
+        """
         for subject in self.subjects:
-            if subject.subject_id == subject_id:
-                return subject
-        return None
+            yield from subject.files
+            for session in subject.sessions:
+                yield from session.files
     
     def get_all_modalities(self) -> set[str]:
         """
@@ -225,22 +383,7 @@ class BIDSDataset:
         Returns:
             Set of modality strings (e.g., {'anat', 'func', 'dwi'}).
         """
-        modalities = set()
-        
-        # Traverse all subjects
-        for subject in self.subjects:
-            # Check subject-level files
-            for file in subject.files:
-                if file.modality:
-                    modalities.add(file.modality)
-            
-            # Check session-level files
-            for session in subject.sessions:
-                for file in session.files:
-                    if file.modality:
-                        modalities.add(file.modality)
-        
-        return modalities
+        return {file.modality for file in self._iter_all_files() if file.modality}
     
     def get_all_tasks(self) -> set[str]:
         """
@@ -249,63 +392,60 @@ class BIDSDataset:
         Returns:
             Set of task strings (e.g., {'rest', 'nback', 'faces'}).
         """
-        tasks = set()
-        
-        # Traverse all subjects
-        for subject in self.subjects:
-            # Check subject-level files
-            for file in subject.files:
-                if 'task' in file.entities:
-                    tasks.add(file.entities['task'])
-            
-            # Check session-level files
-            for session in subject.sessions:
-                for file in session.files:
-                    if 'task' in file.entities:
-                        tasks.add(file.entities['task'])
-        
-        return tasks
+        return {file.entities['task'] for file in self._iter_all_files() if 'task' in file.entities}
     
     def get_all_entity_values(self, entity: str) -> list[str]:
         """
         Get all unique values for a specific BIDS entity in the dataset.
         
+        Values of every entity are indexed together in a single pass over the
+        dataset, which is reused until the subjects list is replaced or
+        changes length.
+        
         Args:
             entity: The entity code (e.g., 'sub', 'ses', 'task', 'run').
             
         Returns:
             Sorted list of unique values for that entity.
         """
-        values = set()
+        return list(self._get_entity_values().get(entity, ()))
+    
+    def _get_entity_values(self) -> dict[str, list[str]]:
+        """
+        Get memoized sorted unique values for every entity in the dataset.
         
-        # Special handling for 'sub' entity - extract from subject IDs
-        if entity == 'sub':
-            for subject in self.subjects:
-                values.add(subject.subject_id)
-            return sorted(values)
+        'sub' and 'ses' values come from subject and session IDs; all other
+        entities come from the entities of subject- and session-level files.
         
-        # Special handling for 'ses' entity - extract from session IDs
-        if entity == 'ses':
+        Returns:
+            Dictionary mapping entity codes to sorted unique values.
+        """
+        self._check_cache_source()
+        
+        if self._entity_values_cache is None:
+            values: dict[str, set[str]] = {}
+            subject_ids = set()
+            session_ids = set()
+            
             for subject in self.subjects:
+                subject_ids.add(subject.subject_id)
+                
+                for file in subject.files:
+                    for key, value in file.entities.items():
+                        values.setdefault(key, set()).add(value)
+                
                 for session in subject.sessions:
                     if session.session_id:
-                        values.add(session.session_id)
-            return sorted(values)
-        
-        # For other entities, traverse all files and extract from file entities
-        for subject in self.subjects:
-            # Check subject-level files
-            for file in subject.files:
-                if entity in file.entities:
-                    values.add(file.entities[entity])
+                        session_ids.add(session.session_id)
+                    for file in session.files:
+                        for key, value in file.entities.items():
+                            values.setdefault(key, set()).add(value)
             
-            # Check session-level files
-            for session in subject.sessions:
-                for file in session.files:
-                    if entity in file.entities:
-                        values.add(file.entities[entity])
+            values['sub'] = subject_ids
+            values['ses'] = session_ids
+            self._entity_values_cache = {key: sorted(vals) for key, vals in values.items()}
         
-        return sorted(values)
+        return self._entity_values_cache
     
     def get_all_derivative_pipelines(self) -> list[str]:
         """
@@ -325,6 +465,89 @@ class BIDSDataset:
         
         return sorted(pipelines)
     
+    def get_all_participant_attributes(self) -> list[str]:
+        """
+        Get all participant attribute names (participants.tsv columns).
+        
+        The result is computed once and reused until the subjects list is
+        replaced or changes length; callers must not modify it.
+        
+        Returns:
+            Sorted list of attribute names.
+        """
+        return self._get_attribute_names()[0]
+    
+    def get_all_channel_attributes(self) -> list[str]:
+        """
+        Get all channel attribute names (_channels.tsv columns).
+        
+        Each subject contributes the columns of its first non-empty channels
+        file. Cached like get_all_participant_attributes().
+        
+        Returns:
+            Sorted list of attribute names.
+        """
+        return self._get_attribute_names()[1]
+    
+    def get_all_electrode_attributes(self) -> list[str]:
+        """
+        Get all electrode attribute names (_electrodes.tsv columns).
+        
+        Each subject contributes the columns of its first non-empty electrodes
+        file. Cached like get_all_participant_attributes().
+        
+        Returns:
+            Sorted list of attribute names.
+        """
+        return self._get_attribute_names()[2]
+    
+    def _get_attribute_names(self) -> tuple[list[str], list[str], list[str]]:
+        """
+        Get memoized participant, channel and electrode attribute names.
+        
+        All three are discovered together in a single pass over the subjects.
+        
+        Returns:
+            Tuple of sorted (participant, channel, electrode) attribute names.
+        """
+        self._check_cache_source()
+        
+        if self._attribute_names_cache is None:
+            participant_attributes = set()
+            channel_attributes = set()
+            electrode_attributes = set()
+            for subject in self.subjects:
+                participant_attributes.update(subject.metadata.keys())
+                if subject.ieeg_data:
+                    channel_attributes.update(_first_row_keys(subject.ieeg_data.channels))
+                    electrode_attributes.update(_first_row_keys(subject.ieeg_data.electrodes))
+            
+            self._attribute_names_cache = (
+                sorted(participant_attributes),
+                sorted(channel_attributes),
+                sorted(electrode_attributes),
+            )
+        
+        return self._attribute_names_cache
+    
+    def invalidate_caches(self):
+        """
+        Drop all memoized dataset-wide values.
+        
+        Changes to the subjects list itself are detected automatically, but
+        changes made to subjects in place (e.g. setting ieeg_data or
+        metadata) are not; code making such changes must call this method.
+        """
+        self._attribute_names_cache = None
+        self._entity_values_cache = None
+        self._subject_index_cache = None
+        self._cache_source = _memo_source(self.subjects)
+    
+    def _check_cache_source(self):
+        """Drop memoized values when the subjects list is replaced or grows/shrinks."""
+        if not _source_matches(self._cache_source, self.subjects):
+            self.invalidate_caches()
+    
     def get_all_entities(self) -> dict[str, list[str]]:
         """
         Get all entities present in the dataset with their values.
@@ -334,12 +557,13 @@ class BIDSDataset:
             Only includes entities that actually exist in the dataset.
         """
         entities_data = {}
+        entity_values = self._get_entity_values()
         
         # Check each known BIDS entity
         for entity_code in BIDS_ENTITIES.keys():
-            values = self.get_all_entity_values(entity_code)
+            values = entity_values.get(entity_code)
             if values:  # Only include if values exist
-                entities_data[entity_code] = values
+                entities_data[entity_code] = list(values)
         
         return entities_data
 
@@ -160,16 +160,21 @@ class BidsRepository:
         
         total_subjects = len(self._dataset.subjects)
         
-        for idx, subject in enumerate(self._dataset.subjects):
-            # Skip if iEEG data already loaded for this subject
-            if subject.ieeg_data is not None:
-                continue
-            
-            # Report progress
-            if progress_callback:
-                progress_callback(idx + 1, total_subjects, f"Loading iEEG data for subject: {subject.subject_id}")
-            
-            # Load iEEG data
-            subject_path = self.root_path / f"sub-{subject.subject_id}"
-            if subject_path.exists():
-                subject.ieeg_data = self._loader._load_ieeg_data(subject_path)
+        try:
+            for idx, subject in enumerate(self._dataset.subjects):
+                # Skip if iEEG data already loaded for this subject
+                if subject.ieeg_data is not None:
+                    continue
+                
+                # Report progress
+                if progress_callback:
+                    progress_callback(idx + 1, total_subjects, f"Loading iEEG data for subject: {subject.subject_id}")
+                
+                # Load iEEG data
+                subject_path = self.root_path / f"sub-{subject.subject_id}"
+                if subject_path.exists():
+                    subject.ieeg_data = self._loader._load_ieeg_data(subject_path)
+        finally:
+            # Subjects were changed in place, even if loading stopped partway,
+            # so attribute names cached from earlier data are stale
+            self._dataset.invalidate_caches()
@@ -7,7 +7,9 @@ and constructing in-memory representations.
 
 import csv
 import json
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -19,11 +21,58 @@ from ..core.models import (
     BIDSDerivative,
     IEEGData
 )
+from .json_loader import load_json_file
 from .logging_config import get_logger
 from .tsv_loader import load_tsv_file, find_ieeg_tsv_files
 
 logger = get_logger(__name__)
 
+# BIDS entities in a filename follow the pattern key-value
+_ENTITY_RE = re.compile(r'([a-z]+)-([a-zA-Z0-9]+)')
+
+# Standard BIDS modality directories, in scan order
+_MODALITY_DIRS = (
+    'anat',      # Anatomical MRI
+    'func',      # Functional MRI
+    'dwi',       # Diffusion MRI
+    'fmap',      # Field maps
+    'ieeg',      # Intracranial EEG
+    'eeg',       # Electroencephalography
+    'meg',       # Magnetoencephalography
+    'beh',       # Behavioral data
+    'pet',       # Positron Emission Tomography
+    'micr',      # Microscopy
+    'nirs',      # Near-Infrared Spectroscopy
+    'motion',    # Motion tracking
+    'perf',      # Perfusion imaging
+)
+
+
+def _list_subdirs(path: Path, prefix: str = '', sort: bool = True) -> list[os.DirEntry]:
+    """
+    List the subdirectories of path whose name starts with prefix.
+    
+    Uses a single os.scandir() pass; the directory check reuses the file type
+    reported by the directory listing instead of a stat() per entry.
+    
+    Args:
+        path: Directory to list.
+        prefix: Required name prefix (e.g. 'sub-' or 'ses-').
+        sort: If True, sort the entries by name; otherwise keep listing order.
+        
+    Returns:
+        Matching directory entries, or an empty list if path is not a directory.
+    """
+    try:
+        with os.scandir(path) as it:
+            entries = [e for e in it if e.name.startswith(prefix) and e.is_dir()]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+    
+    if sort:
+        entries.sort(key=lambda e: e.name)
+    return entries
+
 
 class BidsLoader:
     """
@@ -153,9 +202,8 @@ class BidsLoader:
             return False
         
         try:
-            with open(desc_path, 'r', encoding='utf-8') as f:
-                desc = json.load(f)
-                
+            desc = load_json_file(desc_path)
+            
             # Check required fields
             if "Name" not in desc:
                 logger.warning("dataset_description.json missing 'Name' field")
@@ -183,8 +231,7 @@ class BidsLoader:
             return {}
         
         try:
-            with open(desc_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return load_json_file(desc_path)
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse dataset_description.json: {e}")
             return {}
@@ -205,20 +252,18 @@ class BidsLoader:
         try:
             participants_metadata = {}
             
-            with open(participants_path, 'r', encoding='utf-8') as f:
+            with open(participants_path, 'r', newline='', encoding='utf-8') as f:
                 reader = csv.DictReader(f, delimiter='\t')
                 
                 for row in reader:
-                    # Extract participant_id (should be first column)
-                    participant_id = row.get('participant_id', '')
+                    # Extract participant_id (should be first column); each row
+                    # is a fresh dict, so the remaining columns are the metadata
+                    participant_id = row.pop('participant_id', '')
                     
                     if participant_id:
                         # Remove 'sub-' prefix if present for consistency
-                        subject_id = participant_id.replace('sub-', '')
-                        
-                        # Store all other columns as metadata
-                        metadata = {k: v for k, v in row.items() if k != 'participant_id'}
-                        participants_metadata[subject_id] = metadata
+                        subject_id = participant_id.removeprefix('sub-')
+                        participants_metadata[subject_id] = row
                         
             logger.debug(f"Loaded metadata for {len(participants_metadata)} participants")
             return participants_metadata
@@ -304,15 +349,7 @@ class BidsLoader:
         Returns:
             List of subject IDs (without 'sub-' prefix).
         """
-        subject_dirs = sorted(self.root_path.glob('sub-*'))
-        subject_ids = []
-        
-        for subject_dir in subject_dirs:
-            if subject_dir.is_dir():
-                subject_id = subject_dir.name.replace('sub-', '')
-                subject_ids.append(subject_id)
-        
-        return subject_ids
+        return [entry.name.replace('sub-', '') for entry in _list_subdirs(self.root_path, 'sub-')]
     
     def _scan_subjects(
         self, 
@@ -331,55 +368,82 @@ class BidsLoader:
         """
         subjects = []
         
-        # Find all directories matching pattern 'sub-*'
-        subject_dirs = sorted(self.root_path.glob('sub-*'))
-        total_subjects = len(subject_dirs)
-        
-        for idx, subject_dir in enumerate(subject_dirs):
-            if not subject_dir.is_dir():
-                continue
-            
-            # Extract subject ID from directory name
-            subject_id = subject_dir.name.replace('sub-', '')
-            
-            logger.debug(f"Scanning subject: {subject_id}")
-            
-            # Report progress
-            if self.progress_callback:
-                self.progress_callback(idx + 1, total_subjects, f"Loading subject: {subject_id}")
-            
-            # Get metadata for this subject
-            metadata = participant_metadata.get(subject_id, {})
-            
-            # Scan for sessions
-            sessions = self._scan_sessions(subject_dir, eager_load_metadata)
-            
-            # If no sessions, scan the subject directory directly for files
-            subject_files = []
-            if not sessions:
-                # Single-session dataset, scan subject directory directly
-                subject_files = self._scan_files(subject_dir, eager_load_metadata)
-            
-            # Scan derivatives for this subject (if derivatives folder exists)
-            derivatives = self._scan_subject_derivatives(subject_id, eager_load_metadata)
-            
-            # Load iEEG-specific data (channels and electrodes TSV files)
-            ieeg_data = self._load_ieeg_data(subject_dir)
-            
-            # Create subject object
-            subject = BIDSSubject(
-                subject_id=subject_id,
-                sessions=sessions,
-                files=subject_files,
-                derivatives=derivatives,
-                metadata=metadata,
-                ieeg_data=ieeg_data
+        # Find all directories matching pattern 'sub-*'; each subject is then
+        # crawled on its own, so the dataset root is listed only once
+        subject_entries = _list_subdirs(self.root_path, 'sub-')
+        total_subjects = len(subject_entries)
+        
+        if not subject_entries:
+            return subjects
+        
+        # Subjects are independent and their scan is I/O bound, so they are
+        # crawled concurrently; map() keeps results in directory order and
+        # progress is reported from this thread as each subject completes
+        with ThreadPoolExecutor(thread_name_prefix='bids-scan') as executor:
+            results = executor.map(
+                lambda entry: self._build_subject(Path(entry.path), participant_metadata, eager_load_metadata),
+                subject_entries
             )
             
-            subjects.append(subject)
+            for idx, subject in enumerate(results):
+                # Report progress
+                if self.progress_callback:
+                    self.progress_callback(idx + 1, total_subjects, f"Loaded subject: {subject.subject_id}")
+                
+                subjects.append(subject)
         
         return subjects
     
+    def _build_subject(
+        self,
+        subject_dir: Path,
+        participant_metadata: dict[str, dict[str, str]],
+        eager_load_metadata: bool = False
+    ) -> BIDSSubject:
+        """
+        Scan one subject directory and build its BIDSSubject.
+        
+        Args:
+            subject_dir: Path to the subject directory.
+            participant_metadata: Dictionary mapping subject IDs to their metadata.
+            eager_load_metadata: If True, load all JSON sidecar metadata during parsing.
+        
+        Returns:
+            The BIDSSubject with sessions, files, derivatives and iEEG data.
+        """
+        # Extract subject ID from directory name
+        subject_id = subject_dir.name.replace('sub-', '')
+        
+        logger.debug(f"Scanning subject: {subject_id}")
+        
+        # Get metadata for this subject
+        metadata = participant_metadata.get(subject_id, {})
+        
+        # Scan for sessions
+        sessions = self._scan_sessions(subject_dir, eager_load_metadata)
+        
+        # If no sessions, scan the subject directory directly for files
+        subject_files = []
+        if not sessions:
+            # Single-session dataset, scan subject directory directly
+            subject_files = self._scan_files(subject_dir, eager_load_metadata)
+        
+        # Scan derivatives for this subject (if derivatives folder exists)
+        derivatives = self._scan_subject_derivatives(subject_id, eager_load_metadata)
+        
+        # Load iEEG-specific data (channels and electrodes TSV files)
+        ieeg_data = self._load_ieeg_data(subject_dir)
+        
+        # Create subject object
+        return BIDSSubject(
+            subject_id=subject_id,
+            sessions=sessions,
+            files=subject_files,
+            derivatives=derivatives,
+            metadata=metadata,
+            ieeg_data=ieeg_data
+        )
+    
     def _scan_sessions(self, subject_path: Path, eager_load_metadata: bool = False) -> list[BIDSSession]:
         """
         Scan a subject directory for session directories.
@@ -394,11 +458,8 @@ class BidsLoader:
         sessions = []
         
         # Find all directories matching pattern 'ses-*'
-        session_dirs = sorted(subject_path.glob('ses-*'))
-        
-        for session_dir in session_dirs:
-            if not session_dir.is_dir():
-                continue
+        for entry in _list_subdirs(subject_path, 'ses-'):
+            session_dir = Path(entry.path)
             
             # Extract session ID from directory name
             session_id = session_dir.name.replace('ses-', '')
@@ -431,37 +492,25 @@ class BidsLoader:
         """
         all_files = []
         
-        # Scan for all standard BIDS modality directories
-        modality_dirs = [
-            'anat',      # Anatomical MRI
-            'func',      # Functional MRI
-            'dwi',       # Diffusion MRI
-            'fmap',      # Field maps
-            'ieeg',      # Intracranial EEG
-            'eeg',       # Electroencephalography
-            'meg',       # Magnetoencephalography
-            'beh',       # Behavioral data
-            'pet',       # Positron Emission Tomography
-            'micr',      # Microscopy
-            'nirs',      # Near-Infrared Spectroscopy
-            'motion',    # Motion tracking
-            'perf',      # Perfusion imaging
-        ]
-        
-        for modality in modality_dirs:
-            modality_path = session_path / modality
-            
-            if not modality_path.exists() or not modality_path.is_dir():
+        # List the session once, then scan the standard BIDS modality
+        # directories that are present, in the usual modality order
+        present = {entry.name for entry in _list_subdirs(session_path, sort=False)}
+        
+        for modality in _MODALITY_DIRS:
+            if modality not in present:
                 continue
             
             logger.debug(f"    Scanning modality: {modality}")
             
             # Find all files in this modality directory
-            for filepath in modality_path.iterdir():
-                if filepath.is_file():
-                    # Parse the BIDS filename
-                    bids_file = self._parse_bids_filename(filepath, modality, eager_load_metadata)
-                    all_files.append(bids_file)
+            with os.scandir(session_path / modality) as it:
+                for entry in it:
+                    if entry.is_file():
+                        # Parse the BIDS filename
+                        bids_file = self._parse_bids_filename(
+                            Path(entry.path), modality, eager_load_metadata
+                        )
+                        all_files.append(bids_file)
         
         # Run information is stored in file entities (e.g., {'run': '01'})
         return all_files
@@ -493,20 +542,12 @@ class BidsLoader:
             extension = filepath.suffix
             name_without_ext = filepath.stem
         
-        # Parse BIDS entities from filename using regex
-        # BIDS entities follow pattern: key-value
-        entity_pattern = r'([a-z]+)-([a-zA-Z0-9]+)'
-        entities = {}
-        
-        for match in re.finditer(entity_pattern, name_without_ext):
-            key = match.group(1)
-            value = match.group(2)
-            entities[key] = value
+        # Parse BIDS entities (key-value pairs) from filename
+        entities = dict(_ENTITY_RE.findall(name_without_ext))
         
         # Extract suffix (last part of filename before extension)
         # Format: sub-XX_ses-YY_..._SUFFIX.extension
-        parts = name_without_ext.split('_')
-        suffix = parts[-1] if parts else None
+        suffix = name_without_ext.rpartition('_')[2]
         
         # If suffix contains a dash, it's an entity, not a suffix
         if suffix and '-' in suffix:
@@ -566,8 +607,7 @@ class BidsLoader:
             pipeline_desc_file = pipeline_dir / 'dataset_description.json'
             if pipeline_desc_file.exists():
                 try:
-                    with open(pipeline_desc_file, 'r', encoding='utf-8') as f:
-                        pipeline_description = json.load(f)
+                    pipeline_description = load_json_file(pipeline_desc_file)
                 except (json.JSONDecodeError, IOError) as e:
                     logger.warning(f"Failed to load pipeline description for {pipeline_name}: {e}")
             
@@ -643,11 +683,8 @@ class BidsLoader:
         sessions = []
         
         # Look for session directories (ses-*)
-        session_dirs = sorted(subject_path.glob('ses-*'))
-        
-        for session_dir in session_dirs:
-            if not session_dir.is_dir():
-                continue
+        for entry in _list_subdirs(subject_path, 'ses-'):
+            session_dir = Path(entry.path)
             
             # Extract session ID
             session_id = session_dir.name.replace('ses-', '')
@@ -756,14 +793,13 @@ def get_bids_version(dataset_path: Path) -> Optional[str]:
         return None
     
     try:
-        with open(desc_path, 'r', encoding='utf-8') as f:
-            desc = json.load(f)
-            bids_version = desc.get("BIDSVersion")
-            
-            if bids_version is None:
-                logger.warning(f"BIDSVersion field missing in: {desc_path}")
-            
-            return bids_version
+        desc = load_json_file(desc_path)
+        bids_version = desc.get("BIDSVersion")
+        
+        if bids_version is None:
+            logger.warning(f"BIDSVersion field missing in: {desc_path}")
+        
+        return bids_version
             
     except json.JSONDecodeError as e:
         logger.error(f"Invalid JSON in dataset_description.json: {e}")
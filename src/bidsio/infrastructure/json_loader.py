@@ -0,0 +1,48 @@
+"""
+JSON file loading utilities.
+
+This module provides a single entry point for parsing the JSON files of a
+BIDS dataset (dataset_description.json, sidecars, pipeline descriptions).
+orjson is used when installed; otherwise the standard library parser is used.
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+# Try to import orjson for faster decoding
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def load_json_file(file_path: Path | str) -> Any:
+    """
+    Load and parse a JSON file.
+    
+    Content orjson rejects but the standard library accepts (e.g. NaN
+    literals) is parsed again with json, so both paths accept the same files.
+    
+    Args:
+        file_path: Path to the JSON file.
+        
+    Returns:
+        The parsed JSON content.
+        
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON.
+        OSError: If the file cannot be read.
+    """
+    if not HAS_ORJSON:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return json.loads(data.decode('utf-8'))
@@ -12,7 +12,7 @@ from collections import Counter
 
 from PySide6.QtWidgets import QMainWindow, QFileDialog, QMessageBox, QTreeWidgetItem, QApplication
 from PySide6.QtGui import QAction, QIcon, QColor, QBrush
-from PySide6.QtCore import Slot, Qt, QFile, QIODevice
+from PySide6.QtCore import Slot, Qt, QFile, QIODevice, QTimer
 from numpy import invert
 from qt_material import apply_stylesheet
 
@@ -30,7 +30,7 @@ from bidsio.ui.text_viewer_dialog import TextViewerDialog
 from bidsio.ui.progress_dialog import ProgressDialog
 from bidsio.ui.export_dialog import ExportDialog
 from bidsio.ui.filter_builder_dialog import FilterBuilderDialog
-from bidsio.ui.workers import DatasetLoaderThread, ExportWorkerThread
+from bidsio.ui.workers import DatasetLoaderRunnable, ExportWorkerRunnable
 from bidsio.ui.widgets.details_panel import DetailsPanel
 from bidsio.ui.forms.main_window_ui import Ui_MainWindow
 
@@ -56,6 +56,7 @@ class MainWindow(QMainWindow):
         self._active_filter: Optional[LogicalOperation] = None
         self._details_panel: Optional[DetailsPanel] = None
         self._last_dialog_filter: Optional[LogicalOperation] = None  # Last filter state in dialog
+        self._loader: Optional[DatasetLoaderRunnable] = None  # Dataset loader while it runs
         
         self._setup_ui()
         self._connect_signals()
@@ -316,20 +317,22 @@ class MainWindow(QMainWindow):
         progress_dialog = ProgressDialog(self)
         progress_dialog.setWindowTitle("Loading Dataset")
         
-        # Create loader thread
-        loader_thread = DatasetLoaderThread(self._repository, self)
+        # Create loader (runs on the global thread pool). The pool does not own
+        # it, so the window keeps it (and its GUI-thread signals object) alive
+        # until a completion handler runs
+        self._loader = DatasetLoaderRunnable(self._repository)
         
         # Connect signals
-        loader_thread.progress_updated.connect(progress_dialog.update_progress)
-        loader_thread.loading_complete.connect(
+        self._loader.signals.progress_updated.connect(progress_dialog.update_progress)
+        self._loader.signals.loading_complete.connect(
             lambda dataset: self._on_threaded_loading_complete(dataset, dataset_path, progress_dialog)
         )
-        loader_thread.loading_error.connect(
+        self._loader.signals.loading_error.connect(
             lambda error: self._on_threaded_loading_error(error, progress_dialog)
         )
         
         # Start loading
-        loader_thread.start()
+        self._loader.start()
         
         # Show progress dialog (blocks until loading completes)
         progress_dialog.exec()
@@ -344,6 +347,7 @@ class MainWindow(QMainWindow):
             progress_dialog: The progress dialog to close.
         """
         self._dataset = dataset
+        self._loader = None
         
         # Close progress dialog
         progress_dialog.complete()
@@ -366,6 +370,8 @@ class MainWindow(QMainWindow):
             error: The exception that occurred.
             progress_dialog: The progress dialog to close.
         """
+        self._loader = None
+        
         # Close progress dialog
         progress_dialog.reject()
         
@@ -535,26 +541,36 @@ class MainWindow(QMainWindow):
         progress_dialog = ProgressDialog(self)
         progress_dialog.setWindowTitle("Exporting Dataset")
         
-        # Create worker thread
-        self._export_worker = ExportWorkerThread(export_request)
-        self._export_worker.progress_updated.connect(
-            lambda current, total, filepath: self._on_export_progress(progress_dialog, current, total, filepath)
-        )
-        self._export_worker.export_complete.connect(
+        # Create worker (runs on the global thread pool)
+        self._export_worker = ExportWorkerRunnable(export_request)
+        self._export_worker.signals.export_complete.connect(
             lambda output_path: self._on_export_complete(progress_dialog, output_path)
         )
-        self._export_worker.export_error.connect(
+        self._export_worker.signals.export_error.connect(
             lambda error_msg: self._on_export_error(progress_dialog, error_msg)
         )
         
+        # Poll the worker's progress at ~30 Hz instead of receiving a signal per file
+        progress_timer = QTimer(progress_dialog)
+        progress_timer.setInterval(33)
+        progress_timer.timeout.connect(
+            lambda worker=self._export_worker: self._on_export_progress(progress_dialog, *worker.progress())
+        )
+        
         # Start export
+        progress_timer.start()
         self._export_worker.start()
         progress_dialog.exec()
+        progress_timer.stop()
         
         logger.info("Export initiated")
     
     def _on_export_progress(self, progress_dialog: ProgressDialog, current: int, total: int, filepath: str):
         """Handle export progress updates."""
+        # Nothing copied yet
+        if total == 0:
+            return
+        
         filename = Path(filepath).name
         message = f"Copying file {current}/{total}:\n{filename}"
         progress_dialog.update_progress(current, total, message)
@@ -5,11 +5,16 @@ Provides an advanced interface with tree view for building complex filter expres
 with nested logical operations (AND/OR/NOT).
 """
 
+import copy
+import weakref
+from contextlib import contextmanager
+from itertools import chain
 from typing import Optional
 
 from PySide6.QtWidgets import QWidget, QTreeWidgetItem, QMenu, QMessageBox
-from PySide6.QtCore import Slot, Qt, QTimer
-from PySide6.QtGui import QIcon, QKeySequence, QShortcut, QBrush, QColor
+from PySide6.QtCore import Slot, Qt, QTimer, QSignalBlocker
+from PySide6.QtGui import QAction, QIcon, QKeySequence, QShortcut, QBrush, QColor, QFont
+import shiboken6
 
 from bidsio.infrastructure.logging_config import get_logger
 from bidsio.core.models import BIDSDataset
@@ -28,6 +33,17 @@ from bidsio.ui.forms.advanced_filter_builder_widget_ui import Ui_AdvancedFilterB
 
 logger = get_logger(__name__)
 
+# QIcon instances keyed by resource path, created on first use (requires a QApplication)
+_ICON_CACHE: dict[str, QIcon] = {}
+
+
+def _cached_icon(path: str) -> QIcon:
+    """Get a shared QIcon for a resource path, loading it only once."""
+    icon = _ICON_CACHE.get(path)
+    if icon is None:
+        icon = _ICON_CACHE[path] = QIcon(path)
+    return icon
+
 
 class AdvancedFilterBuilderWidget(QWidget):
     """
@@ -38,6 +54,78 @@ class AdvancedFilterBuilderWidget(QWidget):
     cut/copy/paste operations.
     """
     
+    # Display text formatter and icon path for each condition type
+    _CONDITION_DISPLAY = {
+        SubjectIdFilter: (
+            lambda c: f"Subject ID = {c.subject_id or '<empty>'}",
+            ":/icons/id_icon.svg"
+        ),
+        ModalityFilter: (
+            lambda c: f"Modality = {c.modality}",
+            ":/icons/folder_icon.svg"
+        ),
+        EntityFilter: (
+            lambda c: f"{c.entity_code} {c.operator} {c.value}",
+            ":/icons/label_icon.svg"
+        ),
+        ParticipantAttributeFilter: (
+            lambda c: f"Subject.{c.attribute_name} {c.operator} {c.value}",
+            ":/icons/participant_attribute_icon.svg"
+        ),
+        ChannelAttributeFilter: (
+            lambda c: f"Channel.{c.attribute_name} {c.operator} {c.value}",
+            ":/icons/channel_attribute_icon.svg"
+        ),
+        ElectrodeAttributeFilter: (
+            lambda c: f"Electrode.{c.attribute_name} {c.operator} {c.value}",
+            ":/icons/electrode_attribute_icon.svg"
+        ),
+    }
+    
+    # (label, icon path, item type) for each entry of the "Add Condition" menu
+    _ADD_CONDITION_SPECS = (
+        ("Subject ID", ":/icons/id_icon.svg", 'subject_id'),
+        ("Modality", ":/icons/folder_icon.svg", 'modality'),
+        ("Entity", ":/icons/label_icon.svg", 'entity'),
+        ("Participant Attribute", ":/icons/participant_attribute_icon.svg", 'participant_attribute'),
+        ("Channel Attribute", ":/icons/channel_attribute_icon.svg", 'channel_attribute'),
+        ("Electrode Attribute", ":/icons/electrode_attribute_icon.svg", 'electrode_attribute'),
+    )
+    
+    # (label, icon path, item type) for each entry of the "Add Group" menu
+    _ADD_GROUP_SPECS = (
+        ("AND Group", ":/icons/and_icon.svg", 'AND'),
+        ("OR Group", ":/icons/or_icon.svg", 'OR'),
+        ("NOT Group", ":/icons/not_icon.svg", 'NOT'),
+    )
+    
+    # Condition type combo box entries, by editor page index
+    _TYPE_NAMES = (
+        "Subject ID",
+        "Modality",
+        "Entity",
+        "Participant Attribute",
+        "Channel Attribute",
+        "Electrode Attribute",
+    )
+    
+    # Condition type combo box entry -> item type tag
+    _TYPE_MAP = {
+        "Subject ID": "subject_id",
+        "Modality": "modality",
+        "Entity": "entity",
+        "Participant Attribute": "participant_attribute",
+        "Channel Attribute": "channel_attribute",
+        "Electrode Attribute": "electrode_attribute",
+    }
+    
+    # Icon path for each logical operator
+    _LOGICAL_ICONS = {
+        'AND': ":/icons/and_icon.svg",
+        'OR': ":/icons/or_icon.svg",
+        'NOT': ":/icons/not_icon.svg",
+    }
+    
     def __init__(self, dataset: BIDSDataset, parent=None):
         """
         Initialize the advanced filter builder widget.
@@ -53,14 +141,77 @@ class AdvancedFilterBuilderWidget(QWidget):
         # Discover available filter options from dataset
         self._available_modalities = list(dataset.get_all_modalities())
         self._available_entities = dataset.get_all_entities()
-        self._participant_attributes = self._get_participant_attributes()
-        self._channel_attributes = self._get_channel_attributes()
-        self._electrode_attributes = self._get_electrode_attributes()
-        
-        # Clipboard for cut/copy/paste
-        self._clipboard_item = None
+        # Attribute and entity lists are sorted once and reused as-is; the
+        # attribute names are memoized by the dataset across builder instances
+        self._sorted_entity_keys = sorted(self._available_entities.keys())
+        self._participant_attributes = dataset.get_all_participant_attributes()
+        self._channel_attributes = dataset.get_all_channel_attributes()
+        self._electrode_attributes = dataset.get_all_electrode_attributes()
+        
+        # Clipboard for cut/copy/paste (detached condition tree, no Qt items)
+        self._clipboard_payload = None
         self._clipboard_is_cut = False
-        self._cut_item_reference = None
+        # Item currently loaded in the editor, to skip redundant restores
+        self._last_editor_item: Optional[QTreeWidgetItem] = None
+        
+        # Weak reference so a deleted cut item is not kept alive by the clipboard
+        self._cut_item_reference: Optional[weakref.ref] = None
+        
+        # id(item) -> ids of item and all its ancestors, cleared whenever rows change
+        self._ancestor_cache: dict[int, set[int]] = {}
+        
+        # Condition type -> (editor page index, restore callable)
+        self._editor_dispatch = {
+            SubjectIdFilter: (0, self._restore_subject_id),
+            ModalityFilter: (1, self._restore_modality),
+            EntityFilter: (2, self._restore_entity),
+            ParticipantAttributeFilter: (3, self._restore_participant_attribute),
+            ChannelAttributeFilter: (4, self._restore_channel_attribute),
+            ElectrodeAttributeFilter: (5, self._restore_electrode_attribute),
+        }
+        
+        # Editor page index -> dropdown populator (run once, on first use)
+        self._page_populators = {
+            1: self._populate_modality,
+            2: self._populate_entity,
+            3: self._populate_participant_attrs,
+            4: self._populate_channel_attrs,
+            5: self._populate_electrode_attrs,
+        }
+        self._populated: set[int] = set()
+        
+        # Editor page index -> reset of that page's fields to new-condition defaults
+        self._editor_resetters = (
+            self._reset_subject_id_editor,
+            self._reset_modality_editor,
+            self._reset_entity_editor,
+            self._reset_participant_attribute_editor,
+            self._reset_channel_attribute_editor,
+            self._reset_electrode_attribute_editor,
+        )
+        
+        # Condition type -> update of the condition from the editor fields
+        self._condition_updaters = {
+            SubjectIdFilter: self._update_subject_id,
+            ModalityFilter: self._update_modality,
+            EntityFilter: self._update_entity,
+            ParticipantAttributeFilter: self._update_participant_attribute,
+            ChannelAttributeFilter: self._update_channel_attribute,
+            ElectrodeAttributeFilter: self._update_electrode_attribute,
+        }
+        
+        # Item type tag -> condition factory
+        self._condition_factories = {
+            'AND': lambda: LogicalOperation(operator='AND', conditions=[]),
+            'OR': lambda: LogicalOperation(operator='OR', conditions=[]),
+            'NOT': lambda: LogicalOperation(operator='NOT', conditions=[]),
+            'subject_id': lambda: SubjectIdFilter(subject_id=''),
+            'modality': self._create_modality_condition,
+            'entity': self._create_entity_condition,
+            'participant_attribute': self._create_participant_attribute_condition,
+            'channel_attribute': self._create_channel_attribute_condition,
+            'electrode_attribute': self._create_electrode_attribute_condition,
+        }
         
         self._setup_ui()
         self._connect_signals()
@@ -102,30 +253,125 @@ class AdvancedFilterBuilderWidget(QWidget):
         # Show empty editor page initially
         self.ui.editorStackedWidget.setCurrentWidget(self.ui.emptyEditorPage)
         
-        # Populate dynamic dropdowns
-        self._populate_dropdowns()
+        # Editor widgets of each condition details page, by page index
+        self._detail_page_widgets = (
+            (self.ui.subjectIdLineEdit,),
+            (self.ui.modalityComboBox,),
+            (
+                self.ui.entityNameComboBox,
+                self.ui.entityOperatorComboBox,
+                self.ui.entityValueLineEdit,
+            ),
+            (
+                self.ui.participantAttributeNameComboBox,
+                self.ui.participantAttributeOperatorComboBox,
+                self.ui.participantAttributeValueLineEdit,
+            ),
+            (
+                self.ui.channelAttributeNameComboBox,
+                self.ui.channelAttributeOperatorComboBox,
+                self.ui.channelAttributeValueLineEdit,
+            ),
+            (
+                self.ui.electrodeAttributeNameComboBox,
+                self.ui.electrodeAttributeOperatorComboBox,
+                self.ui.electrodeAttributeValueLineEdit,
+            ),
+        )
+        
+        # Editor widgets whose signals are blocked while restoring a condition
+        self._editor_widgets = (self.ui.conditionTypeComboBox,) + tuple(
+            chain.from_iterable(self._detail_page_widgets)
+        )
+        
+        # Only the visible details page emits signals; all start blocked
+        for widget in self._editor_widgets[1:]:
+            widget.blockSignals(True)
+        self._signals_page: Optional[int] = None
+        
+        # Fonts and brushes marking (and unmarking) a cut item, built once
+        self._font_normal = QFont()
+        self._font_italic = QFont()
+        self._font_italic.setItalic(True)
+        self._brush_normal = QBrush()
+        self._brush_cut = QBrush(QColor(Qt.GlobalColor.gray))
+        
+        # Build the "add" popup menus once; each action carries its item type
+        self._condition_menu = self._build_add_menu(self._ADD_CONDITION_SPECS)
+        self._group_menu = self._build_add_menu(self._ADD_GROUP_SPECS)
+        
+        # Tree context menu, also built once; it reuses the "add" menus as
+        # submenus and the shared toolbar actions, which track their own state
+        self._condition_menu.setTitle("Add Condition")
+        self._condition_menu.setIcon(_cached_icon(":/icons/add_icon.svg"))
+        self._group_menu.setTitle("Add Group")
+        self._group_menu.setIcon(_cached_icon(":/icons/and_icon.svg"))
+        
+        self._context_menu = QMenu(self)
+        self._context_menu.addMenu(self._condition_menu)
+        self._context_menu.addMenu(self._group_menu)
+        self._context_menu.addSeparator()
+        self._context_menu.addAction(self.ui.actionCut)
+        self._context_menu.addAction(self.ui.actionCopy)
+        self._context_menu.addAction(self.ui.actionPaste)
+        self._context_menu.addSeparator()
+        self._context_menu.addAction(self.ui.actionDelete)
+        self._context_menu.addSeparator()
+        self._context_menu.addAction(self.ui.actionMoveUp)
+        self._context_menu.addAction(self.ui.actionMoveDown)
+    
+    def _build_add_menu(self, specs: tuple[tuple[str, str, str], ...]) -> QMenu:
+        """
+        Build an "add" menu from (label, icon path, item type) specs.
+        
+        Each action is tagged with the item type it creates, which the menu's
+        triggered signal passes to a single dispatching slot.
+        """
+        menu = QMenu(self)
+        for text, icon_path, item_type in specs:
+            action = menu.addAction(_cached_icon(icon_path), text)
+            action.setData(item_type)
+        return menu
+    
+    def _ensure_page_populated(self, page_index: int):
+        """
+        Populate the dropdowns of a condition details page on first use.
+        
+        Must be called with editor signals blocked, since filling a combo box
+        changes its current text.
+        """
+        if page_index in self._populated:
+            return
+        
+        populate = self._page_populators.get(page_index)
+        if populate is not None:
+            populate()
+        self._populated.add(page_index)
     
-    def _populate_dropdowns(self):
-        """Populate dropdowns in editor with dataset-specific values."""
-        # Modality
+    def _populate_modality(self):
+        """Populate the modality dropdown."""
         self.ui.modalityComboBox.clear()
         self.ui.modalityComboBox.addItems(self._available_modalities)
-        
-        # Entity names
+    
+    def _populate_entity(self):
+        """Populate the entity name dropdown."""
         self.ui.entityNameComboBox.clear()
-        self.ui.entityNameComboBox.addItems(sorted(self._available_entities.keys()))
-        
-        # Participant attributes
+        self.ui.entityNameComboBox.addItems(self._sorted_entity_keys)
+    
+    def _populate_participant_attrs(self):
+        """Populate the participant attribute dropdown."""
         self.ui.participantAttributeNameComboBox.clear()
-        self.ui.participantAttributeNameComboBox.addItems(sorted(self._participant_attributes))
-        
-        # Channel attributes  
+        self.ui.participantAttributeNameComboBox.addItems(self._participant_attributes)
+    
+    def _populate_channel_attrs(self):
+        """Populate the channel attribute dropdown."""
         self.ui.channelAttributeNameComboBox.clear()
-        self.ui.channelAttributeNameComboBox.addItems(sorted(self._channel_attributes))
-        
-        # Electrode attributes
+        self.ui.channelAttributeNameComboBox.addItems(self._channel_attributes)
+    
+    def _populate_electrode_attrs(self):
+        """Populate the electrode attribute dropdown."""
         self.ui.electrodeAttributeNameComboBox.clear()
-        self.ui.electrodeAttributeNameComboBox.addItems(sorted(self._electrode_attributes))
+        self.ui.electrodeAttributeNameComboBox.addItems(self._electrode_attributes)
     
     def _connect_signals(self):
         """Connect UI signals to slots."""
@@ -139,10 +385,21 @@ class AdvancedFilterBuilderWidget(QWidget):
         self.ui.actionCopy.triggered.connect(self._copy_item)
         self.ui.actionPaste.triggered.connect(self._paste_item)
         
+        # "Add" menus - a single slot dispatches on the triggered action's item type
+        self._condition_menu.triggered.connect(self._add_menu_triggered)
+        self._group_menu.triggered.connect(self._add_menu_triggered)
+        
         # Tree widget
         self.ui.filterTreeWidget.itemSelectionChanged.connect(self._tree_selection_changed)
         self.ui.filterTreeWidget.customContextMenuRequested.connect(self._show_context_menu)
         
+        # Any structural change to the tree invalidates cached ancestor chains
+        tree_model = self.ui.filterTreeWidget.model()
+        tree_model.rowsInserted.connect(self._invalidate_ancestor_cache)
+        tree_model.rowsRemoved.connect(self._invalidate_ancestor_cache)
+        tree_model.rowsMoved.connect(self._invalidate_ancestor_cache)
+        tree_model.modelReset.connect(self._invalidate_ancestor_cache)
+        
         # Editor widgets - immediate updates
         self.ui.logicalOperatorComboBox.currentTextChanged.connect(self._editor_logical_changed)
         self.ui.conditionTypeComboBox.currentIndexChanged.connect(self._editor_condition_type_changed)
@@ -178,36 +435,6 @@ class AdvancedFilterBuilderWidget(QWidget):
                 self._copy_item()
                 self._paste_item()
     
-    def _get_participant_attributes(self) -> list[str]:
-        """Get list of available participant attributes from participants.tsv."""
-        attributes = set()
-        for subject in self._dataset.subjects:
-            attributes.update(subject.metadata.keys())
-        return sorted(attributes)
-    
-    def _get_channel_attributes(self) -> list[str]:
-        """Get list of available channel attributes from _channels.tsv files."""
-        attributes = set()
-        for subject in self._dataset.subjects:
-            if subject.ieeg_data and subject.ieeg_data.channels:
-                # channels is a dict[Path, list[dict]]
-                for channel_list in subject.ieeg_data.channels.values():
-                    if len(channel_list) > 0:
-                        attributes.update(channel_list[0].keys())
-                        break  # Only need first channel to get attribute names
-        return sorted(attributes)
-    
-    def _get_electrode_attributes(self) -> list[str]:
-        """Get list of available electrode attributes from _electrodes.tsv files."""
-        attributes = set()
-        for subject in self._dataset.subjects:
-            if subject.ieeg_data and subject.ieeg_data.electrodes:
-                # electrodes is a dict[Path, list[dict]]
-                for electrode_list in subject.ieeg_data.electrodes.values():
-                    if len(electrode_list) > 0:
-                        attributes.update(electrode_list[0].keys())
-                        break  # Only need first electrode to get attribute names
-        return sorted(attributes)
     
     # ==================== Tree Management ====================
     
@@ -222,7 +449,7 @@ class AdvancedFilterBuilderWidget(QWidget):
         self.ui.actionCopy.setEnabled(has_selection)
         
         # Enable paste if we have clipboard content
-        self.ui.actionPaste.setEnabled(self._clipboard_item is not None)
+        self.ui.actionPaste.setEnabled(self._clipboard_payload is not None)
         
         if has_selection:
             item = selected_items[0]
@@ -245,9 +472,15 @@ class AdvancedFilterBuilderWidget(QWidget):
             self.ui.actionMoveUp.setEnabled(False)
             self.ui.actionMoveDown.setEnabled(False)
             self.ui.editorStackedWidget.setCurrentWidget(self.ui.emptyEditorPage)
+            self._last_editor_item = None
     
     def _show_editor_for_item(self, item: QTreeWidgetItem):
         """Show appropriate editor panel for selected tree item."""
+        # Editor already shows this item - nothing to restore
+        if item is self._last_editor_item:
+            return
+        self._last_editor_item = item
+        
         condition = item.data(0, Qt.ItemDataRole.UserRole)
         
         if isinstance(condition, LogicalOperation):
@@ -259,103 +492,102 @@ class AdvancedFilterBuilderWidget(QWidget):
             self.ui.logicalOperatorComboBox.setCurrentText(condition.operator)
             self.ui.logicalOperatorComboBox.blockSignals(False)
             
-        elif isinstance(condition, FilterCondition):
+        else:
+            entry = self._editor_dispatch.get(type(condition))
+            if entry is None:
+                # Unknown type - show empty
+                self.ui.editorStackedWidget.setCurrentWidget(self.ui.emptyEditorPage)
+                return
+            
             # Show condition editor
+            page_index, restore = entry
             self.ui.editorStackedWidget.setCurrentWidget(self.ui.conditionEditorPage)
             
             # Block all signals during restore
-            self._block_editor_signals(True)
-            
-            # Set condition type and populate fields
-            if isinstance(condition, SubjectIdFilter):
-                self.ui.conditionTypeComboBox.setCurrentIndex(0)
-                self.ui.conditionDetailsStackedWidget.setCurrentIndex(0)
-                self.ui.subjectIdLineEdit.setText(condition.subject_id)
-                
-            elif isinstance(condition, ModalityFilter):
-                self.ui.conditionTypeComboBox.setCurrentIndex(1)
-                self.ui.conditionDetailsStackedWidget.setCurrentIndex(1)
-                self.ui.modalityComboBox.setCurrentText(condition.modality)
-                    
-            elif isinstance(condition, EntityFilter):
-                self.ui.conditionTypeComboBox.setCurrentIndex(2)
-                self.ui.conditionDetailsStackedWidget.setCurrentIndex(2)
-                self.ui.entityNameComboBox.setCurrentText(condition.entity_code)
-                self.ui.entityOperatorComboBox.setCurrentText(condition.operator)
-                self.ui.entityValueLineEdit.setText(str(condition.value))
-                
-            elif isinstance(condition, ParticipantAttributeFilter):
-                self.ui.conditionTypeComboBox.setCurrentIndex(3)
-                self.ui.conditionDetailsStackedWidget.setCurrentIndex(3)
-                self.ui.participantAttributeNameComboBox.setCurrentText(condition.attribute_name)
-                self.ui.participantAttributeOperatorComboBox.setCurrentText(condition.operator)
-                self.ui.participantAttributeValueLineEdit.setText(str(condition.value))
-                
-            elif isinstance(condition, ChannelAttributeFilter):
-                self.ui.conditionTypeComboBox.setCurrentIndex(4)
-                self.ui.conditionDetailsStackedWidget.setCurrentIndex(4)
-                self.ui.channelAttributeNameComboBox.setCurrentText(condition.attribute_name)
-                self.ui.channelAttributeOperatorComboBox.setCurrentText(condition.operator)
-                self.ui.channelAttributeValueLineEdit.setText(str(condition.value))
-                
-            elif isinstance(condition, ElectrodeAttributeFilter):
-                self.ui.conditionTypeComboBox.setCurrentIndex(5)
-                self.ui.conditionDetailsStackedWidget.setCurrentIndex(5)
-                self.ui.electrodeAttributeNameComboBox.setCurrentText(condition.attribute_name)
-                self.ui.electrodeAttributeOperatorComboBox.setCurrentText(condition.operator)
-                self.ui.electrodeAttributeValueLineEdit.setText(str(condition.value))
-            
-            # Unblock signals
-            self._block_editor_signals(False)
-        else:
-            # Unknown type - show empty
-            self.ui.editorStackedWidget.setCurrentWidget(self.ui.emptyEditorPage)
+            with self._editor_signals_blocked():
+                self._ensure_page_populated(page_index)
+                self.ui.conditionTypeComboBox.setCurrentIndex(page_index)
+                self.ui.conditionDetailsStackedWidget.setCurrentIndex(page_index)
+                restore(condition)
+            self._activate_page_signals(page_index)
+    
+    def _restore_subject_id(self, condition: SubjectIdFilter):
+        """Restore subject ID editor fields from a condition."""
+        self.ui.subjectIdLineEdit.setText(condition.subject_id)
+    
+    def _restore_modality(self, condition: ModalityFilter):
+        """Restore modality editor fields from a condition."""
+        self.ui.modalityComboBox.setCurrentText(condition.modality)
+    
+    def _restore_entity(self, condition: EntityFilter):
+        """Restore entity editor fields from a condition."""
+        self.ui.entityNameComboBox.setCurrentText(condition.entity_code)
+        self.ui.entityOperatorComboBox.setCurrentText(condition.operator)
+        self.ui.entityValueLineEdit.setText(str(condition.value))
     
-    def _block_editor_signals(self, block: bool):
-        """Block or unblock all editor widget signals."""
-        self.ui.conditionTypeComboBox.blockSignals(block)
-        self.ui.subjectIdLineEdit.blockSignals(block)
-        self.ui.modalityComboBox.blockSignals(block)
-        self.ui.entityNameComboBox.blockSignals(block)
-        self.ui.entityOperatorComboBox.blockSignals(block)
-        self.ui.entityValueLineEdit.blockSignals(block)
-        self.ui.participantAttributeNameComboBox.blockSignals(block)
-        self.ui.participantAttributeOperatorComboBox.blockSignals(block)
-        self.ui.participantAttributeValueLineEdit.blockSignals(block)
-        self.ui.channelAttributeNameComboBox.blockSignals(block)
-        self.ui.channelAttributeOperatorComboBox.blockSignals(block)
-        self.ui.channelAttributeValueLineEdit.blockSignals(block)
-        self.ui.electrodeAttributeNameComboBox.blockSignals(block)
-        self.ui.electrodeAttributeOperatorComboBox.blockSignals(block)
-        self.ui.electrodeAttributeValueLineEdit.blockSignals(block)
+    def _restore_participant_attribute(self, condition: ParticipantAttributeFilter):
+        """Restore participant attribute editor fields from a condition."""
+        self.ui.participantAttributeNameComboBox.setCurrentText(condition.attribute_name)
+        self.ui.participantAttributeOperatorComboBox.setCurrentText(condition.operator)
+        self.ui.participantAttributeValueLineEdit.setText(str(condition.value))
+    
+    def _restore_channel_attribute(self, condition: ChannelAttributeFilter):
+        """Restore channel attribute editor fields from a condition."""
+        self.ui.channelAttributeNameComboBox.setCurrentText(condition.attribute_name)
+        self.ui.channelAttributeOperatorComboBox.setCurrentText(condition.operator)
+        self.ui.channelAttributeValueLineEdit.setText(str(condition.value))
+    
+    def _restore_electrode_attribute(self, condition: ElectrodeAttributeFilter):
+        """Restore electrode attribute editor fields from a condition."""
+        self.ui.electrodeAttributeNameComboBox.setCurrentText(condition.attribute_name)
+        self.ui.electrodeAttributeOperatorComboBox.setCurrentText(condition.operator)
+        self.ui.electrodeAttributeValueLineEdit.setText(str(condition.value))
+    
+    def _activate_page_signals(self, page_index: int):
+        """
+        Unblock signals of the given details page and block the previous one.
+        
+        Must be called outside _editor_signals_blocked(), which restores the
+        blocked state it found on exit.
+        """
+        if page_index == self._signals_page:
+            return
+        
+        if self._signals_page is not None:
+            for widget in self._detail_page_widgets[self._signals_page]:
+                widget.blockSignals(True)
+        for widget in self._detail_page_widgets[page_index]:
+            widget.blockSignals(False)
+        self._signals_page = page_index
+    
+    @contextmanager
+    def _editor_signals_blocked(self):
+        """Block all editor widget signals for the duration of the context."""
+        blockers = [QSignalBlocker(widget) for widget in self._editor_widgets]
+        try:
+            yield
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
     
     # ==================== Tree Operations ====================
     
     @Slot()
     def _add_condition(self):
         """Add a new condition to the tree."""
-        # Show menu with condition types
-        menu = QMenu(self)
-        menu.addAction(QIcon(":/icons/id_icon.svg"), "Subject ID", lambda: self._create_and_add_item('subject_id'))
-        menu.addAction(QIcon(":/icons/folder_icon.svg"), "Modality", lambda: self._create_and_add_item('modality'))
-        menu.addAction(QIcon(":/icons/label_icon.svg"), "Entity", lambda: self._create_and_add_item('entity'))
-        menu.addAction(QIcon(":/icons/participant_attribute_icon.svg"), "Participant Attribute", lambda: self._create_and_add_item('participant_attribute'))
-        menu.addAction(QIcon(":/icons/channel_attribute_icon.svg"), "Channel Attribute", lambda: self._create_and_add_item('channel_attribute'))
-        menu.addAction(QIcon(":/icons/electrode_attribute_icon.svg"), "Electrode Attribute", lambda: self._create_and_add_item('electrode_attribute'))
-        
         # Show menu at button position
-        menu.exec(self.ui.treeToolBar.mapToGlobal(self.ui.treeToolBar.actionGeometry(self.ui.actionAddCondition).bottomLeft()))
+        self._condition_menu.exec(self.ui.treeToolBar.mapToGlobal(self.ui.treeToolBar.actionGeometry(self.ui.actionAddCondition).bottomLeft()))
     
     @Slot()
     def _add_group_menu(self):
         """Show menu to add a logical group (AND/OR/NOT)."""
-        menu = QMenu(self)
-        menu.addAction(QIcon(":/icons/and_icon.svg"), "AND Group", lambda: self._create_and_add_item('AND'))
-        menu.addAction(QIcon(":/icons/or_icon.svg"), "OR Group", lambda: self._create_and_add_item('OR'))
-        menu.addAction(QIcon(":/icons/not_icon.svg"), "NOT Group", lambda: self._create_and_add_item('NOT'))
-        
         # Show menu at button position
-        menu.exec(self.ui.treeToolBar.mapToGlobal(self.ui.treeToolBar.actionGeometry(self.ui.actionAddGroup).bottomLeft()))
+        self._group_menu.exec(self.ui.treeToolBar.mapToGlobal(self.ui.treeToolBar.actionGeometry(self.ui.actionAddGroup).bottomLeft()))
+    
+    @Slot(QAction)
+    def _add_menu_triggered(self, action: QAction):
+        """Create the item type stored on an "add" menu action."""
+        self._create_and_add_item(action.data())
     
     def _create_and_add_item(self, item_type: str):
         """Create and add a new item to the tree."""
@@ -415,31 +647,35 @@ class AdvancedFilterBuilderWidget(QWidget):
     
     def _create_condition(self, item_type: str):
         """Create a new condition object based on type."""
-        if item_type == 'AND':
-            return LogicalOperation(operator='AND', conditions=[])
-        elif item_type == 'OR':
-            return LogicalOperation(operator='OR', conditions=[])
-        elif item_type == 'NOT':
-            return LogicalOperation(operator='NOT', conditions=[])
-        elif item_type == 'subject_id':
-            return SubjectIdFilter(subject_id='')
-        elif item_type == 'modality':
-            modality = self._available_modalities[0] if self._available_modalities else ''
-            return ModalityFilter(modality=modality)
-        elif item_type == 'entity':
-            entity_code = sorted(self._available_entities.keys())[0] if self._available_entities else ''
-            return EntityFilter(entity_code=entity_code, operator='equals', value='')
-        elif item_type == 'participant_attribute':
-            attr_name = sorted(self._participant_attributes)[0] if self._participant_attributes else ''
-            return ParticipantAttributeFilter(attribute_name=attr_name, operator='equals', value='')
-        elif item_type == 'channel_attribute':
-            attr_name = sorted(self._channel_attributes)[0] if self._channel_attributes else ''
-            return ChannelAttributeFilter(attribute_name=attr_name, operator='equals', value='')
-        elif item_type == 'electrode_attribute':
-            attr_name = sorted(self._electrode_attributes)[0] if self._electrode_attributes else ''
-            return ElectrodeAttributeFilter(attribute_name=attr_name, operator='equals', value='')
-        else:
+        factory = self._condition_factories.get(item_type)
+        if factory is None:
             raise ValueError(f"Unknown item type: {item_type}")
+        return factory()
+    
+    def _create_modality_condition(self) -> ModalityFilter:
+        """Create a modality condition defaulting to the first available modality."""
+        modality = self._available_modalities[0] if self._available_modalities else ''
+        return ModalityFilter(modality=modality)
+    
+    def _create_entity_condition(self) -> EntityFilter:
+        """Create an entity condition defaulting to the first available entity."""
+        entity_code = self._sorted_entity_keys[0] if self._sorted_entity_keys else ''
+        return EntityFilter(entity_code=entity_code, operator='equals', value='')
+    
+    def _create_participant_attribute_condition(self) -> ParticipantAttributeFilter:
+        """Create a participant attribute condition defaulting to the first attribute."""
+        attr_name = self._participant_attributes[0] if self._participant_attributes else ''
+        return ParticipantAttributeFilter(attribute_name=attr_name, operator='equals', value='')
+    
+    def _create_channel_attribute_condition(self) -> ChannelAttributeFilter:
+        """Create a channel attribute condition defaulting to the first attribute."""
+        attr_name = self._channel_attributes[0] if self._channel_attributes else ''
+        return ChannelAttributeFilter(attribute_name=attr_name, operator='equals', value='')
+    
+    def _create_electrode_attribute_condition(self) -> ElectrodeAttributeFilter:
+        """Create an electrode attribute condition defaulting to the first attribute."""
+        attr_name = self._electrode_attributes[0] if self._electrode_attributes else ''
+        return ElectrodeAttributeFilter(attribute_name=attr_name, operator='equals', value='')
     
     def _create_tree_item(self, condition) -> QTreeWidgetItem:
         """Create a tree widget item for a condition."""
@@ -451,50 +687,28 @@ class AdvancedFilterBuilderWidget(QWidget):
         # Set display text and icon
         if isinstance(condition, LogicalOperation):
             item.setText(0, condition.operator)
-            if condition.operator == 'AND':
-                item.setIcon(0, QIcon(":/icons/and_icon.svg"))
-            elif condition.operator == 'OR':
-                item.setIcon(0, QIcon(":/icons/or_icon.svg"))
-            elif condition.operator == 'NOT':
-                item.setIcon(0, QIcon(":/icons/not_icon.svg"))
+            icon_path = self._LOGICAL_ICONS.get(condition.operator)
+            if icon_path is not None:
+                item.setIcon(0, _cached_icon(icon_path))
         else:
             text, icon = self._get_condition_display(condition)
             item.setText(0, text)
-            item.setIcon(0, QIcon(icon))
+            item.setIcon(0, icon)
         
         return item
     
-    def _get_condition_display(self, condition: FilterCondition) -> tuple[str, str]:
-        """Get display text and icon path for a condition."""
-        if isinstance(condition, SubjectIdFilter):
-            if condition.subject_id:
-                text = f"Subject ID = {condition.subject_id}"
-            else:
-                text = "Subject ID = <empty>"
-            return text, ":/icons/id_icon.svg"
-        
-        elif isinstance(condition, ModalityFilter):
-            text = f"Modality = {condition.modality}"
-            return text, ":/icons/folder_icon.svg"
-        
-        elif isinstance(condition, EntityFilter):
-            text = f"{condition.entity_code} {condition.operator} {condition.value}"
-            return text, ":/icons/label_icon.svg"
-        
-        elif isinstance(condition, ParticipantAttributeFilter):
-            text = f"Subject.{condition.attribute_name} {condition.operator} {condition.value}"
-            return text, ":/icons/participant_attribute_icon.svg"
-        
-        elif isinstance(condition, ChannelAttributeFilter):
-            text = f"Channel.{condition.attribute_name} {condition.operator} {condition.value}"
-            return text, ":/icons/channel_attribute_icon.svg"
-        
-        elif isinstance(condition, ElectrodeAttributeFilter):
-            text = f"Electrode.{condition.attribute_name} {condition.operator} {condition.value}"
-            return text, ":/icons/electrode_attribute_icon.svg"
+    def _get_condition_display(self, condition: FilterCondition) -> tuple[str, QIcon]:
+        """Get display text and icon for a condition (text memoized on the condition)."""
+        if condition._display_cache is None:
+            entry = self._CONDITION_DISPLAY.get(type(condition))
+            if entry is None:
+                return "Unknown condition", _cached_icon(":/icons/help_icon.svg")
+            
+            format_text, icon_path = entry
+            condition._display_cache = (format_text(condition), icon_path)
         
-        else:
-            return "Unknown condition", ":/icons/help_icon.svg"
+        text, icon_path = condition._display_cache
+        return text, _cached_icon(icon_path)
     
     @Slot()
     def _delete_item(self):
@@ -583,15 +797,13 @@ class AdvancedFilterBuilderWidget(QWidget):
         item = selected_items[0]
         
         # Store in clipboard
-        self._clipboard_item = self._clone_tree_item(item)
+        self._clipboard_payload = self._serialize_item(item)
         self._clipboard_is_cut = True
-        self._cut_item_reference = item  # Store reference to the actual item
+        self._cut_item_reference = weakref.ref(item)  # Weak reference to the actual item
         
         # Visual feedback - gray out the item
-        font = item.font(0)
-        font.setItalic(True)
-        item.setFont(0, font)
-        item.setForeground(0, QBrush(QColor(Qt.GlobalColor.gray)))
+        item.setFont(0, self._font_italic)
+        item.setForeground(0, self._brush_cut)
         
         # Enable paste
         self.ui.actionPaste.setEnabled(True)
@@ -608,7 +820,7 @@ class AdvancedFilterBuilderWidget(QWidget):
         item = selected_items[0]
         
         # Store in clipboard
-        self._clipboard_item = self._clone_tree_item(item)
+        self._clipboard_payload = self._serialize_item(item)
         self._clipboard_is_cut = False
         
         # Enable paste
@@ -619,19 +831,20 @@ class AdvancedFilterBuilderWidget(QWidget):
     @Slot()
     def _paste_item(self):
         """Paste item from clipboard."""
-        if not self._clipboard_item:
+        if self._clipboard_payload is None:
             return
         
         selected_items = self.ui.filterTreeWidget.selectedItems()
         parent_item = None
         insert_index = None
+        cut_item = self._get_cut_item() if self._clipboard_is_cut else None
         
         if selected_items:
             target_item = selected_items[0]
             target_condition = target_item.data(0, Qt.ItemDataRole.UserRole)
             
             # Prevent pasting an item into itself or its descendants
-            if self._clipboard_is_cut and self._cut_item_reference and self._is_ancestor_or_self(self._cut_item_reference, target_item):
+            if cut_item is not None and self._is_ancestor_or_self(cut_item, target_item):
                 QMessageBox.warning(
                     self,
                     "Invalid Operation",
@@ -651,8 +864,8 @@ class AdvancedFilterBuilderWidget(QWidget):
                 else:
                     insert_index = self.ui.filterTreeWidget.indexOfTopLevelItem(target_item) + 1
         
-        # Clone the clipboard item (in case we paste multiple times)
-        pasted_item = self._clone_tree_item(self._clipboard_item)
+        # Build tree items from a fresh copy (in case we paste multiple times)
+        pasted_item = self._deserialize_item(self._clipboard_payload)
         
         # Add to tree
         if parent_item:
@@ -667,24 +880,23 @@ class AdvancedFilterBuilderWidget(QWidget):
             else:
                 self.ui.filterTreeWidget.addTopLevelItem(pasted_item)
         
-        # If it was cut, remove the original
-        if self._clipboard_is_cut and self._cut_item_reference is not None:
-            # Restore appearance first
-            font = self._cut_item_reference.font(0)
-            font.setItalic(False)
-            self._cut_item_reference.setFont(0, font)
-            self._cut_item_reference.setForeground(0, QBrush())
-            
-            # Remove the cut item
-            parent = self._cut_item_reference.parent()
-            if parent:
-                parent.removeChild(self._cut_item_reference)
-            else:
-                index = self.ui.filterTreeWidget.indexOfTopLevelItem(self._cut_item_reference)
-                self.ui.filterTreeWidget.takeTopLevelItem(index)
+        # If it was cut, remove the original (unless it was deleted meanwhile)
+        if self._clipboard_is_cut:
+            if cut_item is not None:
+                # Restore appearance first
+                cut_item.setFont(0, self._font_normal)
+                cut_item.setForeground(0, self._brush_normal)
+                
+                # Remove the cut item
+                parent = cut_item.parent()
+                if parent:
+                    parent.removeChild(cut_item)
+                else:
+                    index = self.ui.filterTreeWidget.indexOfTopLevelItem(cut_item)
+                    self.ui.filterTreeWidget.takeTopLevelItem(index)
             
             # Clear cut state
-            self._clipboard_item = None
+            self._clipboard_payload = None
             self._clipboard_is_cut = False
             self._cut_item_reference = None
             self.ui.actionPaste.setEnabled(False)
@@ -694,74 +906,55 @@ class AdvancedFilterBuilderWidget(QWidget):
         
         logger.debug("Pasted item from clipboard")
     
+    def _get_cut_item(self) -> Optional[QTreeWidgetItem]:
+        """Return the item marked by the last cut, or None if it no longer exists."""
+        if self._cut_item_reference is None:
+            return None
+        
+        item = self._cut_item_reference()
+        if item is None or not shiboken6.isValid(item):
+            return None
+        return item
+    
     def _is_ancestor_or_self(self, ancestor: QTreeWidgetItem, item: QTreeWidgetItem) -> bool:
         """Check if ancestor is the same as item or an ancestor of item."""
-        if ancestor == item:
-            return True
-        
-        # Walk up the tree from item to see if we find ancestor
-        current = item.parent()
-        while current is not None:
-            if current == ancestor:
-                return True
-            current = current.parent()
-        
-        return False
+        return ancestor is item or id(ancestor) in self._collect_ancestors(item)
     
-    def _clone_tree_item(self, item: QTreeWidgetItem) -> QTreeWidgetItem:
-        """Deep clone a tree item with all children."""
-        # Get the condition and deep copy it
-        condition = item.data(0, Qt.ItemDataRole.UserRole)
-        cloned_condition = self._deep_copy_condition(condition)
-        
-        # Create new tree item
-        new_item = self._create_tree_item(cloned_condition)
+    def _collect_ancestors(self, item: QTreeWidgetItem) -> set[int]:
+        """
+        Get the ids of item and all of its ancestors.
         
-        # Clone children recursively
-        for i in range(item.childCount()):
-            child_item = item.child(i)
-            new_item.addChild(self._clone_tree_item(child_item))
+        The parent chain is walked once per item and cached until the tree
+        structure changes, so repeated checks against the same item are O(1).
+        """
+        key = id(item)
+        ancestors = self._ancestor_cache.get(key)
+        if ancestors is None:
+            ancestors = set()
+            current = item
+            while current is not None:
+                ancestors.add(id(current))
+                current = current.parent()
+            self._ancestor_cache[key] = ancestors
+        return ancestors
+    
+    @Slot()
+    def _invalidate_ancestor_cache(self):
+        """Drop cached ancestor chains after a structural tree change."""
+        self._ancestor_cache.clear()
+    
+    def _serialize_item(self, item: QTreeWidgetItem):
+        """
+        Detach a tree item and its children into a clipboard payload.
         
-        return new_item
+        The payload is a deep-copied condition tree (nested LogicalOperation
+        and FilterCondition objects), so no Qt items are allocated until paste.
+        """
+        return copy.deepcopy(self._tree_item_to_filter(item))
     
-    def _deep_copy_condition(self, condition):
-        """Deep copy a condition object."""
-        if isinstance(condition, LogicalOperation):
-            return LogicalOperation(
-                operator=condition.operator,
-                conditions=[self._deep_copy_condition(c) for c in condition.conditions]
-            )
-        elif isinstance(condition, SubjectIdFilter):
-            return SubjectIdFilter(subject_id=condition.subject_id)
-        elif isinstance(condition, ModalityFilter):
-            return ModalityFilter(modality=condition.modality)
-        elif isinstance(condition, EntityFilter):
-            return EntityFilter(
-                entity_code=condition.entity_code,
-                operator=condition.operator,
-                value=condition.value
-            )
-        elif isinstance(condition, ParticipantAttributeFilter):
-            return ParticipantAttributeFilter(
-                attribute_name=condition.attribute_name,
-                operator=condition.operator,
-                value=condition.value
-            )
-        elif isinstance(condition, ChannelAttributeFilter):
-            return ChannelAttributeFilter(
-                attribute_name=condition.attribute_name,
-                operator=condition.operator,
-                value=condition.value
-            )
-        elif isinstance(condition, ElectrodeAttributeFilter):
-            return ElectrodeAttributeFilter(
-                attribute_name=condition.attribute_name,
-                operator=condition.operator,
-                value=condition.value
-            )
-        else:
-            logger.warning(f"Unknown condition type for deep copy: {type(condition)}")
-            return condition
+    def _deserialize_item(self, payload) -> QTreeWidgetItem:
+        """Build a new tree item (with children) from a clipboard payload."""
+        return self._filter_to_tree_item(copy.deepcopy(payload))
     
     def _show_context_menu(self, position):
         """Show context menu for tree widget."""
@@ -769,40 +962,8 @@ class AdvancedFilterBuilderWidget(QWidget):
         if not item:
             return
         
-        menu = QMenu(self)
-        
-        # Add submenu for adding items
-        add_condition_menu = menu.addMenu(QIcon(":/icons/add_icon.svg"), "Add Condition")
-        add_condition_menu.addAction(QIcon(":/icons/id_icon.svg"), "Subject ID", lambda: self._create_and_add_item('subject_id'))
-        add_condition_menu.addAction(QIcon(":/icons/folder_icon.svg"), "Modality", lambda: self._create_and_add_item('modality'))
-        add_condition_menu.addAction(QIcon(":/icons/label_icon.svg"), "Entity", lambda: self._create_and_add_item('entity'))
-        add_condition_menu.addAction(QIcon(":/icons/participant_attribute_icon.svg"), "Participant Attribute", lambda: self._create_and_add_item('participant_attribute'))
-        add_condition_menu.addAction(QIcon(":/icons/channel_attribute_icon.svg"), "Channel Attribute", lambda: self._create_and_add_item('channel_attribute'))
-        add_condition_menu.addAction(QIcon(":/icons/electrode_attribute_icon.svg"), "Electrode Attribute", lambda: self._create_and_add_item('electrode_attribute'))
-        
-        add_group_menu = menu.addMenu(QIcon(":/icons/and_icon.svg"), "Add Group")
-        add_group_menu.addAction(QIcon(":/icons/and_icon.svg"), "AND Group", lambda: self._create_and_add_item('AND'))
-        add_group_menu.addAction(QIcon(":/icons/or_icon.svg"), "OR Group", lambda: self._create_and_add_item('OR'))
-        add_group_menu.addAction(QIcon(":/icons/not_icon.svg"), "NOT Group", lambda: self._create_and_add_item('NOT'))
-        
-        menu.addSeparator()
-        
-        # Standard operations
-        menu.addAction(self.ui.actionCut)
-        menu.addAction(self.ui.actionCopy)
-        menu.addAction(self.ui.actionPaste)
-        
-        menu.addSeparator()
-        
-        menu.addAction(self.ui.actionDelete)
-        
-        menu.addSeparator()
-        
-        menu.addAction(self.ui.actionMoveUp)
-        menu.addAction(self.ui.actionMoveDown)
-        
         # Show menu at cursor
-        menu.exec(self.ui.filterTreeWidget.viewport().mapToGlobal(position))
+        self._context_menu.exec(self.ui.filterTreeWidget.viewport().mapToGlobal(position))
     
     # ==================== Editor Updates ====================
     
@@ -823,12 +984,9 @@ class AdvancedFilterBuilderWidget(QWidget):
             
             # Update tree display
             item.setText(0, new_operator)
-            if new_operator == 'AND':
-                item.setIcon(0, QIcon(":/icons/and_icon.svg"))
-            elif new_operator == 'OR':
-                item.setIcon(0, QIcon(":/icons/or_icon.svg"))
-            elif new_operator == 'NOT':
-                item.setIcon(0, QIcon(":/icons/not_icon.svg"))
+            icon_path = self._LOGICAL_ICONS.get(new_operator)
+            if icon_path is not None:
+                item.setIcon(0, _cached_icon(icon_path))
     
     @Slot()
     def _editor_condition_type_changed(self, index):
@@ -845,21 +1003,11 @@ class AdvancedFilterBuilderWidget(QWidget):
             return
         
         # Get the type name
-        type_names = ["Subject ID", "Modality", "Entity", "Participant Attribute", "Channel Attribute", "Electrode Attribute"]
-        type_map = {
-            "Subject ID": "subject_id",
-            "Modality": "modality",
-            "Entity": "entity",
-            "Participant Attribute": "participant_attribute",
-            "Channel Attribute": "channel_attribute",
-            "Electrode Attribute": "electrode_attribute"
-        }
-        
-        if index < 0 or index >= len(type_names):
+        if index < 0 or index >= len(self._TYPE_NAMES):
             return
         
-        type_name = type_names[index]
-        item_type = type_map[type_name]
+        type_name = self._TYPE_NAMES[index]
+        item_type = self._TYPE_MAP[type_name]
         
         # Create new condition
         new_condition = self._create_condition(item_type)
@@ -868,45 +1016,59 @@ class AdvancedFilterBuilderWidget(QWidget):
         item.setData(0, Qt.ItemDataRole.UserRole, new_condition)
         # Only update display if it's a FilterCondition (not LogicalOperation)
         if isinstance(new_condition, FilterCondition):
-            text, icon_path = self._get_condition_display(new_condition)
+            text, icon = self._get_condition_display(new_condition)
             item.setText(0, text)
-            item.setIcon(0, QIcon(icon_path))
+            item.setIcon(0, icon)
         
         # Update editor details page
         self.ui.conditionDetailsStackedWidget.setCurrentIndex(index)
         
         # Populate editor with new condition defaults
-        self._block_editor_signals(True)
-        self._populate_editor_for_condition(new_condition, index)
-        self._block_editor_signals(False)
+        with self._editor_signals_blocked():
+            self._ensure_page_populated(index)
+            self._populate_editor_for_condition(new_condition, index)
+        self._activate_page_signals(index)
     
     def _populate_editor_for_condition(self, condition, page_index: int):
         """Populate editor fields for a condition."""
-        if page_index == 0:  # Subject ID
-            self.ui.subjectIdLineEdit.setText('')
-        elif page_index == 1:  # Modality
-            if self._available_modalities:
-                self.ui.modalityComboBox.setCurrentIndex(0)
-        elif page_index == 2:  # Entity
-            if self._available_entities:
-                self.ui.entityNameComboBox.setCurrentIndex(0)
-            self.ui.entityOperatorComboBox.setCurrentText('equals')
-            self.ui.entityValueLineEdit.setText('')
-        elif page_index == 3:  # Participant Attribute
-            if self._participant_attributes:
-                self.ui.participantAttributeNameComboBox.setCurrentIndex(0)
-            self.ui.participantAttributeOperatorComboBox.setCurrentText('equals')
-            self.ui.participantAttributeValueLineEdit.setText('')
-        elif page_index == 4:  # Channel Attribute
-            if self._channel_attributes:
-                self.ui.channelAttributeNameComboBox.setCurrentIndex(0)
-            self.ui.channelAttributeOperatorComboBox.setCurrentText('equals')
-            self.ui.channelAttributeValueLineEdit.setText('')
-        elif page_index == 5:  # Electrode Attribute
-            if self._electrode_attributes:
-                self.ui.electrodeAttributeNameComboBox.setCurrentIndex(0)
-            self.ui.electrodeAttributeOperatorComboBox.setCurrentText('equals')
-            self.ui.electrodeAttributeValueLineEdit.setText('')
+        self._editor_resetters[page_index]()
+    
+    def _reset_subject_id_editor(self):
+        """Reset the subject ID editor fields."""
+        self.ui.subjectIdLineEdit.setText('')
+    
+    def _reset_modality_editor(self):
+        """Reset the modality editor fields."""
+        if self._available_modalities:
+            self.ui.modalityComboBox.setCurrentIndex(0)
+    
+    def _reset_entity_editor(self):
+        """Reset the entity editor fields."""
+        if self._available_entities:
+            self.ui.entityNameComboBox.setCurrentIndex(0)
+        self.ui.entityOperatorComboBox.setCurrentText('equals')
+        self.ui.entityValueLineEdit.setText('')
+    
+    def _reset_participant_attribute_editor(self):
+        """Reset the participant attribute editor fields."""
+        if self._participant_attributes:
+            self.ui.participantAttributeNameComboBox.setCurrentIndex(0)
+        self.ui.participantAttributeOperatorComboBox.setCurrentText('equals')
+        self.ui.participantAttributeValueLineEdit.setText('')
+    
+    def _reset_channel_attribute_editor(self):
+        """Reset the channel attribute editor fields."""
+        if self._channel_attributes:
+            self.ui.channelAttributeNameComboBox.setCurrentIndex(0)
+        self.ui.channelAttributeOperatorComboBox.setCurrentText('equals')
+        self.ui.channelAttributeValueLineEdit.setText('')
+    
+    def _reset_electrode_attribute_editor(self):
+        """Reset the electrode attribute editor fields."""
+        if self._electrode_attributes:
+            self.ui.electrodeAttributeNameComboBox.setCurrentIndex(0)
+        self.ui.electrodeAttributeOperatorComboBox.setCurrentText('equals')
+        self.ui.electrodeAttributeValueLineEdit.setText('')
     
     @Slot()
     def _editor_details_changed(self):
@@ -919,59 +1081,74 @@ class AdvancedFilterBuilderWidget(QWidget):
         condition = item.data(0, Qt.ItemDataRole.UserRole)
         
         # Update condition based on current editor state
-        if isinstance(condition, SubjectIdFilter):
-            condition.subject_id = self.ui.subjectIdLineEdit.text()
-        
-        elif isinstance(condition, ModalityFilter):
-            condition.modality = self.ui.modalityComboBox.currentText()
-        
-        elif isinstance(condition, EntityFilter):
-            condition.entity_code = self.ui.entityNameComboBox.currentText()
-            condition.operator = self.ui.entityOperatorComboBox.currentText()
-            condition.value = self.ui.entityValueLineEdit.text()
-        
-        elif isinstance(condition, ParticipantAttributeFilter):
-            condition.attribute_name = self.ui.participantAttributeNameComboBox.currentText()
-            condition.operator = self.ui.participantAttributeOperatorComboBox.currentText()
-            condition.value = self.ui.participantAttributeValueLineEdit.text()
-        
-        elif isinstance(condition, ChannelAttributeFilter):
-            condition.attribute_name = self.ui.channelAttributeNameComboBox.currentText()
-            condition.operator = self.ui.channelAttributeOperatorComboBox.currentText()
-            condition.value = self.ui.channelAttributeValueLineEdit.text()
+        update = self._condition_updaters.get(type(condition))
+        if update is None:
+            return
+        update(condition)
         
-        elif isinstance(condition, ElectrodeAttributeFilter):
-            condition.attribute_name = self.ui.electrodeAttributeNameComboBox.currentText()
-            condition.operator = self.ui.electrodeAttributeOperatorComboBox.currentText()
-            condition.value = self.ui.electrodeAttributeValueLineEdit.text()
+        # Force a full editor restore the next time this item is shown
+        self._last_editor_item = None
         
-        # Update tree display
-        text, icon_path = self._get_condition_display(condition)
-        item.setText(0, text)
+        # Update tree display (fields changed, so drop the memoized display);
+        # edits to fields the display does not show leave the row untouched
+        condition._display_cache = None
+        text, _ = self._get_condition_display(condition)
+        if item.text(0) != text:
+            item.setText(0, text)
+    
+    def _update_subject_id(self, condition: SubjectIdFilter):
+        """Update a subject ID condition from the editor fields."""
+        condition.subject_id = self.ui.subjectIdLineEdit.text()
+    
+    def _update_modality(self, condition: ModalityFilter):
+        """Update a modality condition from the editor fields."""
+        condition.modality = self.ui.modalityComboBox.currentText()
+    
+    def _update_entity(self, condition: EntityFilter):
+        """Update an entity condition from the editor fields."""
+        condition.entity_code = self.ui.entityNameComboBox.currentText()
+        condition.operator = self.ui.entityOperatorComboBox.currentText()
+        condition.value = self.ui.entityValueLineEdit.text()
+    
+    def _update_participant_attribute(self, condition: ParticipantAttributeFilter):
+        """Update a participant attribute condition from the editor fields."""
+        condition.attribute_name = self.ui.participantAttributeNameComboBox.currentText()
+        condition.operator = self.ui.participantAttributeOperatorComboBox.currentText()
+        condition.value = self.ui.participantAttributeValueLineEdit.text()
+    
+    def _update_channel_attribute(self, condition: ChannelAttributeFilter):
+        """Update a channel attribute condition from the editor fields."""
+        condition.attribute_name = self.ui.channelAttributeNameComboBox.currentText()
+        condition.operator = self.ui.channelAttributeOperatorComboBox.currentText()
+        condition.value = self.ui.channelAttributeValueLineEdit.text()
+    
+    def _update_electrode_attribute(self, condition: ElectrodeAttributeFilter):
+        """Update an electrode attribute condition from the editor fields."""
+        condition.attribute_name = self.ui.electrodeAttributeNameComboBox.currentText()
+        condition.operator = self.ui.electrodeAttributeOperatorComboBox.currentText()
+        condition.value = self.ui.electrodeAttributeValueLineEdit.text()
     
     # ==================== Public API ====================
     
     def get_filter_expression(self) -> Optional[LogicalOperation]:
         """Build LogicalOperation from tree structure."""
+        tree = self.ui.filterTreeWidget
+        count = tree.topLevelItemCount()
+        
         # If tree is empty, return None
-        if self.ui.filterTreeWidget.topLevelItemCount() == 0:
+        if count == 0:
             return None
         
-        # If single top-level item, convert it
-        if self.ui.filterTreeWidget.topLevelItemCount() == 1:
-            root_item = self.ui.filterTreeWidget.topLevelItem(0)
-            if root_item is not None:
-                return self._tree_item_to_filter(root_item)
-            return None
+        # If single top-level item, convert it as is (no extra AND wrapper)
+        if count == 1:
+            return self._tree_item_to_filter(tree.topLevelItem(0))
         
-        # Multiple top-level items - wrap in AND
-        conditions = []
-        for i in range(self.ui.filterTreeWidget.topLevelItemCount()):
-            item = self.ui.filterTreeWidget.topLevelItem(i)
-            if item is not None:
-                condition = self._tree_item_to_filter(item)
-                if condition:
-                    conditions.append(condition)
+        # Multiple top-level items - wrap in AND, in a single pass
+        conditions = [
+            condition
+            for condition in (self._tree_item_to_filter(tree.topLevelItem(i)) for i in range(count))
+            if condition is not None
+        ]
         
         if conditions:
             return LogicalOperation(operator='AND', conditions=conditions)
@@ -981,60 +1158,90 @@ class AdvancedFilterBuilderWidget(QWidget):
         """Convert a tree item and its children to a filter condition."""
         condition = item.data(0, Qt.ItemDataRole.UserRole)
         
-        # If it's a logical operation, recursively convert children
-        if isinstance(condition, LogicalOperation):
-            child_conditions = []
-            for i in range(item.childCount()):
-                child_item = item.child(i)
-                child_condition = self._tree_item_to_filter(child_item)
-                if child_condition:
-                    child_conditions.append(child_condition)
-            
-            # Create new logical operation with converted children
-            return LogicalOperation(
-                operator=condition.operator,
-                conditions=child_conditions
-            )
-        else:
-            # It's a filter condition - return as is
+        # A filter condition is returned as is
+        if not isinstance(condition, LogicalOperation):
             return condition
+        
+        # Rebuild logical operations bottom-up with an explicit stack of
+        # [tree item, stored LogicalOperation, next child index, built children]
+        result = None
+        stack = [[item, condition, 0, []]]
+        while stack:
+            frame = stack[-1]
+            parent_item, stored, index, children = frame
+            
+            if index < parent_item.childCount():
+                frame[2] = index + 1
+                child_item = parent_item.child(index)
+                child = child_item.data(0, Qt.ItemDataRole.UserRole)
+                if isinstance(child, LogicalOperation):
+                    stack.append([child_item, child, 0, []])
+                elif child is not None:
+                    children.append(child)
+                continue
+            
+            # All children built: reuse the stored operation when its child
+            # list is unchanged (results are read-only, so sharing is safe)
+            stack.pop()
+            if len(children) == len(stored.conditions) and all(
+                built is original for built, original in zip(children, stored.conditions)
+            ):
+                operation = stored
+            else:
+                operation = LogicalOperation(operator=stored.operator, conditions=children)
+            
+            if stack:
+                stack[-1][3].append(operation)
+            else:
+                result = operation
+        
+        return result
     
     def set_filter_expression(self, filter_expr: Optional[LogicalOperation]):
         """Populate tree widget from LogicalOperation structure."""
-        self.ui.filterTreeWidget.clear()
-        
-        if not filter_expr:
-            return
-        
-        # Create tree structure
-        root_item = self._filter_to_tree_item(filter_expr)
-        self.ui.filterTreeWidget.addTopLevelItem(root_item)
-        root_item.setExpanded(True)
-        
-        # Expand all children recursively
-        self._expand_all_children(root_item)
+        tree = self.ui.filterTreeWidget
+        self._last_editor_item = None
+        
+        # Rebuild with repaints and tree signals suspended, so the whole
+        # expression costs one relayout instead of one per inserted item
+        tree.setUpdatesEnabled(False)
+        blocker = QSignalBlocker(tree)
+        try:
+            tree.clear()
+            if filter_expr:
+                # Create tree structure
+                root_item = self._filter_to_tree_item(filter_expr)
+                tree.addTopLevelItem(root_item)
+                
+                # Expand every item natively (the tree only holds this expression)
+                tree.expandAll()
+        finally:
+            blocker.unblock()
+            tree.setUpdatesEnabled(True)
+        
+        # Selection signals were suppressed, so sync actions and editor once
+        self._tree_selection_changed()
     
     def _filter_to_tree_item(self, condition) -> QTreeWidgetItem:
         """Convert a filter condition to a tree item with children."""
-        item = self._create_tree_item(condition)
+        root_item = self._create_tree_item(condition)
         
-        # If it's a logical operation, convert children
-        if isinstance(condition, LogicalOperation):
-            for child_condition in condition.conditions:
-                child_item = self._filter_to_tree_item(child_condition)
-                item.addChild(child_item)
+        # Explicit stack of (condition, its tree item) still to expand
+        stack = [(condition, root_item)]
+        while stack:
+            parent_condition, parent_item = stack.pop()
+            if isinstance(parent_condition, LogicalOperation):
+                for child_condition in parent_condition.conditions:
+                    child_item = self._create_tree_item(child_condition)
+                    parent_item.addChild(child_item)
+                    stack.append((child_condition, child_item))
         
-        return item
-    
-    def _expand_all_children(self, item: QTreeWidgetItem):
-        """Recursively expand all children of an item."""
-        item.setExpanded(True)
-        for i in range(item.childCount()):
-            self._expand_all_children(item.child(i))
+        return root_item
     
     def reset_filters(self):
         """Reset all filters by clearing the tree."""
         self.ui.filterTreeWidget.clear()
+        self._last_editor_item = None
     
     def validate(self) -> tuple[bool, str]:
         """
@@ -4,13 +4,50 @@ Details panel widget for displaying context-sensitive information.
 This widget displays information about selected items in a key-value format.
 """
 
-from PySide6.QtWidgets import QWidget, QLabel, QFrame
+from contextlib import contextmanager
+
+from PySide6.QtWidgets import QWidget, QLabel, QFrame, QHBoxLayout
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont
 
 from bidsio.ui.forms.details_panel_ui import Ui_DetailsPanel
 
 
+class _KeyValueRow(QWidget):
+    """Row showing a bold key and its value as two plain-text labels."""
+    
+    def __init__(self, key_font: QFont, parent=None):
+        """Initialize the row with empty labels."""
+        super().__init__(parent)
+        
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(10, 2, 0, 2)
+        
+        selectable = (
+            Qt.TextInteractionFlag.TextSelectableByMouse | 
+            Qt.TextInteractionFlag.TextSelectableByKeyboard
+        )
+        
+        self.key_label = QLabel()
+        self.key_label.setTextFormat(Qt.TextFormat.PlainText)
+        self.key_label.setFont(key_font)
+        self.key_label.setTextInteractionFlags(selectable)
+        self.key_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+        layout.addWidget(self.key_label)
+        
+        self.value_label = QLabel()
+        self.value_label.setTextFormat(Qt.TextFormat.PlainText)
+        self.value_label.setTextInteractionFlags(selectable)
+        self.value_label.setWordWrap(True)
+        self.value_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+        layout.addWidget(self.value_label, 1)
+    
+    def set_pair(self, key: str, value: str):
+        """Set the key and value shown by the row."""
+        self.key_label.setText(f"{key}:")
+        self.value_label.setText(str(value))
+
+
 class DetailsPanel(QWidget):
     """
     Custom widget for displaying details about selected items.
@@ -31,27 +68,87 @@ class DetailsPanel(QWidget):
         
         # Get reference to the main layout from UI
         self._layout = self.ui.mainLayout
+        
+        # Placeholder label from the UI file, kept and reused by clear()
+        self._placeholder_label = self.ui.placeholderLabel
+        
+        # Pools of hidden row widgets by kind ('title', 'line', 'pair', 'empty'),
+        # reused instead of being destroyed and recreated on every update
+        self._pools: dict[str, list[QWidget]] = {'title': [], 'line': [], 'pair': [], 'empty': []}
+        self._widgets_in_use: list[tuple[str, QWidget]] = []
+        
+        # Bold font shared by every key label
+        self._key_font = QFont()
+        self._key_font.setBold(True)
     
-    def clear(self):
-        """Clear all content and show placeholder."""
-        # Remove all widgets from layout immediately to avoid double layout calculation
+    @contextmanager
+    def _batched_update(self):
+        """Suspend repaints and relayout while the panel content is rebuilt."""
+        self.setUpdatesEnabled(False)
+        self._layout.setEnabled(False)
+        try:
+            yield
+        finally:
+            self._layout.setEnabled(True)
+            self.setUpdatesEnabled(True)
+    
+    def _remove_all(self):
+        """Take every item out of the layout and return row widgets to their pools."""
         while self._layout.count() > 0:
             item = self._layout.takeAt(0)
             widget = item.widget()
             if widget:
-                widget.setParent(None)  # Remove from parent immediately
-                widget.deleteLater()    # Schedule for cleanup
-        
-        # Re-add placeholder and spacer
-        self.ui.placeholderLabel = QLabel("Select an item to view details")
-        self.ui.placeholderLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.ui.placeholderLabel.setWordWrap(True)
-        font = self.ui.placeholderLabel.font()
-        font.setPointSize(11)
-        font.setItalic(True)
-        self.ui.placeholderLabel.setFont(font)
-        self._layout.addWidget(self.ui.placeholderLabel)
-        self._layout.addStretch()
+                widget.hide()
+        
+        for kind, widget in self._widgets_in_use:
+            self._pools[kind].append(widget)
+        self._widgets_in_use.clear()
+    
+    def _acquire(self, kind: str) -> QWidget:
+        """
+        Get a row widget of the given kind, reusing a pooled one if available.
+        
+        Args:
+            kind: One of 'title', 'line', 'pair' or 'empty'.
+            
+        Returns:
+            A configured widget, added to the layout and shown.
+        """
+        pool = self._pools[kind]
+        widget = pool.pop() if pool else self._create_row_widget(kind)
+        self._widgets_in_use.append((kind, widget))
+        self._layout.addWidget(widget)
+        widget.show()
+        return widget
+    
+    def _create_row_widget(self, kind: str) -> QWidget:
+        """Create a new row widget of the given kind (text is set by the caller)."""
+        if kind == 'title':
+            widget = QLabel()
+            title_font = QFont()
+            title_font.setPointSize(12)
+            title_font.setBold(True)
+            widget.setFont(title_font)
+        elif kind == 'line':
+            widget = QFrame()
+            widget.setFrameShape(QFrame.Shape.HLine)
+            widget.setFrameShadow(QFrame.Shadow.Sunken)
+        elif kind == 'pair':
+            widget = _KeyValueRow(self._key_font)
+        else:
+            widget = QLabel("No data available")
+            widget.setStyleSheet("color: gray; font-style: italic;")
+        return widget
+    
+    def clear(self):
+        """Clear all content and show placeholder."""
+        with self._batched_update():
+            self._remove_all()
+            
+            # Re-add placeholder and spacer
+            self._layout.addWidget(self._placeholder_label)
+            self._placeholder_label.show()
+            self._layout.addStretch()
     
     def set_content(self, sections: list[dict]):
         """
@@ -67,20 +164,16 @@ class DetailsPanel(QWidget):
                     ]
                 }
         """
-        # Clear existing content immediately to avoid double layout calculation
-        while self._layout.count() > 0:
-            item = self._layout.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.setParent(None)  # Remove from parent immediately
-                widget.deleteLater()    # Schedule for cleanup
-        
-        # Add sections
-        for section in sections:
-            self._add_section(section['title'], section.get('items', []))
-        
-        # Add stretch at the end
-        self._layout.addStretch()
+        with self._batched_update():
+            # Clear existing content
+            self._remove_all()
+            
+            # Add sections
+            for section in sections:
+                self._add_section(section['title'], section.get('items', []))
+            
+            # Add stretch at the end
+            self._layout.addStretch()
     
     def _add_section(self, title: str, items: list[dict]):
         """
@@ -91,18 +184,11 @@ class DetailsPanel(QWidget):
             items: List of {'key': ..., 'value': ...} dictionaries.
         """
         # Section title
-        title_label = QLabel(title)
-        title_font = QFont()
-        title_font.setPointSize(12)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
-        self._layout.addWidget(title_label)
+        title_label = self._acquire('title')
+        title_label.setText(title)
         
         # Separator line
-        line = QFrame()
-        line.setFrameShape(QFrame.Shape.HLine)
-        line.setFrameShadow(QFrame.Shadow.Sunken)
-        self._layout.addWidget(line)
+        self._acquire('line')
         
         # Key-value pairs
         if items:
@@ -112,9 +198,7 @@ class DetailsPanel(QWidget):
                 self._add_key_value_pair(key, value)
         else:
             # No items in section
-            no_data_label = QLabel("No data available")
-            no_data_label.setStyleSheet("color: gray; font-style: italic;")
-            self._layout.addWidget(no_data_label)
+            self._acquire('empty')
         
         # Add spacing after section
         self._layout.addSpacing(15)
@@ -127,16 +211,7 @@ class DetailsPanel(QWidget):
             key: The key/label.
             value: The value.
         """
-        # Create a single label with key and value on the same line
-        label = QLabel()
-        label.setTextInteractionFlags(
-            Qt.TextInteractionFlag.TextSelectableByMouse | 
-            Qt.TextInteractionFlag.TextSelectableByKeyboard
-        )
-        label.setWordWrap(True)
-        label.setContentsMargins(10, 2, 0, 2)
-        
-        # Format: bold key, normal value
-        label.setText(f"<b>{key}:</b> {value}")
-        
-        self._layout.addWidget(label)
+        # Bold key and normal value as plain text, so no rich-text parsing
+        # and no markup interpretation of characters like '<' in the data
+        row = self._acquire('pair')
+        row.set_pair(key, value)
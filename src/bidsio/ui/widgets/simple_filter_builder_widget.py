@@ -5,10 +5,14 @@ Provides a simple interface for building filter expressions with rows of conditi
 combined with AND logic. Ideal for straightforward filtering needs.
 """
 
+import re
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from functools import partial
 from typing import Optional
 
 from PySide6.QtWidgets import QWidget, QHBoxLayout, QComboBox, QLineEdit, QPushButton
-from PySide6.QtCore import Slot
+from PySide6.QtCore import Slot, QSignalBlocker
 
 from bidsio.infrastructure.logging_config import get_logger
 from bidsio.core.models import BIDSDataset
@@ -26,6 +30,113 @@ from bidsio.ui.forms.simple_filter_builder_widget_ui import Ui_SimpleFilterBuild
 
 logger = get_logger(__name__)
 
+# Row values that are converted to int or float before building a condition
+_INT_RE = re.compile(r"[+-]?\d+")
+_FLOAT_RE = re.compile(r"[+-]?(?:\d+\.\d*|\.\d+|\d+(?=[eE]))(?:[eE][+-]?\d+)?")
+
+
+class LazyFilterCombo(QComboBox):
+    """
+    Combo box that only holds its current item until it is first used.
+    
+    The full item list comes from a provider callable and is inserted the
+    first time the dropdown is shown or the combo receives a key press or
+    wheel event, so rows that are never used do not pay for populating long
+    entity or attribute lists, while keyboard and wheel selection still work.
+    """
+    
+    def __init__(self, items_provider: Callable[[], Sequence[str]], parent=None):
+        """
+        Initialize the combo box.
+        
+        Args:
+            items_provider: Callable returning the full list of items.
+            parent: Parent widget.
+        """
+        super().__init__(parent)
+        
+        self._items_provider = items_provider
+        self._populated = False
+    
+    def reset_items(self, current: Optional[str] = None):
+        """
+        Show only the current item, deferring the full list to the next popup.
+        
+        Args:
+            current: Item to select; the first provided item is used if it is
+                None or not in the list.
+        """
+        items = self._items_provider()
+        if current is None or current not in items:
+            current = items[0] if items else None
+        
+        # Repopulate silently; nothing should react to the transient states
+        blocker = QSignalBlocker(self)
+        try:
+            self.clear()
+            if current is not None:
+                self.addItem(current)
+        finally:
+            blocker.unblock()
+        self._populated = False
+    
+    def _ensure_populated(self):
+        """Insert the full item list if it has not been inserted yet."""
+        if self._populated:
+            return
+        self._populated = True
+        current = self.currentText()
+        
+        # The selection ends up unchanged, so no change signals are needed
+        blocker = QSignalBlocker(self)
+        try:
+            self.clear()
+            self.addItems(self._items_provider())
+            self.setCurrentIndex(max(self.findText(current), 0))
+        finally:
+            blocker.unblock()
+    
+    def showPopup(self):
+        """Insert the full item list on first use, then show the popup."""
+        self._ensure_populated()
+        super().showPopup()
+    
+    def keyPressEvent(self, event):
+        """Insert the full item list so arrow keys and type-ahead can select from it."""
+        self._ensure_populated()
+        super().keyPressEvent(event)
+    
+    def wheelEvent(self, event):
+        """Insert the full item list so the wheel can select from it."""
+        self._ensure_populated()
+        super().wheelEvent(event)
+
+
+@dataclass(slots=True)
+class _FilterRow:
+    """Widgets making up one filter condition row."""
+    
+    widget: QWidget
+    """Container widget owning the row."""
+    
+    layout: QHBoxLayout
+    """Horizontal layout of the row's controls."""
+    
+    type_combo: QComboBox
+    """Filter type dropdown."""
+    
+    subtype_combo: LazyFilterCombo
+    """Entity code / attribute name dropdown."""
+    
+    operator_combo: QComboBox
+    """Operator dropdown."""
+    
+    value_input: QLineEdit
+    """Value text field."""
+    
+    delete_button: QPushButton
+    """Button removing the row."""
+
 
 class SimpleFilterBuilderWidget(QWidget):
     """
@@ -35,6 +146,40 @@ class SimpleFilterBuilderWidget(QWidget):
     Each row specifies a filter type, optional subtype, operator, and value.
     """
     
+    # Operators offered for entity and attribute filters (tuples keep display order)
+    _ENTITY_OPS = ('equals', 'not_equals', 'contains')
+    _ENTITY_OPS_SET = frozenset(_ENTITY_OPS)
+    _ATTR_OPS = ('equals', 'not_equals', 'contains', 'greater_than', 'less_than')
+    _ATTR_OPS_SET = frozenset(_ATTR_OPS)
+    
+    # Filter type -> builder of its condition from (subtype, operator, value text, converted value)
+    _FILTER_BUILDERS = {
+        "Subject ID": lambda subtype, operator, text, value: SubjectIdFilter(subject_id=text),
+        "Modality": lambda subtype, operator, text, value: ModalityFilter(modality=text),
+        "Entity": lambda subtype, operator, text, value: EntityFilter(
+            entity_code=subtype, operator=operator, value=str(value)
+        ),
+        "Subject Attribute": lambda subtype, operator, text, value: ParticipantAttributeFilter(
+            attribute_name=subtype, operator=operator, value=str(value)
+        ),
+        "Channel Attribute": lambda subtype, operator, text, value: ChannelAttributeFilter(
+            attribute_name=subtype, operator=operator, value=str(value)
+        ),
+        "Electrode Attribute": lambda subtype, operator, text, value: ElectrodeAttributeFilter(
+            attribute_name=subtype, operator=operator, value=str(value)
+        ),
+    }
+    
+    # Condition type -> (filter type, subtype, operator, value) of its row
+    _FILTER_ROW_FIELDS = {
+        SubjectIdFilter: lambda c: ("Subject ID", None, "equals", c.subject_id),
+        ModalityFilter: lambda c: ("Modality", None, "equals", c.modality),
+        EntityFilter: lambda c: ("Entity", c.entity_code, c.operator, c.value),
+        ParticipantAttributeFilter: lambda c: ("Subject Attribute", c.attribute_name, c.operator, c.value),
+        ChannelAttributeFilter: lambda c: ("Channel Attribute", c.attribute_name, c.operator, c.value),
+        ElectrodeAttributeFilter: lambda c: ("Electrode Attribute", c.attribute_name, c.operator, c.value),
+    }
+    
     def __init__(self, dataset: BIDSDataset, parent=None):
         """
         Initialize the simple filter builder widget.
@@ -50,12 +195,14 @@ class SimpleFilterBuilderWidget(QWidget):
         # Discover available filter options from dataset
         self._available_modalities = list(dataset.get_all_modalities())
         self._available_entities = dataset.get_all_entities()
-        self._participant_attributes = self._get_participant_attributes()
-        self._channel_attributes = self._get_channel_attributes()
-        self._electrode_attributes = self._get_electrode_attributes()
+        self._available_entity_codes = tuple(self._available_entities.keys())
+        # Attribute names are memoized by the dataset across builder instances
+        self._participant_attributes = dataset.get_all_participant_attributes()
+        self._channel_attributes = dataset.get_all_channel_attributes()
+        self._electrode_attributes = dataset.get_all_electrode_attributes()
         
-        # Filter rows (list of row widgets)
-        self._filter_rows = []
+        # Filter rows, keyed by their container widget (in display order)
+        self._filter_rows: dict[QWidget, _FilterRow] = {}
         
         self._setup_ui()
         self._connect_signals()
@@ -81,7 +228,10 @@ class SimpleFilterBuilderWidget(QWidget):
             operator: Pre-select operator
             value: Pre-fill value
         """
-        row_layout = QHBoxLayout()
+        # Container widget owning the whole row, so it can be removed in one go
+        row_widget = QWidget()
+        row_layout = QHBoxLayout(row_widget)
+        row_layout.setContentsMargins(0, 0, 0, 0)
         row_layout.setSpacing(6)
         
         # Type dropdown
@@ -97,15 +247,13 @@ class SimpleFilterBuilderWidget(QWidget):
         if filter_type:
             type_combo.setCurrentText(filter_type)
         
-        # Subtype dropdown (entity, attribute, etc.) - dynamic based on type
-        subtype_combo = QComboBox()
+        # Subtype dropdown (entity, attribute, etc.) - dynamic based on type,
+        # filled with its full list only when the dropdown is first opened
+        subtype_combo = LazyFilterCombo(lambda: self._subtypes_for(type_combo.currentText()))
         subtype_combo.setMinimumWidth(120)
         
-        # Operator dropdown
+        # Operator dropdown - filled once below, based on type
         operator_combo = QComboBox()
-        operator_combo.addItems(['equals', 'contains', 'greater_than', 'less_than'])
-        if operator:
-            operator_combo.setCurrentText(operator)
         
         # Value input
         value_input = QLineEdit()
@@ -125,166 +273,125 @@ class SimpleFilterBuilderWidget(QWidget):
         row_layout.addWidget(delete_button, 0)
         
         # Store row info
-        row_data = {
-            'layout': row_layout,
-            'type_combo': type_combo,
-            'subtype_combo': subtype_combo,
-            'operator_combo': operator_combo,
-            'value_input': value_input,
-            'delete_button': delete_button
-        }
-        self._filter_rows.append(row_data)
+        row_data = _FilterRow(
+            widget=row_widget,
+            layout=row_layout,
+            type_combo=type_combo,
+            subtype_combo=subtype_combo,
+            operator_combo=operator_combo,
+            value_input=value_input,
+            delete_button=delete_button
+        )
+        self._filter_rows[row_widget] = row_data
         
         # Connect signals
-        type_combo.currentTextChanged.connect(lambda: self._update_row_subtypes(row_data))
-        type_combo.currentTextChanged.connect(lambda: self._update_row_operators(row_data))
+        type_combo.currentTextChanged.connect(partial(self._on_type_changed, row_data))
         delete_button.clicked.connect(lambda: self._delete_filter_row(row_data))
         
         # Add row to layout
-        self.ui.filterRowsLayout.addLayout(row_layout)
+        self.ui.filterRowsLayout.addWidget(row_widget)
         
-        # Update subtypes and operators based on selected type
+        # Update subtypes and operators based on selected type (restoring them if provided)
+        self._update_row_subtypes(row_data, subtype)
+        self._update_row_operators(row_data, operator)
+    
+    def _on_type_changed(self, row_data: _FilterRow, _filter_type: str = ""):
+        """Update subtypes and operators of a row after its filter type changed."""
         self._update_row_subtypes(row_data)
         self._update_row_operators(row_data)
-        
-        # Restore subtype if provided
-        if subtype and subtype_combo.count() > 0:
-            index = subtype_combo.findText(subtype)
-            if index >= 0:
-                subtype_combo.setCurrentIndex(index)
     
-    def _update_row_subtypes(self, row_data: dict):
-        """Update the subtype dropdown based on selected filter type."""
-        filter_type = row_data['type_combo'].currentText()
-        subtype_combo = row_data['subtype_combo']
+    def _update_row_subtypes(self, row_data: _FilterRow, current: Optional[str] = None):
+        """
+        Update the subtype dropdown based on selected filter type.
         
-        # Clear existing items
-        subtype_combo.clear()
+        Args:
+            row_data: The filter row to update.
+            current: Subtype to select if available (defaults to the first one).
+        """
+        filter_type = row_data.type_combo.currentText()
+        subtype_combo = row_data.subtype_combo
         
-        if filter_type == "Subject ID":
-            subtype_combo.setEnabled(False)
-            subtype_combo.addItem("(not applicable)")
-            
-        elif filter_type == "Modality":
-            subtype_combo.setEnabled(False)
-            subtype_combo.addItem("(not applicable)")
-            
-        elif filter_type == "Entity":
-            subtype_combo.setEnabled(True)
-            for entity_code in self._available_entities.keys():
-                subtype_combo.addItem(entity_code)
+        subtype_combo.setEnabled(filter_type not in ("Subject ID", "Modality"))
+        subtype_combo.reset_items(current)
+    
+    def _subtypes_for(self, filter_type: str) -> Sequence[str]:
+        """
+        Get the subtypes available for a filter type.
+        
+        Args:
+            filter_type: The filter type shown in the type dropdown.
             
+        Returns:
+            Entity codes or attribute names, or a single placeholder for
+            types without subtypes.
+        """
+        if filter_type == "Entity":
+            return self._available_entity_codes
         elif filter_type == "Subject Attribute":
-            subtype_combo.setEnabled(True)
-            for attr in self._participant_attributes:
-                subtype_combo.addItem(attr)
-            
+            return self._participant_attributes
         elif filter_type == "Channel Attribute":
-            subtype_combo.setEnabled(True)
-            for attr in self._channel_attributes:
-                subtype_combo.addItem(attr)
-            
+            return self._channel_attributes
         elif filter_type == "Electrode Attribute":
-            subtype_combo.setEnabled(True)
-            for attr in self._electrode_attributes:
-                subtype_combo.addItem(attr)
+            return self._electrode_attributes
+        else:
+            return ["(not applicable)"]
     
-    def _update_row_operators(self, row_data: dict):
-        """Update the operator dropdown based on selected filter type."""
-        filter_type = row_data['type_combo'].currentText()
-        operator_combo = row_data['operator_combo']
-        
-        # Remember current selection if valid
-        current_operator = operator_combo.currentText()
+    def _update_row_operators(self, row_data: _FilterRow, current: Optional[str] = None):
+        """
+        Update the operator dropdown based on selected filter type.
         
-        # Clear existing items
-        operator_combo.clear()
+        Args:
+            row_data: The filter row to update.
+            current: Operator to select if valid (defaults to the current one).
+        """
+        filter_type = row_data.type_combo.currentText()
+        operator_combo = row_data.operator_combo
         
-        # Set operators based on filter type
-        if filter_type in ["Subject ID", "Modality"]:
-            # These filters only support exact matching (list-based)
-            operator_combo.addItem("equals")
-            operator_combo.setEnabled(False)  # Disable since only one option
-            
-        elif filter_type == "Entity":
-            # Entity filters support equals, not_equals, and contains
-            operator_combo.addItems(['equals', 'not_equals', 'contains'])
-            operator_combo.setEnabled(True)
-            
-            # Restore previous selection if it was valid
-            if current_operator in ['equals', 'not_equals', 'contains']:
-                operator_combo.setCurrentText(current_operator)
-            
-        elif filter_type in ["Subject Attribute", "Channel Attribute", "Electrode Attribute"]:
-            # These support all operators
-            operator_combo.addItems(['equals', 'not_equals', 'contains', 'greater_than', 'less_than'])
-            operator_combo.setEnabled(True)
+        # Remember current selection if valid
+        current_operator = current or operator_combo.currentText()
+        
+        # Repopulate with signals blocked, so clearing and refilling does not
+        # emit a change for every intermediate state
+        blocker = QSignalBlocker(operator_combo)
+        try:
+            # Clear existing items
+            operator_combo.clear()
             
-            # Restore previous selection if it was valid
-            if current_operator in ['equals', 'not_equals', 'contains', 'greater_than', 'less_than']:
-                operator_combo.setCurrentText(current_operator)
+            # Set operators based on filter type, each list inserted in one call
+            if filter_type in ["Subject ID", "Modality"]:
+                # These filters only support exact matching (list-based)
+                operator_combo.addItems(["equals"])
+                operator_combo.setEnabled(False)  # Disable since only one option
+                
+            elif filter_type == "Entity":
+                # Entity filters support equals, not_equals, and contains
+                operator_combo.addItems(self._ENTITY_OPS)
+                operator_combo.setEnabled(True)
+                
+                # Restore previous selection if it was valid
+                if current_operator in self._ENTITY_OPS_SET:
+                    operator_combo.setCurrentText(current_operator)
+                
+            elif filter_type in ["Subject Attribute", "Channel Attribute", "Electrode Attribute"]:
+                # These support all operators
+                operator_combo.addItems(self._ATTR_OPS)
+                operator_combo.setEnabled(True)
+                
+                # Restore previous selection if it was valid
+                if current_operator in self._ATTR_OPS_SET:
+                    operator_combo.setCurrentText(current_operator)
+        finally:
+            blocker.unblock()
     
-    def _delete_filter_row(self, row_data: dict):
+    def _delete_filter_row(self, row_data: _FilterRow):
         """Delete a filter row."""
-        # Remove from layout
-        layout = row_data['layout']
-        while layout.count():
-            item = layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        # Removing the container widget takes all of the row's children with it
+        row_widget = row_data.widget
+        self.ui.filterRowsLayout.removeWidget(row_widget)
+        row_widget.deleteLater()
         
-        # Remove layout itself
-        self.ui.filterRowsLayout.removeItem(layout)
-        layout.deleteLater()
-        
-        # Remove from list
-        self._filter_rows.remove(row_data)
-    
-    def _get_participant_attributes(self) -> list[str]:
-        """
-        Get list of available participant attributes from participants.tsv.
-        
-        Returns:
-            List of attribute names (column headers).
-        """
-        attributes = set()
-        for subject in self._dataset.subjects:
-            attributes.update(subject.metadata.keys())
-        return sorted(attributes)
-    
-    def _get_channel_attributes(self) -> list[str]:
-        """
-        Get list of available channel attributes from _channels.tsv files.
-        
-        Returns:
-            List of attribute names (column headers).
-        """
-        attributes = set()
-        for subject in self._dataset.subjects:
-            if subject.ieeg_data and subject.ieeg_data.channels:
-                # channels is a dict[Path, list[dict]]
-                for channel_list in subject.ieeg_data.channels.values():
-                    if len(channel_list) > 0:
-                        attributes.update(channel_list[0].keys())
-                        break  # Only need first channel to get attribute names
-        return sorted(attributes)
-    
-    def _get_electrode_attributes(self) -> list[str]:
-        """
-        Get list of available electrode attributes from _electrodes.tsv files.
-        
-        Returns:
-            List of attribute names (column headers).
-        """
-        attributes = set()
-        for subject in self._dataset.subjects:
-            if subject.ieeg_data and subject.ieeg_data.electrodes:
-                # electrodes is a dict[Path, list[dict]]
-                for electrode_list in subject.ieeg_data.electrodes.values():
-                    if len(electrode_list) > 0:
-                        attributes.update(electrode_list[0].keys())
-                        break  # Only need first electrode to get attribute names
-        return sorted(attributes)
+        # Remove from rows
+        del self._filter_rows[row_widget]
     
     def get_filter_expression(self, include_incomplete: bool = False) -> Optional[LogicalOperation]:
         """
@@ -299,67 +406,28 @@ class SimpleFilterBuilderWidget(QWidget):
         conditions = []
         
         # Process each filter row
-        for row_data in self._filter_rows:
-            filter_type = row_data['type_combo'].currentText()
-            subtype = row_data['subtype_combo'].currentText()
-            operator = row_data['operator_combo'].currentText()
-            value_text = row_data['value_input'].text().strip()
+        for row_data in self._filter_rows.values():
+            filter_type = row_data.type_combo.currentText()
+            subtype = row_data.subtype_combo.currentText()
+            operator = row_data.operator_combo.currentText()
+            value_text = row_data.value_input.text().strip()
             
             # Skip rows without a value (unless include_incomplete is True)
             if not value_text and not include_incomplete:
                 continue
             
-            # Convert value to appropriate type
+            # Convert value to appropriate type (checked by pattern, so plain
+            # text values do not go through two failed conversions)
             value = value_text
-            if value_text:
-                try:
-                    value = int(value_text)
-                except ValueError:
-                    try:
-                        value = float(value_text)
-                    except ValueError:
-                        value = value_text
+            if _INT_RE.fullmatch(value_text):
+                value = int(value_text)
+            elif _FLOAT_RE.fullmatch(value_text):
+                value = float(value_text)
             
             # Create condition based on type
-            if filter_type == "Subject ID":
-                condition = SubjectIdFilter(subject_id=value_text)
-                conditions.append(condition)
-            
-            elif filter_type == "Modality":
-                condition = ModalityFilter(modality=value_text)
-                conditions.append(condition)
-            
-            elif filter_type == "Entity":
-                condition = EntityFilter(
-                    entity_code=subtype,
-                    operator=operator,
-                    value=str(value)
-                )
-                conditions.append(condition)
-            
-            elif filter_type == "Subject Attribute":
-                condition = ParticipantAttributeFilter(
-                    attribute_name=subtype,
-                    operator=operator,
-                    value=str(value)
-                )
-                conditions.append(condition)
-            
-            elif filter_type == "Channel Attribute":
-                condition = ChannelAttributeFilter(
-                    attribute_name=subtype,
-                    operator=operator,
-                    value=str(value)
-                )
-                conditions.append(condition)
-            
-            elif filter_type == "Electrode Attribute":
-                condition = ElectrodeAttributeFilter(
-                    attribute_name=subtype,
-                    operator=operator,
-                    value=str(value)
-                )
-                conditions.append(condition)
+            builder = self._FILTER_BUILDERS.get(filter_type)
+            if builder is not None:
+                conditions.append(builder(subtype, operator, value_text, value))
         
         # Create logical operation (AND all conditions)
         if conditions:
@@ -386,68 +454,54 @@ class SimpleFilterBuilderWidget(QWidget):
         
         # Create a row for each condition in the filter
         for condition in filter_expr.conditions:
-            if isinstance(condition, SubjectIdFilter):
-                self._add_filter_row("Subject ID", None, "equals", condition.subject_id)
-                
-            elif isinstance(condition, ModalityFilter):
-                self._add_filter_row("Modality", None, "equals", condition.modality)
-                
-            elif isinstance(condition, EntityFilter):
-                self._add_filter_row("Entity", condition.entity_code, condition.operator, condition.value)
-            
-            elif isinstance(condition, ParticipantAttributeFilter):
-                self._add_filter_row(
-                    "Subject Attribute",
-                    condition.attribute_name,
-                    condition.operator,
-                    condition.value
-                )
-            
-            elif isinstance(condition, ChannelAttributeFilter):
-                self._add_filter_row(
-                    "Channel Attribute",
-                    condition.attribute_name,
-                    condition.operator,
-                    condition.value
-                )
-            
-            elif isinstance(condition, ElectrodeAttributeFilter):
-                self._add_filter_row(
-                    "Electrode Attribute",
-                    condition.attribute_name,
-                    condition.operator,
-                    condition.value
-                )
+            row_fields = self._FILTER_ROW_FIELDS.get(type(condition))
+            if row_fields is not None:
+                self._add_filter_row(*row_fields(condition))
     
     def reset_filters(self):
         """Reset all filters by removing all rows."""
-        # Remove all rows
-        for row_data in self._filter_rows.copy():
-            self._delete_filter_row(row_data)
+        # Remove all row containers, then drop the bookkeeping in one go
+        rows_layout = self.ui.filterRowsLayout
+        for row_widget in self._filter_rows:
+            rows_layout.removeWidget(row_widget)
+            row_widget.deleteLater()
         self._filter_rows.clear()
     
+    def is_valid(self) -> bool:
+        """
+        Check that all rows are complete, stopping at the first incomplete one.
+        
+        Returns:
+            True if every row is complete.
+        """
+        return not any(self._row_is_incomplete(row_data) for row_data in self._filter_rows.values())
+    
     def validate(self) -> tuple[bool, str]:
         """
         Validate that all rows are complete.
         
+        Use is_valid() when the error message is not needed.
+        
         Returns:
             Tuple of (is_valid, error_message)
         """
-        if not self._filter_rows:
+        # Common case: everything is complete, found without listing rows
+        if self.is_valid():
             return True, ""
         
-        incomplete_rows = []
-        for i, row_data in enumerate(self._filter_rows):
-            filter_type = row_data['type_combo'].currentText()
-            subtype = row_data['subtype_combo'].currentText()
-            
-            # Check if subtype is needed and selected
-            if filter_type in ["Entity", "Subject Attribute", "Channel Attribute", "Electrode Attribute"]:
-                if not subtype or subtype == "(not applicable)":
-                    incomplete_rows.append(i + 1)
-        
-        if incomplete_rows:
-            rows_str = ", ".join(str(r) for r in incomplete_rows)
-            return False, f"Incomplete filters in row(s): {rows_str}"
-        
-        return True, ""
+        incomplete_rows = [
+            i + 1
+            for i, row_data in enumerate(self._filter_rows.values())
+            if self._row_is_incomplete(row_data)
+        ]
+        rows_str = ", ".join(str(r) for r in incomplete_rows)
+        return False, f"Incomplete filters in row(s): {rows_str}"
+    
+    def _row_is_incomplete(self, row_data: _FilterRow) -> bool:
+        """Check if a row needs a subtype (entity or attribute) but has none selected."""
+        filter_type = row_data.type_combo.currentText()
+        if filter_type not in ["Entity", "Subject Attribute", "Channel Attribute", "Electrode Attribute"]:
+            return False
+        
+        subtype = row_data.subtype_combo.currentText()
+        return not subtype or subtype == "(not applicable)"
@@ -1,13 +1,17 @@
 """
-Worker threads for background operations.
+Workers for background operations.
 
-This module provides worker threads for long-running operations that should
-not block the UI thread, such as dataset loading and exporting.
+This module provides runnables for long-running operations that should
+not block the UI thread, such as dataset loading and exporting. They run
+on Qt's global thread pool, so repeated operations reuse pooled threads
+instead of creating and tearing down a thread each time.
 """
 
+import threading
+import time
 from pathlib import Path
 
-from PySide6.QtCore import QThread, Signal
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
 
 from bidsio.core.repository import BidsRepository
 from bidsio.core.export import ExportRequest, export_dataset
@@ -16,14 +20,12 @@ from bidsio.infrastructure.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Minimum time between two progress signals (~30 updates per second)
+_PROGRESS_INTERVAL_NS = 33_000_000
 
-class DatasetLoaderThread(QThread):
-    """
-    Worker thread for loading BIDS datasets without blocking the UI.
-    
-    This thread runs the dataset loading operation in the background and
-    emits signals to update the progress dialog and notify completion.
-    """
+
+class DatasetLoaderSignals(QObject):
+    """Signals emitted by a DatasetLoaderRunnable."""
     
     # Signal emitted when progress updates (current, total, message)
     progress_updated = Signal(int, int, str)
@@ -33,27 +35,46 @@ class DatasetLoaderThread(QThread):
     
     # Signal emitted when an error occurs (exception)
     loading_error = Signal(Exception)
+
+
+class DatasetLoaderRunnable(QRunnable):
+    """
+    Worker for loading BIDS datasets without blocking the UI.
     
-    def __init__(self, repository: BidsRepository, parent=None):
+    This runnable performs the dataset loading operation on a pooled thread
+    and emits signals (through `signals`) to update the progress dialog and
+    notify completion.
+    """
+    
+    def __init__(self, repository: BidsRepository):
         """
-        Initialize the loader thread.
+        Initialize the loader.
         
         Args:
             repository: BidsRepository instance to use for loading.
-            parent: Parent QObject.
         """
-        super().__init__(parent)
+        super().__init__()
         self._repository = repository
+        self.signals = DatasetLoaderSignals()
+        self._last_progress_ns = 0
+        
+        # Keep the runnable (and its signals object) owned by Python, so the
+        # pool does not delete it while queued signals are still pending
+        self.setAutoDelete(False)
+    
+    def start(self):
+        """Queue the loading operation on the global thread pool."""
+        QThreadPool.globalInstance().start(self)
     
     def run(self):
         """Run the dataset loading operation."""
         try:
             # Load dataset with progress callback
             dataset = self._repository.load(progress_callback=self._progress_callback)
-            self.loading_complete.emit(dataset)
+            self.signals.loading_complete.emit(dataset)
         except Exception as e:
-            logger.error(f"Error loading dataset in thread: {e}", exc_info=True)
-            self.loading_error.emit(e)
+            logger.error(f"Error loading dataset in worker: {e}", exc_info=True)
+            self.signals.loading_error.emit(e)
     
     def _progress_callback(self, current: int, total: int, message: str):
         """
@@ -64,37 +85,61 @@ class DatasetLoaderThread(QThread):
             total: Total progress value.
             message: Status message.
         """
-        self.progress_updated.emit(current, total, message)
+        # Throttle cross-thread updates, but never drop the final one
+        now = time.monotonic_ns()
+        if now - self._last_progress_ns < _PROGRESS_INTERVAL_NS and current != total:
+            return
+        self._last_progress_ns = now
+        self.signals.progress_updated.emit(current, total, message)
 
 
-class ExportWorkerThread(QThread):
+class ExportWorkerSignals(QObject):
     """
-    Worker thread for exporting BIDS dataset subsets without blocking the UI.
+    Signals emitted by an ExportWorkerRunnable.
     
-    This thread runs the export operation in the background and emits signals
-    to update the progress dialog and notify completion.
+    Progress is not signalled; it is polled with ExportWorkerRunnable.progress().
     """
     
-    # Signal emitted when progress updates (current, total, filename)
-    progress_updated = Signal(int, int, str)
-    
     # Signal emitted when export is complete (output_path)
     export_complete = Signal(Path)
     
     # Signal emitted when an error occurs (error_message)
     export_error = Signal(str)
+
+
+class ExportWorkerRunnable(QRunnable):
+    """
+    Worker for exporting BIDS dataset subsets without blocking the UI.
+    
+    This runnable performs the export operation on a pooled thread and emits
+    signals (through `signals`) to notify completion. Per-file progress is
+    only recorded in shared state, which the UI polls with progress() at its
+    own refresh rate, so no signal crosses threads for each copied file.
+    """
     
-    def __init__(self, export_request: ExportRequest, parent=None):
+    def __init__(self, export_request: ExportRequest):
         """
-        Initialize the export worker thread.
+        Initialize the export worker.
         
         Args:
             export_request: ExportRequest with configuration.
-            parent: Parent QObject.
         """
-        super().__init__(parent)
+        super().__init__()
         self._export_request = export_request
-        self._cancelled = False
+        # QRunnable has no interruption API, so cancellation is a shared flag
+        self._cancelled = threading.Event()
+        self.signals = ExportWorkerSignals()
+        
+        # Latest (current, total, filepath) progress, written by the worker
+        self._progress_lock = threading.Lock()
+        self._progress_state: tuple[int, int, str] = (0, 0, "")
+        
+        # Owned by Python, like DatasetLoaderRunnable
+        self.setAutoDelete(False)
+    
+    def start(self):
+        """Queue the export operation on the global thread pool."""
+        QThreadPool.globalInstance().start(self)
     
     def run(self):
         """Run the export operation."""
@@ -105,17 +150,17 @@ class ExportWorkerThread(QThread):
                 progress_callback=self._progress_callback
             )
             
-            if not self._cancelled:
-                self.export_complete.emit(output_path)
-                
+            if not self._cancelled.is_set():
+                self.signals.export_complete.emit(output_path)
+        
         except Exception as e:
-            logger.error(f"Error exporting dataset in thread: {e}", exc_info=True)
-            if not self._cancelled:
-                self.export_error.emit(str(e))
+            logger.error(f"Error exporting dataset in worker: {e}", exc_info=True)
+            if not self._cancelled.is_set():
+                self.signals.export_error.emit(str(e))
     
     def cancel(self):
         """Cancel the export operation."""
-        self._cancelled = True
+        self._cancelled.set()
         logger.info("Export cancelled by user")
     
     def _progress_callback(self, current: int, total: int, filepath: Path):
@@ -127,5 +172,18 @@ class ExportWorkerThread(QThread):
             total: Total number of files.
             filepath: Path of current file being copied.
         """
-        if not self._cancelled:
-            self.progress_updated.emit(current, total, str(filepath))
+        if self._cancelled.is_set():
+            return
+        
+        with self._progress_lock:
+            self._progress_state = (current, total, str(filepath))
+    
+    def progress(self) -> tuple[int, int, str]:
+        """
+        Get the latest export progress (safe to call from the UI thread).
+        
+        Returns:
+            Tuple of (current file number, total number of files, current file path).
+        """
+        with self._progress_lock:
+            return self._progress_state
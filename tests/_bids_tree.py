@@ -0,0 +1,62 @@
+"""
+Helpers for building BIDS directory trees in tests.
+"""
+
+import os
+from pathlib import Path
+
+
+def write_bids_tree(root: Path, files: dict[str, bytes | str | None]):
+    """
+    Create files with the given contents (and their parent directories) under root.
+    
+    Files are grouped by parent directory: each directory is created once and,
+    where the platform supports it, opened once so its files are created
+    relative to the directory descriptor instead of resolving the full path
+    for every file.
+    
+    Args:
+        root: Directory to build the tree in (created if missing).
+        files: Mapping of file paths relative to root (using '/' as separator)
+            to their contents. A None value only creates the parent
+            directories; use a key ending in '/' for an empty directory.
+    """
+    by_directory: dict[str, list[tuple[str, bytes | str]]] = {}
+    for f, content in files.items():
+        directory, name = os.path.split(f)
+        entries = by_directory.setdefault(directory, [])
+        if content is not None:
+            entries.append((name, content))
+    
+    use_dir_fd = os.open in os.supports_dir_fd
+    flags = os.O_CREAT | os.O_WRONLY | os.O_TRUNC
+    
+    for directory, entries in by_directory.items():
+        path = os.path.join(root, directory)
+        os.makedirs(path, exist_ok=True)
+        if not entries:
+            continue
+        
+        dir_fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY) if use_dir_fd else None
+        try:
+            for name, content in entries:
+                target = name if dir_fd is not None else os.path.join(path, name)
+                fd = os.open(target, flags, 0o644, dir_fd=dir_fd)
+                try:
+                    os.write(fd, content.encode() if isinstance(content, str) else content)
+                finally:
+                    os.close(fd)
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+
+
+def make_bids_tree(root: Path, files: list[str]):
+    """
+    Create empty files (and their parent directories) under root.
+    
+    Args:
+        root: Directory to build the tree in.
+        files: File paths relative to root, using '/' as separator.
+    """
+    write_bids_tree(root, dict.fromkeys(files, b''))
@@ -7,6 +7,7 @@ This file contains pytest configuration and reusable test fixtures.
 import pytest
 from pathlib import Path
 from typing import Generator
+import json
 import tempfile
 import shutil
 
@@ -15,10 +16,53 @@ from src.bidsio.core.models import (
     BIDSSubject,
     BIDSSession,
     BIDSFile,
-    BIDSDerivative,
-    ExportRequest,
-    SelectedEntities
+    BIDSDerivative
 )
+from src.bidsio.core.export import ExportRequest, SelectedEntities
+from src.bidsio.infrastructure.bids_loader import BidsLoader
+from tests._bids_tree import write_bids_tree
+
+try:
+    import pyfakefs  # noqa: F401
+    HAS_PYFAKEFS = True
+except ImportError:
+    HAS_PYFAKEFS = False
+
+
+def pytest_configure(config):
+    """Register the custom markers used by the test suite."""
+    config.addinivalue_line(
+        "markers",
+        "serial: test must not run concurrently with other serial tests under pytest-xdist"
+    )
+    config.addinivalue_line(
+        "markers",
+        "integration: test loads a dataset from disk with BidsLoader"
+    )
+    config.addinivalue_line(
+        "markers",
+        "fast: test only builds models in memory (select with -m fast for a quick run)"
+    )
+    # Also registered by pytest-xdist; declared here so runs without it stay warning-free
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): run all tests of the group on the same pytest-xdist worker"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Pin tests marked as serial to a single pytest-xdist worker.
+    
+    Only takes effect with `--dist=loadgroup`; everything else is spread
+    across workers test by test.
+    """
+    if not config.pluginmanager.hasplugin("xdist"):
+        return
+    
+    for item in items:
+        if item.get_closest_marker("serial"):
+            item.add_marker(pytest.mark.xdist_group("serial"))
 
 
 @pytest.fixture
@@ -34,6 +78,83 @@ def temp_dir() -> Generator[Path, None, None]:
     shutil.rmtree(temp_path, ignore_errors=True)
 
 
+@pytest.fixture
+def fake_root(request) -> Path:
+    """
+    Root directory for tests that build small BIDS trees.
+    
+    With pyfakefs installed (dev dependency), the filesystem is replaced by an
+    in-memory one for the duration of the test and the root is /fake, so
+    mkdir/write_text/touch never reach the disk. Without it, falls back to
+    pytest's on-disk tmp_path.
+    
+    Returns:
+        Path to an empty, writable directory.
+    """
+    if not HAS_PYFAKEFS:
+        return request.getfixturevalue("tmp_path")
+    
+    fs = request.getfixturevalue("fs")
+    fs.create_dir("/fake")
+    return Path("/fake")
+
+
+@pytest.fixture
+def loader(fake_root) -> BidsLoader:
+    """
+    Create a BidsLoader rooted at the (empty) fake_root directory.
+    
+    Returns:
+        A BidsLoader for fake_root.
+    """
+    return BidsLoader(fake_root)
+
+
+@pytest.fixture(scope="session")
+def minimal_bids_root(tmp_path_factory) -> Path:
+    """
+    Build a canonical minimal BIDS dataset once per test session.
+    
+    Contains dataset_description.json, participants.tsv (sub-01 and sub-02)
+    and a single sub-01/anat/sub-01_T1w.nii.gz file. Tests must treat it as
+    read-only; use bids_root for a private copy.
+    
+    Returns:
+        Path to the dataset root.
+    """
+    root = tmp_path_factory.mktemp("minimal_bids")
+    
+    dataset_desc = {
+        "Name": "Minimal Dataset",
+        "BIDSVersion": "1.8.0",
+        "Authors": ["Test Author"]
+    }
+    participants_content = "participant_id\tage\tsex\tgroup\n"
+    participants_content += "sub-01\t25\tM\tcontrol\n"
+    participants_content += "sub-02\t30\tF\tpatient\n"
+    
+    write_bids_tree(root, {
+        "dataset_description.json": json.dumps(dataset_desc),
+        "participants.tsv": participants_content,
+        "sub-01/anat/sub-01_T1w.nii.gz": b"",
+    })
+    
+    return root
+
+
+@pytest.fixture
+def bids_root(minimal_bids_root, tmp_path) -> Path:
+    """
+    Private, writable copy of the minimal BIDS dataset.
+    
+    Returns:
+        Path to the copied dataset root.
+    """
+    root = tmp_path / "ds"
+    shutil.copytree(minimal_bids_root, root, dirs_exist_ok=True)
+    return root
+
+
 @pytest.fixture
 def sample_dataset() -> BIDSDataset:
     """
@@ -9,12 +9,13 @@ import pytest
 
 from src.bidsio.core.repository import BidsRepository
 from src.bidsio.infrastructure.bids_loader import BidsLoader, is_bids_dataset
+from tests._bids_tree import make_bids_tree
 
 
 class TestBidsLoader:
     """Test cases for BidsLoader class."""
     
-    def test_is_bids_dataset_with_valid_dataset(self, tmp_path):
+    def test_is_bids_dataset_with_valid_dataset(self, fake_root):
         """Test that is_bids_dataset returns True for valid dataset."""
         # Create a minimal BIDS dataset
         dataset_desc = {
@@ -22,64 +23,37 @@ class TestBidsLoader:
             "BIDSVersion": "1.8.0"
         }
         
-        desc_file = tmp_path / "dataset_description.json"
+        desc_file = fake_root / "dataset_description.json"
         desc_file.write_text(json.dumps(dataset_desc))
         
-        assert is_bids_dataset(tmp_path) is True
+        assert is_bids_dataset(fake_root) is True
     
-    def test_is_bids_dataset_with_invalid_dataset(self, tmp_path):
+    def test_is_bids_dataset_with_invalid_dataset(self, fake_root):
         """Test that is_bids_dataset returns False for invalid dataset."""
         # No dataset_description.json
-        assert is_bids_dataset(tmp_path) is False
+        assert is_bids_dataset(fake_root) is False
     
-    def test_validate_bids_root_success(self, tmp_path):
+    def test_validate_bids_root_success(self, minimal_bids_root):
         """Test BIDS validation with valid dataset."""
-        # Create minimal BIDS dataset
-        dataset_desc = {
-            "Name": "Test Dataset",
-            "BIDSVersion": "1.8.0"
-        }
-        
-        desc_file = tmp_path / "dataset_description.json"
-        desc_file.write_text(json.dumps(dataset_desc))
-        
-        loader = BidsLoader(tmp_path)
+        loader = BidsLoader(minimal_bids_root)
         assert loader._validate_bids_root() is True
     
-    def test_validate_bids_root_missing_file(self, tmp_path):
+    def test_validate_bids_root_missing_file(self, loader):
         """Test BIDS validation fails when dataset_description.json is missing."""
-        loader = BidsLoader(tmp_path)
         assert loader._validate_bids_root() is False
     
-    def test_load_dataset_description(self, tmp_path):
+    def test_load_dataset_description(self, minimal_bids_root):
         """Test loading dataset description."""
-        dataset_desc = {
-            "Name": "Test Dataset",
-            "BIDSVersion": "1.8.0",
-            "Authors": ["Test Author"]
-        }
-        
-        desc_file = tmp_path / "dataset_description.json"
-        desc_file.write_text(json.dumps(dataset_desc))
-        
-        loader = BidsLoader(tmp_path)
+        loader = BidsLoader(minimal_bids_root)
         desc = loader._load_dataset_description()
         
-        assert desc["Name"] == "Test Dataset"
+        assert desc["Name"] == "Minimal Dataset"
         assert desc["BIDSVersion"] == "1.8.0"
         assert "Test Author" in desc["Authors"]
     
-    def test_load_participants_tsv(self, tmp_path):
+    def test_load_participants_tsv(self, minimal_bids_root):
         """Test loading participants.tsv file."""
-        # Create participants.tsv
-        participants_content = "participant_id\tage\tsex\n"
-        participants_content += "sub-01\t25\tM\n"
-        participants_content += "sub-02\t30\tF\n"
-        
-        participants_file = tmp_path / "participants.tsv"
-        participants_file.write_text(participants_content)
-        
-        loader = BidsLoader(tmp_path)
+        loader = BidsLoader(minimal_bids_root)
         metadata = loader._load_participants_tsv()
         
         assert "01" in metadata
@@ -88,36 +62,25 @@ class TestBidsLoader:
         assert metadata["02"]["age"] == "30"
         assert metadata["02"]["sex"] == "F"
     
-    def test_parse_bids_filename_anat(self, tmp_path):
-        """Test parsing anatomical BIDS filename."""
-        # Create a sample BIDS file
-        filepath = tmp_path / "sub-01_ses-pre_T1w.nii.gz"
-        filepath.touch()
-        
-        loader = BidsLoader(tmp_path)
-        bids_file = loader._parse_bids_filename(filepath, "anat")
-        
-        assert bids_file.modality == "anat"
-        assert bids_file.extension == ".nii.gz"
-        assert bids_file.suffix == "T1w"
-        assert bids_file.entities["sub"] == "01"
-        assert bids_file.entities["ses"] == "pre"
-    
-    def test_parse_bids_filename_ieeg(self, tmp_path):
-        """Test parsing iEEG BIDS filename."""
-        # Create a sample BIDS file
-        filepath = tmp_path / "sub-02_task-rest_run-01_ieeg.edf"
+    @pytest.mark.parametrize("fname,modality,suffix,ext,entities", [
+        ("sub-01_ses-pre_T1w.nii.gz", "anat", "T1w", ".nii.gz",
+         {"sub": "01", "ses": "pre"}),
+        ("sub-02_task-rest_run-01_ieeg.edf", "ieeg", "ieeg", ".edf",
+         {"sub": "02", "task": "rest", "run": "01"}),
+        ("sub-01_ses-pre_task-rest_run-01_bold.nii.gz", "func", "bold", ".nii.gz",
+         {"sub": "01", "ses": "pre", "task": "rest", "run": "01"}),
+    ])
+    def test_parse_bids_filename(self, loader, fname, modality, suffix, ext, entities):
+        """Test parsing modality, suffix, extension and entities from BIDS filenames."""
+        filepath = loader.root_path / fname
         filepath.touch()
         
-        loader = BidsLoader(tmp_path)
-        bids_file = loader._parse_bids_filename(filepath, "ieeg")
+        bids_file = loader._parse_bids_filename(filepath, modality)
         
-        assert bids_file.modality == "ieeg"
-        assert bids_file.extension == ".edf"
-        assert bids_file.suffix == "ieeg"
-        assert bids_file.entities["sub"] == "02"
-        assert bids_file.entities["task"] == "rest"
-        assert bids_file.entities["run"] == "01"
+        assert bids_file.modality == modality
+        assert bids_file.extension == ext
+        assert bids_file.suffix == suffix
+        assert bids_file.entities == entities
 
 
 class TestBidsRepository:
@@ -128,42 +91,25 @@ class TestBidsRepository:
         with pytest.raises(FileNotFoundError):
             repo = BidsRepository(Path("/nonexistent/path"))
     
-    def test_load_invalid_bids_dataset(self, tmp_path):
+    def test_load_invalid_bids_dataset(self, fake_root):
         """Test loading invalid BIDS dataset raises ValueError."""
         # Create directory without dataset_description.json
         with pytest.raises(ValueError):
-            repo = BidsRepository(tmp_path)
+            repo = BidsRepository(fake_root)
             repo.load()
     
-    def test_load_minimal_bids_dataset(self, tmp_path):
+    def test_load_minimal_bids_dataset(self, minimal_bids_root):
         """Test loading a minimal valid BIDS dataset."""
-        # Create minimal BIDS dataset structure
-        dataset_desc = {
-            "Name": "Minimal Dataset",
-            "BIDSVersion": "1.8.0"
-        }
-        
-        desc_file = tmp_path / "dataset_description.json"
-        desc_file.write_text(json.dumps(dataset_desc))
-        
-        # Create a subject with an anatomical file
-        sub_dir = tmp_path / "sub-01" / "anat"
-        sub_dir.mkdir(parents=True)
-        
-        anat_file = sub_dir / "sub-01_T1w.nii.gz"
-        anat_file.touch()
-        
-        # Load dataset
-        repo = BidsRepository(tmp_path)
+        repo = BidsRepository(minimal_bids_root)
         dataset = repo.load()
         
-        assert dataset.root_path == tmp_path
+        assert dataset.root_path == minimal_bids_root
         assert len(dataset.subjects) == 1
         assert dataset.subjects[0].subject_id == "01"
         assert len(dataset.subjects[0].files) == 1
         assert dataset.dataset_description["Name"] == "Minimal Dataset"
     
-    def test_load_dataset_with_sessions(self, tmp_path):
+    def test_load_dataset_with_sessions(self, fake_root):
         """Test loading dataset with sessions."""
         # Create BIDS dataset with sessions
         dataset_desc = {
@@ -171,21 +117,17 @@ class TestBidsRepository:
             "BIDSVersion": "1.8.0"
         }
         
-        desc_file = tmp_path / "dataset_description.json"
+        desc_file = fake_root / "dataset_description.json"
         desc_file.write_text(json.dumps(dataset_desc))
         
         # Create subject with two sessions
-        sub_dir = tmp_path / "sub-01"
-        ses1_dir = sub_dir / "ses-pre" / "anat"
-        ses2_dir = sub_dir / "ses-post" / "anat"
-        ses1_dir.mkdir(parents=True)
-        ses2_dir.mkdir(parents=True)
-        
-        (ses1_dir / "sub-01_ses-pre_T1w.nii.gz").touch()
-        (ses2_dir / "sub-01_ses-post_T1w.nii.gz").touch()
+        make_bids_tree(fake_root, [
+            "sub-01/ses-pre/anat/sub-01_ses-pre_T1w.nii.gz",
+            "sub-01/ses-post/anat/sub-01_ses-post_T1w.nii.gz",
+        ])
         
         # Load dataset
-        repo = BidsRepository(tmp_path)
+        repo = BidsRepository(fake_root)
         dataset = repo.load()
         
         assert len(dataset.subjects) == 1
@@ -193,36 +135,13 @@ class TestBidsRepository:
         assert dataset.subjects[0].sessions[0].session_id == "post"
         assert dataset.subjects[0].sessions[1].session_id == "pre"
     
-    def test_load_dataset_with_participants_metadata(self, tmp_path):
+    def test_load_dataset_with_participants_metadata(self, bids_root):
         """Test loading dataset with participants.tsv metadata."""
-        # Create BIDS dataset
-        dataset_desc = {
-            "Name": "Metadata Dataset",
-            "BIDSVersion": "1.8.0"
-        }
-        
-        desc_file = tmp_path / "dataset_description.json"
-        desc_file.write_text(json.dumps(dataset_desc))
-        
-        # Create participants.tsv
-        participants_content = "participant_id\tage\tsex\tgroup\n"
-        participants_content += "sub-01\t25\tM\tcontrol\n"
-        participants_content += "sub-02\t30\tF\tpatient\n"
-        
-        participants_file = tmp_path / "participants.tsv"
-        participants_file.write_text(participants_content)
-        
-        # Create subjects
-        sub1_dir = tmp_path / "sub-01" / "anat"
-        sub2_dir = tmp_path / "sub-02" / "ieeg"
-        sub1_dir.mkdir(parents=True)
-        sub2_dir.mkdir(parents=True)
-        
-        (sub1_dir / "sub-01_T1w.nii.gz").touch()
-        (sub2_dir / "sub-02_task-rest_ieeg.edf").touch()
+        # Add the second subject listed in participants.tsv
+        make_bids_tree(bids_root, ["sub-02/ieeg/sub-02_task-rest_ieeg.edf"])
         
         # Load dataset
-        repo = BidsRepository(tmp_path)
+        repo = BidsRepository(bids_root)
         dataset = repo.load()
         
         assert len(dataset.subjects) == 2
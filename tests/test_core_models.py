@@ -11,13 +11,14 @@ from src.bidsio.core.models import (
     BIDSFile,
     BIDSSession,
     BIDSSubject,
-    BIDSDataset
+    BIDSDerivative,
+    BIDSDataset,
+    IEEGData
 )
 from src.bidsio.core.export import (
     SelectedEntities,
     ExportRequest
 )
-from src.bidsio.infrastructure.bids_loader import BidsLoader
 
 
 class TestBIDSFile:
@@ -36,24 +37,21 @@ class TestBIDSFile:
         assert file.modality == "anat"
         assert file.suffix == "T1w"
     
-    def test_parse_entities_from_filename(self, tmp_path):
-        """Test that BIDS filename parsing extracts entities correctly using BidsLoader."""
-        # Create a fake BIDS file
-        filepath = tmp_path / "sub-01_ses-pre_task-rest_run-01_bold.nii.gz"
-        filepath.touch()
-
-        loader = BidsLoader(tmp_path)
-        bids_file = loader._parse_bids_filename(filepath, "func")
-
-        assert bids_file.entities["sub"] == "01"
-        assert bids_file.entities["ses"] == "pre"
-        assert bids_file.entities["task"] == "rest"
-        assert bids_file.entities["run"] == "01"
-
-    def test_load_metadata_from_json_sidecar(self, tmp_path):
+    def test_instances_have_no_dict(self):
+        """Test that model objects use slots instead of a per-instance __dict__."""
+        file = BIDSFile(path=Path("/data/sub-01/anat/sub-01_T1w.nii.gz"))
+        subject = BIDSSubject(subject_id="01", sessions=[BIDSSession(session_id="pre", files=[file])])
+        dataset = BIDSDataset(root_path=Path("/data"), subjects=[subject])
+        
+        for obj in (file, subject.sessions[0], subject, dataset):
+            assert not hasattr(obj, '__dict__')
+        with pytest.raises(AttributeError):
+            file.unknown_field = "x"
+    
+    def test_load_metadata_from_json_sidecar(self, fake_root):
         """Test lazy metadata loading from JSON sidecar for a BIDSFile."""
         # Create directories
-        anat_dir = tmp_path / "sub-01" / "anat"
+        anat_dir = fake_root / "sub-01" / "anat"
         anat_dir.mkdir(parents=True)
 
         data_file = anat_dir / "sub-01_T1w.nii.gz"
@@ -61,7 +59,7 @@ class TestBIDSFile:
 
         # Create JSON sidecar
         json_sidecar = anat_dir / "sub-01_T1w.json"
-        json_content = {"EchoTime": 0.003, "Manufacturer": "TestMaker"}
+        json_content = {"EchoTime": 0.003, "Manufacturer": "TestMaker", "SliceTiming": [0.0, 0.5]}
         import json
         with open(json_sidecar, 'w', encoding='utf-8') as f:
             json.dump(json_content, f)
@@ -80,6 +78,58 @@ class TestBIDSFile:
         assert loaded is not None
         assert loaded.get("EchoTime") == 0.003
 
+        # Another file object for the same data gets the same content, but
+        # not the same object, so changing one file's metadata leaves it alone
+        other = BIDSFile(path=data_file, modality="anat", suffix="T1w", extension=".nii.gz")
+        other_loaded = other.load_metadata()
+        assert other_loaded == loaded
+        assert other_loaded is not loaded
+        
+        loaded["EchoTime"] = 1.0
+        loaded["SliceTiming"].append(1.0)
+        assert other.metadata["EchoTime"] == 0.003
+        assert other.metadata["SliceTiming"] == [0.0, 0.5]
+        third = BIDSFile(path=data_file, modality="anat", suffix="T1w", extension=".nii.gz")
+        assert third.load_metadata()["EchoTime"] == 0.003
+
+        # A modified sidecar is parsed again
+        with open(json_sidecar, 'w', encoding='utf-8') as f:
+            json.dump({"EchoTime": 0.005}, f)
+        assert bids_file.load_metadata(force_reload=True) == {"EchoTime": 0.005}
+
+    def test_load_metadata_unreadable_sidecar(self, fake_root):
+        """Test that a sidecar path that cannot be read gives no metadata."""
+        anat_dir = fake_root / "sub-01" / "anat"
+        anat_dir.mkdir(parents=True)
+        data_file = anat_dir / "sub-01_T1w.nii.gz"
+        data_file.touch()
+
+        # A directory in place of the sidecar raises an OSError when opened
+        (anat_dir / "sub-01_T1w.json").mkdir()
+
+        bids_file = BIDSFile(path=data_file, modality="anat", suffix="T1w", extension=".nii.gz")
+        assert bids_file.load_metadata() is None
+        assert bids_file.metadata is None
+
+
+class TestBIDSSession:
+    """Tests for BIDSSession model."""
+    
+    def test_get_files_with_entity(self):
+        """Test files are looked up by entity and the index follows the files list."""
+        rest = BIDSFile(path=Path("sub-01_task-rest_bold.nii.gz"), entities={"sub": "01", "task": "rest"})
+        t1w = BIDSFile(path=Path("sub-01_T1w.nii.gz"), entities={"sub": "01"})
+        session = BIDSSession(session_id="pre", files=[rest, t1w])
+        
+        assert session.get_files_with_entity("sub") == [rest, t1w]
+        assert session.get_files_with_entity("task") == [rest]
+        assert session.get_files_with_entity("run") == []
+        
+        # Adding a file invalidates the index
+        run = BIDSFile(path=Path("sub-01_task-rest_run-02_bold.nii.gz"), entities={"sub": "01", "task": "rest", "run": "02"})
+        session.files.append(run)
+        assert session.get_files_with_entity("task") == [rest, run]
+
 
 class TestBIDSSubject:
     """Tests for BIDSSubject model."""
@@ -106,6 +156,38 @@ class TestBIDSSubject:
         file = BIDSFile(path=Path("/tmp/sub-01/file.tsv"), modality=None, suffix=None, extension=".tsv", entities={})
         subject.files.append(file)
         assert len(subject.files) == 1
+    
+    def test_get_derivative(self):
+        """Test retrieving a derivative pipeline by name."""
+        pipeline1 = BIDSDerivative(pipeline_name="pipeline1")
+        subject = BIDSSubject(subject_id="01", derivatives=[pipeline1])
+        
+        assert subject.get_derivative("pipeline1") is pipeline1
+        assert subject.get_derivative("pipeline2") is None
+        
+        # Pipelines added after the first lookup are found too
+        pipeline2 = BIDSDerivative(pipeline_name="pipeline2")
+        subject.derivatives.append(pipeline2)
+        assert subject.get_derivative("pipeline2") is pipeline2
+    
+    def test_get_modalities(self):
+        """Test collecting subject and session file modalities."""
+        subject = BIDSSubject(subject_id="01")
+        subject.files.append(BIDSFile(path=Path("/tmp/sub-01/anat/sub-01_T1w.nii.gz"), modality="anat"))
+        session = BIDSSession(session_id="pre")
+        session.files.append(BIDSFile(path=Path("/tmp/sub-01/ses-pre/ieeg/sub-01_ses-pre_ieeg.edf"), modality="ieeg"))
+        subject.sessions.append(session)
+        
+        assert subject.get_modalities() == {"anat", "ieeg"}
+        
+        # Files added after the first call are taken into account
+        session.files.append(BIDSFile(path=Path("/tmp/sub-01/ses-pre/func/sub-01_ses-pre_bold.nii.gz"), modality="func"))
+        assert subject.get_modalities() == {"anat", "ieeg", "func"}
+        
+        subject.sessions.append(BIDSSession(session_id="post", files=[
+            BIDSFile(path=Path("/tmp/sub-01/ses-post/dwi/sub-01_ses-post_dwi.nii.gz"), modality="dwi")
+        ]))
+        assert subject.get_modalities() == {"anat", "ieeg", "func", "dwi"}
 
 
 class TestBIDSDataset:
@@ -130,6 +212,11 @@ class TestBIDSDataset:
         
         not_found = dataset.get_subject("03")
         assert not_found is None
+        
+        # Subjects added after the first lookup are found too
+        subject3 = BIDSSubject(subject_id="03")
+        dataset.subjects.append(subject3)
+        assert dataset.get_subject("03") is subject3
     
     def test_get_all_modalities_and_tasks(self):
         """Test retrieval of all modalities and tasks in a BIDSDataset."""
@@ -152,6 +239,70 @@ class TestBIDSDataset:
 
         assert modalities == {"anat", "func", "dwi"}
         assert tasks == {"rest"}
+    
+    def test_get_all_attributes_cached(self):
+        """Test attribute discovery is memoized until the subjects list changes."""
+        dataset = BIDSDataset(root_path=Path("/data"))
+        s1 = BIDSSubject(subject_id="01", metadata={"age": "30", "sex": "F"})
+        s1.ieeg_data = IEEGData(
+            channels={Path("a_channels.tsv"): [], Path("b_channels.tsv"): [{"name": "A1", "type": "SEEG"}]},
+            electrodes={Path("a_electrodes.tsv"): [{"name": "A1", "x": "0"}]}
+        )
+        s2 = BIDSSubject(subject_id="02", metadata={"group": "patient"})
+        dataset.subjects = [s1, s2]
+        
+        participant_attributes = dataset.get_all_participant_attributes()
+        assert participant_attributes == ["age", "group", "sex"]
+        assert dataset.get_all_channel_attributes() == ["name", "type"]
+        assert dataset.get_all_electrode_attributes() == ["name", "x"]
+        
+        # Second call reuses the cached list
+        assert dataset.get_all_participant_attributes() is participant_attributes
+        
+        # Adding a subject invalidates the cache
+        dataset.subjects.append(BIDSSubject(subject_id="03", metadata={"handedness": "R"}))
+        assert dataset.get_all_participant_attributes() == ["age", "group", "handedness", "sex"]
+        
+        # Replacing the subjects list invalidates the cache
+        dataset.subjects = [s2]
+        assert dataset.get_all_participant_attributes() == ["group"]
+        assert dataset.get_all_channel_attributes() == []
+    
+    def test_invalidate_caches_after_in_place_change(self):
+        """Test that invalidate_caches picks up iEEG data set on existing subjects."""
+        dataset = BIDSDataset(root_path=Path("/data"))
+        subject = BIDSSubject(subject_id="01")
+        dataset.subjects = [subject]
+        
+        assert dataset.get_all_channel_attributes() == []
+        
+        # Setting iEEG data in place is not detected on its own
+        subject.ieeg_data = IEEGData(channels={Path("a_channels.tsv"): [{"name": "A1"}]})
+        assert dataset.get_all_channel_attributes() == []
+        
+        dataset.invalidate_caches()
+        assert dataset.get_all_channel_attributes() == ["name"]
+    
+    def test_get_all_entities(self):
+        """Test entity values are indexed from subject/session IDs and file entities."""
+        dataset = BIDSDataset(root_path=Path("/data"))
+        s1 = BIDSSubject(subject_id="01")
+        s1.files.append(BIDSFile(path=Path("/data/sub-01/anat/sub-01_T1w.nii.gz"), modality="anat", suffix="T1w", extension=".nii.gz", entities={"sub": "01"}))
+        run_file = BIDSFile(path=Path("/data/sub-01/ses-pre/func/sub-01_ses-pre_task-rest_run-02_bold.nii.gz"), modality="func", suffix="bold", extension=".nii.gz", entities={"sub": "01", "ses": "pre", "task": "rest", "run": "02"})
+        s1.sessions.append(BIDSSession(session_id="pre", files=[run_file]))
+        s2 = BIDSSubject(subject_id="02")
+        dataset.subjects = [s2, s1]
+        
+        assert dataset.get_all_entities() == {"sub": ["01", "02"], "ses": ["pre"], "task": ["rest"], "run": ["02"]}
+        assert dataset.get_all_entity_values("acq") == []
+        
+        # Returned lists are copies of the cached index
+        dataset.get_all_entity_values("task").append("nback")
+        assert dataset.get_all_entity_values("task") == ["rest"]
+        
+        # Adding a subject invalidates the index
+        dataset.subjects.append(BIDSSubject(subject_id="03"))
+        assert dataset.get_all_entity_values("sub") == ["01", "02", "03"]
 
 
 class TestExportRequest:
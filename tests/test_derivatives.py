@@ -7,6 +7,7 @@ Tests derivative scanning, loading, and integration with the data model.
 import pytest
 import json
 from pathlib import Path
+from typing import Optional
 
 from src.bidsio.core.models import (
     BIDSDataset,
@@ -16,12 +17,80 @@ from src.bidsio.core.models import (
     BIDSFile
 )
 from src.bidsio.infrastructure.bids_loader import BidsLoader
+from tests._bids_tree import write_bids_tree
 
 
-@pytest.fixture
-def mock_derivatives_dataset(tmp_path):
+# Keep the module on one xdist worker, so the session-scoped derivatives
+# tree is built and loaded once rather than once per worker
+pytestmark = pytest.mark.xdist_group(name="derivatives")
+
+# dataset_description.json contents, serialized once at import
+_ROOT_DESC = json.dumps({
+    "Name": "Derivatives Test Dataset",
+    "BIDSVersion": "1.8.0",
+    "Authors": ["Test Author"]
+}).encode()
+
+# Pipeline 1: Simple structure
+_PIPELINE1_DESC = json.dumps({
+    "Name": "Pipeline 1",
+    "BIDSVersion": "1.8.0",
+    "PipelineDescription": {"Name": "Normalization Pipeline"},
+    "GeneratedBy": [{"Name": "SPM", "Version": "12"}]
+}).encode()
+
+# Pipeline 2: Nested structure (analysis subfolder)
+_PIPELINE2_DESC = json.dumps({
+    "Name": "Pipeline 2",
+    "BIDSVersion": "1.8.0",
+    "PipelineDescription": {"Name": "Preprocessing Pipeline"},
+    "GeneratedBy": [{"Name": "fMRIPrep", "Version": "20.2.0"}]
+}).encode()
+
+_NO_SESSION_DESC = json.dumps({"Name": "No Session Dataset", "BIDSVersion": "1.8.0"}).encode()
+_NO_SESSION_PIPELINE_DESC = json.dumps({"Name": "Pipeline 1", "BIDSVersion": "1.8.0"}).encode()
+_MINIMAL_DESC = json.dumps({"Name": "Test", "BIDSVersion": "1.8.0"}).encode()
+
+
+def _minimal_dataset(root: Path, extra: Optional[dict[str, bytes | str | None]] = None) -> Path:
     """
-    Create a mock BIDS dataset with derivatives on disk.
+    Write a minimal raw dataset (description and one sub-01 T1w file) under root.
+    
+    Args:
+        root: Dataset root directory (created if missing).
+        extra: Additional files to write, in write_bids_tree format.
+    
+    Returns:
+        The dataset root.
+    """
+    write_bids_tree(root, {
+        "dataset_description.json": _MINIMAL_DESC,
+        "sub-01/anat/sub-01_T1w.nii.gz": b"data",
+        **(extra or {}),
+    })
+    return root
+
+
+def _require_subject(dataset: BIDSDataset, subject_id: str) -> BIDSSubject:
+    """Get a subject of a loaded dataset, failing the test if it is missing."""
+    subject = dataset.get_subject(subject_id)
+    assert subject is not None, f"subject {subject_id} missing"
+    return subject
+
+
+def _require_pipeline(subject: BIDSSubject, pipeline_name: str) -> BIDSDerivative:
+    """Get a derivative pipeline of a subject, failing the test if it is missing."""
+    pipeline = subject.get_derivative(pipeline_name)
+    assert pipeline is not None, f"pipeline {pipeline_name} missing for sub-{subject.subject_id}"
+    return pipeline
+
+
+@pytest.fixture(scope="session")
+def mock_derivatives_dataset(tmp_path_factory):
+    """
+    Create a mock BIDS dataset with derivatives on disk (once per session).
+    
+    Tests must not modify the tree.
     
     Structure:
         dataset/
@@ -54,75 +123,40 @@ def mock_derivatives_dataset(tmp_path):
                                 anat/
                                     sub-01_ses-pre_desc-preproc_T1w.nii.gz
     """
-    dataset_root = tmp_path / "derivatives_dataset"
-    dataset_root.mkdir()
-    
-    # Dataset description
-    desc = {
-        "Name": "Derivatives Test Dataset",
-        "BIDSVersion": "1.8.0",
-        "Authors": ["Test Author"]
-    }
-    with open(dataset_root / "dataset_description.json", "w") as f:
-        json.dump(desc, f)
-    
-    # Participants
-    with open(dataset_root / "participants.tsv", "w") as f:
-        f.write("participant_id\tage\n")
-        f.write("sub-01\t25\n")
-        f.write("sub-02\t30\n")
-    
-    # Raw data
-    for sub_id, ses_id in [("01", "pre"), ("02", "post")]:
-        anat_dir = dataset_root / f"sub-{sub_id}" / f"ses-{ses_id}" / "anat"
-        anat_dir.mkdir(parents=True)
-        (anat_dir / f"sub-{sub_id}_ses-{ses_id}_T1w.nii.gz").write_text("raw data")
+    dataset_root = tmp_path_factory.mktemp("derivatives_dataset")
     
-    # Derivatives
-    deriv_root = dataset_root / "derivatives"
-    
-    # Pipeline 1: Simple structure
-    pipeline1_dir = deriv_root / "pipeline1"
-    pipeline1_dir.mkdir(parents=True)
-    
-    pipeline1_desc = {
-        "Name": "Pipeline 1",
-        "BIDSVersion": "1.8.0",
-        "PipelineDescription": {"Name": "Normalization Pipeline"},
-        "GeneratedBy": [{"Name": "SPM", "Version": "12"}]
-    }
-    with open(pipeline1_dir / "dataset_description.json", "w") as f:
-        json.dump(pipeline1_desc, f)
-    
-    for sub_id, ses_id in [("01", "pre"), ("02", "post")]:
-        anat_dir = pipeline1_dir / f"sub-{sub_id}" / f"ses-{ses_id}" / "anat"
-        anat_dir.mkdir(parents=True)
-        (anat_dir / f"sub-{sub_id}_ses-{ses_id}_space-MNI_T1w.nii.gz").write_text("normalized")
-        (anat_dir / f"sub-{sub_id}_ses-{ses_id}_space-MNI_T1w.json").write_text('{"space": "MNI"}')
-    
-    # Pipeline 2: Nested structure (analysis subfolder)
-    pipeline2_dir = deriv_root / "pipeline2"
-    pipeline2_dir.mkdir(parents=True)
-    
-    pipeline2_desc = {
-        "Name": "Pipeline 2",
-        "BIDSVersion": "1.8.0",
-        "PipelineDescription": {"Name": "Preprocessing Pipeline"},
-        "GeneratedBy": [{"Name": "fMRIPrep", "Version": "20.2.0"}]
-    }
-    with open(pipeline2_dir / "dataset_description.json", "w") as f:
-        json.dump(pipeline2_desc, f)
-    
-    # Only sub-01 has data in pipeline2
-    anat_dir = pipeline2_dir / "analysis" / "sub-01" / "ses-pre" / "anat"
-    anat_dir.mkdir(parents=True)
-    (anat_dir / "sub-01_ses-pre_desc-preproc_T1w.nii.gz").write_text("preprocessed")
+    write_bids_tree(dataset_root, {
+        "dataset_description.json": _ROOT_DESC,
+        "participants.tsv": "participant_id\tage\nsub-01\t25\nsub-02\t30\n",
+        # Raw data
+        "sub-01/ses-pre/anat/sub-01_ses-pre_T1w.nii.gz": "raw data",
+        "sub-02/ses-post/anat/sub-02_ses-post_T1w.nii.gz": "raw data",
+        # Derivatives
+        "derivatives/pipeline1/dataset_description.json": _PIPELINE1_DESC,
+        "derivatives/pipeline1/sub-01/ses-pre/anat/sub-01_ses-pre_space-MNI_T1w.nii.gz": "normalized",
+        "derivatives/pipeline1/sub-01/ses-pre/anat/sub-01_ses-pre_space-MNI_T1w.json": '{"space": "MNI"}',
+        "derivatives/pipeline1/sub-02/ses-post/anat/sub-02_ses-post_space-MNI_T1w.nii.gz": "normalized",
+        "derivatives/pipeline1/sub-02/ses-post/anat/sub-02_ses-post_space-MNI_T1w.json": '{"space": "MNI"}',
+        "derivatives/pipeline2/dataset_description.json": _PIPELINE2_DESC,
+        # Only sub-01 has data in pipeline2
+        "derivatives/pipeline2/analysis/sub-01/ses-pre/anat/sub-01_ses-pre_desc-preproc_T1w.nii.gz": "preprocessed",
+    })
     
     return dataset_root
 
 
+@pytest.fixture(scope="session")
+def loaded_derivatives_dataset(mock_derivatives_dataset):
+    """
+    Load the mock derivatives dataset once per session.
+    
+    Tests must not modify the returned dataset.
+    """
+    return BidsLoader(mock_derivatives_dataset).load()
+
+
 @pytest.fixture
-def mock_no_session_derivatives(tmp_path):
+def mock_no_session_derivatives(fake_root):
     """
     Create dataset with derivatives that have no sessions.
     
@@ -137,34 +171,21 @@ def mock_no_session_derivatives(tmp_path):
                         anat/
                             sub-01_space-MNI_T1w.nii.gz
     """
-    dataset_root = tmp_path / "no_session_dataset"
-    dataset_root.mkdir()
-    
-    # Dataset description
-    desc = {"Name": "No Session Dataset", "BIDSVersion": "1.8.0"}
-    with open(dataset_root / "dataset_description.json", "w") as f:
-        json.dump(desc, f)
-    
-    # Raw data (no sessions)
-    anat_dir = dataset_root / "sub-01" / "anat"
-    anat_dir.mkdir(parents=True)
-    (anat_dir / "sub-01_T1w.nii.gz").write_text("raw")
-    
-    # Derivatives (no sessions)
-    pipeline_dir = dataset_root / "derivatives" / "pipeline1"
-    pipeline_dir.mkdir(parents=True)
-    
-    desc = {"Name": "Pipeline 1", "BIDSVersion": "1.8.0"}
-    with open(pipeline_dir / "dataset_description.json", "w") as f:
-        json.dump(desc, f)
+    dataset_root = fake_root / "no_session_dataset"
     
-    deriv_anat = pipeline_dir / "sub-01" / "anat"
-    deriv_anat.mkdir(parents=True)
-    (deriv_anat / "sub-01_space-MNI_T1w.nii.gz").write_text("normalized")
+    write_bids_tree(dataset_root, {
+        "dataset_description.json": _NO_SESSION_DESC,
+        # Raw data (no sessions)
+        "sub-01/anat/sub-01_T1w.nii.gz": "raw",
+        # Derivatives (no sessions)
+        "derivatives/pipeline1/dataset_description.json": _NO_SESSION_PIPELINE_DESC,
+        "derivatives/pipeline1/sub-01/anat/sub-01_space-MNI_T1w.nii.gz": "normalized",
+    })
     
     return dataset_root
 
 
+@pytest.mark.integration
 class TestDerivativeLoading:
     """Test loading derivatives from filesystem."""
     
@@ -179,13 +200,11 @@ class TestDerivativeLoading:
         for subject in dataset.subjects:
             assert len(subject.derivatives) > 0
     
-    def test_derivatives_structure(self, mock_derivatives_dataset):
+    def test_derivatives_structure(self, loaded_derivatives_dataset):
         """Test that derivative structure is correct."""
-        loader = BidsLoader(mock_derivatives_dataset)
-        dataset = loader.load()
+        dataset = loaded_derivatives_dataset
         
-        subject_01 = dataset.get_subject("01")
-        assert subject_01 is not None
+        subject_01 = _require_subject(dataset, "01")
         
         # Should have 2 pipelines
         assert len(subject_01.derivatives) == 2
@@ -194,93 +213,76 @@ class TestDerivativeLoading:
         pipeline_names = {d.pipeline_name for d in subject_01.derivatives}
         assert pipeline_names == {"pipeline1", "pipeline2"}
     
-    def test_derivative_pipeline_description(self, mock_derivatives_dataset):
+    def test_derivative_pipeline_description(self, loaded_derivatives_dataset):
         """Test that pipeline descriptions are loaded."""
-        loader = BidsLoader(mock_derivatives_dataset)
-        dataset = loader.load()
+        dataset = loaded_derivatives_dataset
         
-        subject = dataset.get_subject("01")
-        assert subject is not None
-        pipeline1 = subject.get_derivative("pipeline1")
+        subject = _require_subject(dataset, "01")
+        pipeline1 = _require_pipeline(subject, "pipeline1")
         
-        assert pipeline1 is not None
         assert pipeline1.pipeline_description is not None
         assert pipeline1.pipeline_description["Name"] == "Pipeline 1"
         assert "PipelineDescription" in pipeline1.pipeline_description
         assert "GeneratedBy" in pipeline1.pipeline_description
     
-    def test_derivative_sessions(self, mock_derivatives_dataset):
+    def test_derivative_sessions(self, loaded_derivatives_dataset):
         """Test that derivative sessions are loaded."""
-        loader = BidsLoader(mock_derivatives_dataset)
-        dataset = loader.load()
+        dataset = loaded_derivatives_dataset
         
-        subject_01 = dataset.get_subject("01")
-        assert subject_01 is not None
-        pipeline1 = subject_01.get_derivative("pipeline1")
-        assert pipeline1 is not None
+        subject_01 = _require_subject(dataset, "01")
+        pipeline1 = _require_pipeline(subject_01, "pipeline1")
         
         # Should have ses-pre
         assert len(pipeline1.sessions) == 1
         assert pipeline1.sessions[0].session_id == "pre"
     
-    def test_derivative_files(self, mock_derivatives_dataset):
+    def test_derivative_files(self, loaded_derivatives_dataset):
         """Test that derivative files are loaded."""
-        loader = BidsLoader(mock_derivatives_dataset)
-        dataset = loader.load()
+        dataset = loaded_derivatives_dataset
         
-        subject = dataset.get_subject("01")
-        assert subject is not None
-        pipeline1 = subject.get_derivative("pipeline1")
-        assert pipeline1 is not None
+        subject = _require_subject(dataset, "01")
+        pipeline1 = _require_pipeline(subject, "pipeline1")
         
         # Check session files
         session = pipeline1.sessions[0]
         assert len(session.files) > 0
         
-        # Verify file properties
-        nifti_files = [f for f in session.files if f.extension == ".nii.gz"]
-        assert len(nifti_files) > 0
-        
-        # Check that file has correct entities
-        space_file = next((f for f in nifti_files if "space" in f.entities), None)
+        # Check that a NIfTI file has correct entities
+        space_file = next(
+            (f for f in session.get_files_with_entity("space") if f.extension == ".nii.gz"),
+            None
+        )
         assert space_file is not None
         assert space_file.entities["space"] == "MNI"
     
-    def test_nested_derivative_structure(self, mock_derivatives_dataset):
+    def test_nested_derivative_structure(self, loaded_derivatives_dataset):
         """Test derivatives with nested subdirectories (e.g., analysis/)."""
-        loader = BidsLoader(mock_derivatives_dataset)
-        dataset = loader.load()
+        dataset = loaded_derivatives_dataset
         
-        subject_01 = dataset.get_subject("01")
-        assert subject_01 is not None
-        pipeline2 = subject_01.get_derivative("pipeline2")
+        subject_01 = _require_subject(dataset, "01")
+        pipeline2 = _require_pipeline(subject_01, "pipeline2")
         
         # Should find subject even in nested structure
-        assert pipeline2 is not None
         assert len(pipeline2.sessions) == 1
         assert len(pipeline2.sessions[0].files) > 0
     
-    def test_subject_without_derivatives(self, mock_derivatives_dataset):
+    def test_subject_without_derivatives(self, loaded_derivatives_dataset):
         """Test that subjects without derivative data have empty list."""
         # Modify dataset so sub-02 has no pipeline2 data
-        loader = BidsLoader(mock_derivatives_dataset)
-        dataset = loader.load()
+        dataset = loaded_derivatives_dataset
         
-        subject_02 = dataset.get_subject("02")
-        assert subject_02 is not None
+        subject_02 = _require_subject(dataset, "02")
         
         # sub-02 should have pipeline1 but not full pipeline2 data
         assert len(subject_02.derivatives) >= 1
-        pipeline1 = subject_02.get_derivative("pipeline1")
-        assert pipeline1 is not None
+        _require_pipeline(subject_02, "pipeline1")
     
     def test_derivatives_without_sessions(self, mock_no_session_derivatives):
         """Test loading derivatives for datasets without sessions."""
         loader = BidsLoader(mock_no_session_derivatives)
         dataset = loader.load()
         
-        subject = dataset.get_subject("01")
-        assert subject is not None
+        subject = _require_subject(dataset, "01")
         assert len(subject.derivatives) == 1
         
         pipeline = subject.derivatives[0]
@@ -291,6 +293,25 @@ class TestDerivativeLoading:
         assert len(pipeline.files) > 0
 
 
+@pytest.fixture(scope="class")
+def mni_file() -> BIDSFile:
+    """Derivative file in MNI space, shared (read-only) by a test class."""
+    return BIDSFile(
+        path=Path("/test/file1.nii.gz"),
+        modality="anat",
+        suffix="T1w",
+        extension=".nii.gz",
+        entities={"space": "MNI"}
+    )
+
+
+@pytest.fixture(scope="class")
+def empty_session() -> BIDSSession:
+    """Session without files, shared (read-only) by a test class."""
+    return BIDSSession(session_id="01", files=[])
+
+
+@pytest.mark.fast
 class TestDerivativeModel:
     """Test BIDSDerivative data model."""
     
@@ -308,13 +329,11 @@ class TestDerivativeModel:
         assert derivative.files == []
         assert derivative.pipeline_description["Name"] == "Test"
     
-    def test_derivative_with_sessions(self):
+    def test_derivative_with_sessions(self, empty_session):
         """Test derivative with sessions."""
-        session = BIDSSession(session_id="01", files=[])
-        
         derivative = BIDSDerivative(
             pipeline_name="pipeline1",
-            sessions=[session],
+            sessions=[empty_session],
             files=[],
             pipeline_description={}
         )
@@ -322,20 +341,12 @@ class TestDerivativeModel:
         assert len(derivative.sessions) == 1
         assert derivative.sessions[0].session_id == "01"
     
-    def test_derivative_with_files(self):
+    def test_derivative_with_files(self, mni_file):
         """Test derivative with files (no sessions)."""
-        file1 = BIDSFile(
-            path=Path("/test/file1.nii.gz"),
-            modality="anat",
-            suffix="T1w",
-            extension=".nii.gz",
-            entities={"space": "MNI"}
-        )
-        
         derivative = BIDSDerivative(
             pipeline_name="pipeline1",
             sessions=[],
-            files=[file1],
+            files=[mni_file],
             pipeline_description={}
         )
         
@@ -343,74 +354,57 @@ class TestDerivativeModel:
         assert derivative.files[0].entities["space"] == "MNI"
 
 
+@pytest.mark.integration
 class TestDerivativeDatasetMethods:
     """Test BIDSDataset methods for derivatives."""
     
-    def test_get_all_derivative_pipelines(self, mock_derivatives_dataset):
+    def test_get_all_derivative_pipelines(self, loaded_derivatives_dataset):
         """Test getting all derivative pipeline names."""
-        loader = BidsLoader(mock_derivatives_dataset)
-        dataset = loader.load()
+        dataset = loaded_derivatives_dataset
         
         pipelines = dataset.get_all_derivative_pipelines()
         
-        assert len(pipelines) == 2
-        assert "pipeline1" in pipelines
-        assert "pipeline2" in pipelines
+        assert pipelines == ["pipeline1", "pipeline2"]
     
-    def test_get_all_derivative_pipelines_empty(self, tmp_path):
+    def test_get_all_derivative_pipelines_empty(self, fake_root):
         """Test getting pipelines when there are no derivatives."""
         # Create minimal dataset without derivatives
-        dataset_root = tmp_path / "no_deriv"
-        dataset_root.mkdir()
-        
-        desc = {"Name": "Test", "BIDSVersion": "1.8.0"}
-        with open(dataset_root / "dataset_description.json", "w") as f:
-            json.dump(desc, f)
-        
-        anat_dir = dataset_root / "sub-01" / "anat"
-        anat_dir.mkdir(parents=True)
-        (anat_dir / "sub-01_T1w.nii.gz").write_text("data")
+        dataset_root = _minimal_dataset(fake_root / "no_deriv")
         
         loader = BidsLoader(dataset_root)
         dataset = loader.load()
         
         pipelines = dataset.get_all_derivative_pipelines()
-        assert len(pipelines) == 0
+        assert pipelines == []
 
 
+@pytest.mark.integration
 class TestSubjectDerivativeMethods:
     """Test BIDSSubject methods for derivatives."""
     
-    def test_get_derivative(self, mock_derivatives_dataset):
+    def test_get_derivative(self, loaded_derivatives_dataset):
         """Test getting a specific derivative by name."""
-        loader = BidsLoader(mock_derivatives_dataset)
-        dataset = loader.load()
+        dataset = loaded_derivatives_dataset
         
-        subject = dataset.get_subject("01")
-        assert subject is not None
-        pipeline1 = subject.get_derivative("pipeline1")
+        subject = _require_subject(dataset, "01")
+        pipeline1 = _require_pipeline(subject, "pipeline1")
         
-        assert pipeline1 is not None
         assert pipeline1.pipeline_name == "pipeline1"
     
-    def test_get_derivative_not_found(self, mock_derivatives_dataset):
+    def test_get_derivative_not_found(self, loaded_derivatives_dataset):
         """Test getting a non-existent derivative returns None."""
-        loader = BidsLoader(mock_derivatives_dataset)
-        dataset = loader.load()
+        dataset = loaded_derivatives_dataset
         
-        subject = dataset.get_subject("01")
-        assert subject is not None
+        subject = _require_subject(dataset, "01")
         nonexistent = subject.get_derivative("nonexistent_pipeline")
         
         assert nonexistent is None
     
-    def test_derivatives_field(self, mock_derivatives_dataset):
+    def test_derivatives_field(self, loaded_derivatives_dataset):
         """Test that derivatives field is properly populated."""
-        loader = BidsLoader(mock_derivatives_dataset)
-        dataset = loader.load()
+        dataset = loaded_derivatives_dataset
         
-        subject = dataset.get_subject("01")
-        assert subject is not None
+        subject = _require_subject(dataset, "01")
         
         assert hasattr(subject, 'derivatives')
         assert isinstance(subject.derivatives, list)
@@ -418,124 +412,81 @@ class TestSubjectDerivativeMethods:
         assert all(isinstance(d, BIDSDerivative) for d in subject.derivatives)
 
 
+@pytest.mark.integration
 class TestDerivativeEntityExtraction:
     """Test entity extraction from derivative files."""
     
-    def test_space_entity(self, mock_derivatives_dataset):
+    def test_space_entity(self, loaded_derivatives_dataset):
         """Test that space entity is extracted correctly."""
-        loader = BidsLoader(mock_derivatives_dataset)
-        dataset = loader.load()
+        dataset = loaded_derivatives_dataset
         
-        subject = dataset.get_subject("01")
-        assert subject is not None
-        pipeline1 = subject.get_derivative("pipeline1")
-        assert pipeline1 is not None
+        subject = _require_subject(dataset, "01")
+        pipeline1 = _require_pipeline(subject, "pipeline1")
         
         session = pipeline1.sessions[0]
-        space_files = [f for f in session.files if "space" in f.entities]
+        space_files = session.get_files_with_entity("space")
         
         assert len(space_files) > 0
         assert space_files[0].entities["space"] == "MNI"
     
-    def test_desc_entity(self, mock_derivatives_dataset):
+    def test_desc_entity(self, loaded_derivatives_dataset):
         """Test that desc entity is extracted correctly."""
-        loader = BidsLoader(mock_derivatives_dataset)
-        dataset = loader.load()
+        dataset = loaded_derivatives_dataset
         
-        subject = dataset.get_subject("01")
-        assert subject is not None
-        pipeline2 = subject.get_derivative("pipeline2")
-        assert pipeline2 is not None
+        subject = _require_subject(dataset, "01")
+        pipeline2 = _require_pipeline(subject, "pipeline2")
         
         session = pipeline2.sessions[0]
-        desc_files = [f for f in session.files if "desc" in f.entities]
+        desc_files = session.get_files_with_entity("desc")
         
         assert len(desc_files) > 0
         assert desc_files[0].entities["desc"] == "preproc"
 
 
+@pytest.mark.integration
 class TestDerivativeEdgeCases:
     """Test edge cases and error handling for derivatives."""
     
-    def test_missing_pipeline_description(self, tmp_path):
+    def test_missing_pipeline_description(self, fake_root):
         """Test handling of missing dataset_description.json in pipeline."""
-        dataset_root = tmp_path / "missing_desc"
-        dataset_root.mkdir()
-        
-        # Minimal dataset
-        desc = {"Name": "Test", "BIDSVersion": "1.8.0"}
-        with open(dataset_root / "dataset_description.json", "w") as f:
-            json.dump(desc, f)
-        
-        # Raw data
-        anat_dir = dataset_root / "sub-01" / "anat"
-        anat_dir.mkdir(parents=True)
-        (anat_dir / "sub-01_T1w.nii.gz").write_text("data")
-        
         # Derivative without dataset_description.json
-        deriv_anat = dataset_root / "derivatives" / "pipeline1" / "sub-01" / "anat"
-        deriv_anat.mkdir(parents=True)
-        (deriv_anat / "sub-01_space-MNI_T1w.nii.gz").write_text("normalized")
+        dataset_root = _minimal_dataset(fake_root / "missing_desc", {
+            "derivatives/pipeline1/sub-01/anat/sub-01_space-MNI_T1w.nii.gz": "normalized",
+        })
         
         # Should load without errors
         loader = BidsLoader(dataset_root)
         dataset = loader.load()
         
-        subject = dataset.get_subject("01")
-        assert subject is not None
-        pipeline = subject.get_derivative("pipeline1")
+        subject = _require_subject(dataset, "01")
+        pipeline = _require_pipeline(subject, "pipeline1")
         
-        assert pipeline is not None
         assert pipeline.pipeline_description == {}
     
-    def test_empty_derivatives_folder(self, tmp_path):
+    def test_empty_derivatives_folder(self, fake_root):
         """Test handling of empty derivatives folder."""
-        dataset_root = tmp_path / "empty_deriv"
-        dataset_root.mkdir()
-        
-        desc = {"Name": "Test", "BIDSVersion": "1.8.0"}
-        with open(dataset_root / "dataset_description.json", "w") as f:
-            json.dump(desc, f)
-        
-        anat_dir = dataset_root / "sub-01" / "anat"
-        anat_dir.mkdir(parents=True)
-        (anat_dir / "sub-01_T1w.nii.gz").write_text("data")
-        
         # Create empty derivatives folder
-        (dataset_root / "derivatives").mkdir()
+        dataset_root = _minimal_dataset(fake_root / "empty_deriv", {"derivatives/": None})
         
         # Should load without errors
         loader = BidsLoader(dataset_root)
         dataset = loader.load()
         
-        subject = dataset.get_subject("01")
-        assert subject is not None
+        subject = _require_subject(dataset, "01")
         assert len(subject.derivatives) == 0
     
-    def test_malformed_derivative_structure(self, tmp_path):
+    def test_malformed_derivative_structure(self, fake_root):
         """Test handling of malformed derivative structure."""
-        dataset_root = tmp_path / "malformed"
-        dataset_root.mkdir()
-        
-        desc = {"Name": "Test", "BIDSVersion": "1.8.0"}
-        with open(dataset_root / "dataset_description.json", "w") as f:
-            json.dump(desc, f)
-        
-        anat_dir = dataset_root / "sub-01" / "anat"
-        anat_dir.mkdir(parents=True)
-        (anat_dir / "sub-01_T1w.nii.gz").write_text("data")
-        
-        # Create pipeline directory with files but no sub-XX structure
-        pipeline_dir = dataset_root / "derivatives" / "pipeline1"
-        pipeline_dir.mkdir(parents=True)
-        (pipeline_dir / "random_file.txt").write_text("random")
+        # Pipeline directory with files but no sub-XX structure
+        dataset_root = _minimal_dataset(fake_root / "malformed", {
+            "derivatives/pipeline1/random_file.txt": "random",
+        })
         
         # Should load without crashing
         loader = BidsLoader(dataset_root)
         dataset = loader.load()
         
-        subject = dataset.get_subject("01")
-        assert subject is not None
+        subject = _require_subject(dataset, "01")
         # Subject should have no derivatives since structure is wrong
         pipeline = subject.get_derivative("pipeline1")
         assert pipeline is None or len(pipeline.files) == 0
@@ -4,6 +4,8 @@ Tests for export functionality.
 Tests the core export logic, file generation, and entity matching.
 """
 
+import errno
+import os
 import pytest
 import json
 import shutil
@@ -266,6 +268,35 @@ class TestGenerateFileList:
         assert all("sub-01" in str(f) for f in files)
         assert not any("sub-02" in str(f) for f in files)
     
+    def test_generate_filtered_by_unknown_subject(self, loaded_dataset):
+        """Test that selected subjects missing from the dataset are ignored."""
+        selected = SelectedEntities(
+            entities={"sub": ["01", "99"]},
+            derivative_pipelines=[]
+        )
+        only_01 = SelectedEntities(
+            entities={"sub": ["01"]},
+            derivative_pipelines=[]
+        )
+        
+        files = generate_file_list(loaded_dataset, selected)
+        
+        assert len(files) > 0
+        assert files == generate_file_list(loaded_dataset, only_01)
+    
+    def test_generate_keeps_subject_selection_order(self, loaded_dataset):
+        """Test that files are listed subject by subject, in selection order."""
+        selected = SelectedEntities(
+            entities={"sub": ["02", "01", "02"]},
+            derivative_pipelines=[]
+        )
+        
+        files = generate_file_list(loaded_dataset, selected)
+        subjects = [f.relative_to(loaded_dataset.root_path).parts[0] for f in files]
+        
+        assert subjects == sorted(subjects, key=["sub-02", "sub-01"].index)
+        assert set(subjects) == {"sub-01", "sub-02"}
+    
     def test_generate_filtered_by_session(self, loaded_dataset):
         """Test filtering by session."""
         selected = SelectedEntities(
@@ -373,6 +404,72 @@ class TestCopyFileTree:
             rel_path = f.relative_to(source_root)
             dest_file = dest_root / rel_path
             assert dest_file.exists()
+    
+    def test_copy_reports_progress_in_order(self, tmp_path):
+        """Test that progress is reported once per copied file, in list order."""
+        source_root = tmp_path / "source"
+        files = [
+            source_root / f"sub-{i:02d}" / "anat" / f"sub-{i:02d}_T1w.nii.gz"
+            for i in range(1, 21)
+        ]
+        for f in files:
+            f.parent.mkdir(parents=True)
+            f.write_text(f.name)
+        
+        # A file outside the source root is skipped without progress
+        outside = tmp_path / "outside.txt"
+        outside.write_text("outside")
+        
+        progress = []
+        copy_file_tree(
+            files + [outside], source_root, tmp_path / "dest",
+            progress_callback=lambda current, total, path: progress.append((current, total, path))
+        )
+        
+        assert progress == [(i, 21, f) for i, f in enumerate(files, start=1)]
+        for f in files:
+            assert (tmp_path / "dest" / f.relative_to(source_root)).read_text() == f.name
+    
+    def test_copy_preserves_content_and_mtime(self, tmp_path):
+        """Test that copies match the source bytes and modification time."""
+        source_root = tmp_path / "source"
+        dest_root = tmp_path / "dest"
+        
+        source_file = source_root / "sub-01" / "anat" / "sub-01_T1w.nii.gz"
+        source_file.parent.mkdir(parents=True)
+        data = bytes(range(256)) * 4096
+        source_file.write_bytes(data)
+        os.utime(source_file, ns=(1_000_000_000, 1_000_000_000))
+        
+        # Copying over an existing file replaces it
+        dest_file = dest_root / "sub-01" / "anat" / "sub-01_T1w.nii.gz"
+        dest_file.parent.mkdir(parents=True)
+        dest_file.write_bytes(b"stale" * 1_000_000)
+        
+        copy_file_tree([source_file], source_root, dest_root)
+        
+        assert dest_file.read_bytes() == data
+        assert dest_file.stat().st_mtime_ns == 1_000_000_000
+    
+    def test_copy_falls_back_when_copy_file_range_unsupported(self, tmp_path, monkeypatch):
+        """Test that files are still copied when the kernel rejects copy_file_range."""
+        def unsupported(*args, **kwargs):
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+        monkeypatch.setattr(os, "copy_file_range", unsupported, raising=False)
+        
+        source_root = tmp_path / "source"
+        files = [
+            source_root / "sub-01" / "anat" / "sub-01_T1w.nii.gz",
+            source_root / "sub-02" / "anat" / "sub-02_T1w.nii.gz",
+        ]
+        for f in files:
+            f.parent.mkdir(parents=True)
+            f.write_text(f.name)
+        
+        copy_file_tree(files, source_root, tmp_path / "dest")
+        
+        for f in files:
+            assert (tmp_path / "dest" / f.relative_to(source_root)).read_text() == f.name
 
 
 class TestCreateParticipantsTsv:
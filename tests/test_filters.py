@@ -5,6 +5,7 @@ These tests verify the behavior of dataset filtering operations using the
 FilterCondition system with logical operations.
 """
 
+import copy
 import pytest
 from pathlib import Path
 
@@ -654,6 +655,32 @@ class TestLogicalOperation:
         restored = LogicalOperation.from_dict(data)
         assert restored.operator == original.operator
         assert len(restored.conditions) == 2
+    
+    def test_deepcopy(self):
+        """Test that deepcopy produces an independent, equal tree."""
+        inner = LogicalOperation(operator="OR", conditions=[ModalityFilter(modality="ieeg")])
+        original = LogicalOperation(
+            operator="AND",
+            conditions=[SubjectIdFilter(subject_id="01"), inner]
+        )
+        
+        cloned = copy.deepcopy(original)
+        assert cloned == original
+        assert cloned is not original
+        assert cloned.conditions[0] is not original.conditions[0]
+        assert cloned.conditions[1].conditions[0] is not inner.conditions[0]
+        
+        cloned.conditions[1].conditions[0].modality = "anat"
+        assert inner.conditions[0].modality == "ieeg"
+    
+    def test_instances_have_no_dict(self):
+        """Test that filter objects use slots instead of a per-instance __dict__."""
+        operation = LogicalOperation(conditions=[SubjectIdFilter(subject_id="01")])
+        
+        assert not hasattr(operation, '__dict__')
+        assert not hasattr(operation.conditions[0], '__dict__')
+        with pytest.raises(AttributeError):
+            operation.conditions[0].unknown_field = "x"
 
 
 # ============================================================================